@@ -1,22 +1,33 @@
 import json
 import uuid
 from copy import deepcopy
-from typing import Union, List, Any
+from typing import TYPE_CHECKING, Union, List, Any, Iterator, TextIO, Tuple
 from warnings import warn
 
-from pandas import DataFrame
-
 from canvasxpress.config.collection import CXConfigs
 from canvasxpress.config.type import CXConfig
 from canvasxpress.data.base import CXData
 from canvasxpress.data.convert import CXHtmlConvertable
 from canvasxpress.data.keypair import CXDictData
-from canvasxpress.data.matrix import CXDataframeData, merge_dataframes_into_xyz_object
 from canvasxpress.data.text import CXTextData
+from canvasxpress.data.transport import (
+    DECODER_JS,
+    TRANSPORT_JSON,
+    VALID_TRANSPORTS,
+    is_packed,
+    pack_data,
+)
 from canvasxpress.js.collection import CXEvents
 from canvasxpress.js.function import CXEvent
+from canvasxpress.util.fingerprint import fingerprint_values
+from canvasxpress.util.lazy import is_dataframe, is_dataframe_data
 from canvasxpress.util.template import render_from_template
 
+if TYPE_CHECKING:
+    from pandas import DataFrame
+
+    from canvasxpress.data.matrix import CXDataframeData
+
 # from deprecated import deprecated
 
 _DEFAULT_JS_URL: str = "https://www.canvasxpress.org/dist/canvasXpress.min.js"
@@ -51,12 +62,41 @@ The template for declaring a CanvasXpress Javascript object using data
 from the Python edition.
 """
 
+_CX_PACKED_JS_TEMPLATE = (
+    _CX_JS_TEMPLATE.split("var chart_@cx_target_id@", 1)[0] + """@cx_decoder@
+var chart_@cx_target_id@;
+window.cxUnpackData(@cx_json@).then((declaration) => {
+  chart_@cx_target_id@ = new CanvasXpress(declaration); @cx_functions@
+});
+"""
+)
+"""
+The template for declaring a CanvasXpress Javascript object whose data has been
+packed into typed arrays, which are restored before the object is created.
+"""
+
 _CX_LICENSE_TEMPLATE = "<script src='@cx_license@' type='text/javascript'></script>"
 """
 The template for declaring a CanvasXpress license file so that charts do 
 not create_element with unlicensed watermarks.
 """
 
+_CX_FX_TEMPLATE = """
+<script type="text/javascript">
+    @code@
+</script>
+"""
+"""
+The template used to embed the CanvasXpress declaration into a page when
+streamed by `write_html_parts`.
+"""
+
+_CX_STREAM_CHUNK_SIZE: int = 65536
+"""
+The approximate number of characters gathered before a streamed chunk is
+emitted by `iter_html_parts`.
+"""
+
 _CX_REPR_TEMPLATE = """CanvasXpress(
     render_to="@render_to@",
     data=@data@,
@@ -211,6 +251,132 @@ class CanvasXpress(CXHtmlConvertable):
             else:
                 self.__license_url = candidate
 
+    __data_transport: str = TRANSPORT_JSON
+    """
+    The form in which numeric data is embedded into HTML.
+    """
+
+    @property
+    def data_transport(self) -> str:
+        """
+        Indicates the form in which the numeric `y.data` matrix is embedded by
+        `render_to_html_parts` and the renderers built upon it.
+        :returns: `str` One of the `canvasxpress.data.transport` values
+            `TRANSPORT_JSON` (the default), `TRANSPORT_FLOAT64`, or
+            `TRANSPORT_FLOAT32`.
+        """
+        return self.__data_transport
+
+    @data_transport.setter
+    def data_transport(self, value: str) -> None:
+        """
+        Sets the form in which numeric data is embedded into HTML.  Typed-array
+        transports substantially reduce the size of pages bearing large
+        matrices, and are decoded in the browser before the chart is created.
+        Data that is not a rectangular numeric matrix is always embedded as
+        JSON.  Reproducible JSON is not affected.
+        :param value: `str`
+            One of `TRANSPORT_JSON`, `TRANSPORT_FLOAT64`, or
+            `TRANSPORT_FLOAT32`.  `None` restores `TRANSPORT_JSON`.
+        """
+        if value is None:
+            value = TRANSPORT_JSON
+
+        if value not in VALID_TRANSPORTS:
+            raise ValueError(f"data_transport must be one of {VALID_TRANSPORTS}.")
+
+        self.__data_transport = value
+
+    __compress_data: bool = False
+    """
+    Indicates if packed data is deflate compressed.
+    """
+
+    @property
+    def compress_data(self) -> bool:
+        """
+        Indicates if data packed according to `data_transport` is deflate
+        compressed, which requires a browser supporting `DecompressionStream`.
+        :returns: `bool`
+        """
+        return self.__compress_data
+
+    @compress_data.setter
+    def compress_data(self, value: bool) -> None:
+        """
+        Sets whether packed data is deflate compressed.  Has no effect if
+        `data_transport` is `TRANSPORT_JSON`.
+        :param value: `bool`
+        """
+        self.__compress_data = bool(value)
+
+    __point_budget: Union[int, None] = None
+    """
+    The approximate number of data points to provide to the browser.
+    """
+
+    @property
+    def point_budget(self) -> Union[int, None]:
+        """
+        Indicates the approximate number of data points provided by
+        `provide_data_object` for rendering, or `None` if the data is provided
+        in full.
+        :returns: `Union[int, None]`
+        """
+        return self.__point_budget
+
+    @point_budget.setter
+    def point_budget(self, value: Union[int, None]) -> None:
+        """
+        Sets the approximate number of data points provided for rendering.
+        Larger data is decimated according to the `graphType`: Line, Area and
+        DotLine charts use LTTB downsampling, Scatter2D and ScatterBubble2D
+        charts use grid binning, and other charts are sampled.  See
+        `canvasxpress.data.decimate` for registering other decimators.  The
+        `data` property is not modified.
+        :param value: `Union[int, None]`
+            A positive `int`, or `None` to provide all data.
+        """
+        if value is None:
+            self.__point_budget = None
+
+        elif not isinstance(value, int) or isinstance(value, bool):
+            raise TypeError("point_budget must be an int or None.")
+
+        elif value < 1:
+            raise ValueError("point_budget must be at least 1.")
+
+        else:
+            self.__point_budget = value
+
+    __precluster: bool = False
+    """
+    Indicates if Heatmap clustering is computed in Python.
+    """
+
+    @property
+    def precluster(self) -> bool:
+        """
+        Indicates if Heatmap clustering requested via `samplesClustered` or
+        `variablesClustered` is computed in Python rather than in the browser.
+        :returns: `bool`
+        """
+        return self.__precluster
+
+    @precluster.setter
+    def precluster(self, value: bool) -> None:
+        """
+        Sets if Heatmap clustering is computed in Python.  The data provided to
+        the browser is then reordered to the dendrogram leaf order and bears
+        the dendrograms as Newick trees, and the browser only draws them.
+        Clustering results are cached by data fingerprint.  See
+        `canvasxpress.data.cluster` for the supported `distance` and `linkage`
+        options; other options continue to be clustered in the browser.
+        :param value: `bool`
+            `True` to cluster in Python.
+        """
+        self.__precluster = bool(value)
+
     __cdn_edition: Union[str, None] = None
     """
     The edition of CanvasXpress to use.  None indicates that the latest edition available shall be used.
@@ -398,14 +564,17 @@ class CanvasXpress(CXHtmlConvertable):
         return self.__data
 
     @data.setter
-    def data(self, value: Union[CXData, dict, DataFrame, str, None]) -> None:
+    def data(self, value: Union[CXData, dict, "DataFrame", str, None]) -> None:
         """
         Sets the CXData associated with this CanvasXpress chart.
         :param value: `Union[CXData, dict, DataFrame, str, None]`
             An object translatable into a CXData type. If the object is an
             instance of CXData then it will be tracked by the CanvasXpress
             object; otherwise, a new CXData object will be created to manage
-            the content.
+            the content.  A `dict` is shared rather than copied until the
+            chart's data is modified (see `CXDictData.copy`), so it should not
+            be changed by the caller afterwards; assign `CXDictData(value)`
+            for an isolated copy.
         """
         if value is None or isinstance(value, bool):
             self.__data = CXDictData()
@@ -414,10 +583,15 @@ class CanvasXpress(CXHtmlConvertable):
             self.__data = value
 
         elif isinstance(value, dict):
-            self.__data = CXDictData(value)
+            # The chart owns the wrapper, so the dict is copied only if the
+            # chart's data is modified rather than on assignment and render
+            self.__data = CXDictData(value, copy=False)
 
-        elif isinstance(value, DataFrame):
-            self.__data = CXDataframeData(value)
+        elif is_dataframe(value):
+            from canvasxpress.data.matrix import CXDataframeData, copy_on_write_active
+
+            # Copy-on-Write isolates the chart from the caller without a copy
+            self.__data = CXDataframeData(value, copy=not copy_on_write_active())
 
         elif isinstance(value, str):
             self.__data = CXTextData(value)
@@ -441,7 +615,9 @@ class CanvasXpress(CXHtmlConvertable):
         return self.__sample_annotation
 
     @sample_annotation.setter
-    def sample_annotation(self, value: Union[CXDataframeData, DataFrame, None]) -> None:
+    def sample_annotation(
+        self, value: Union["CXDataframeData", "DataFrame", None]
+    ) -> None:
         """
         Sets the CXData associated with this CanvasXpress chart.
         :param value: `Union[CXData, dict, DataFrame, str, None]`
@@ -450,7 +626,7 @@ class CanvasXpress(CXHtmlConvertable):
             object; otherwise, a new CXData object will be created to manage
             the content.
         """
-        if value is not None and not isinstance(self.data, CXDataframeData):
+        if value is not None and not is_dataframe_data(self.data):
             raise ValueError(
                 "The data property must be a DataFrame before this property can be set."
             )
@@ -458,12 +634,14 @@ class CanvasXpress(CXHtmlConvertable):
         elif value is None or isinstance(value, bool):
             self.__sample_annotation = None
 
-        elif isinstance(value, DataFrame):
-            self.__sample_annotation = CXDataframeData(value)
+        elif is_dataframe(value):
+            from canvasxpress.data.matrix import CXDataframeData
 
-        elif isinstance(value, CXDataframeData):
             self.__sample_annotation = CXDataframeData(value)
 
+        elif is_dataframe_data(value):
+            self.__sample_annotation = value
+
         else:
             raise TypeError("data must be of type CXDataframeData,  DataFrame, or None")
 
@@ -482,7 +660,7 @@ class CanvasXpress(CXHtmlConvertable):
 
     @variable_annotation.setter
     def variable_annotation(
-        self, value: Union[CXDataframeData, DataFrame, None]
+        self, value: Union["CXDataframeData", "DataFrame", None]
     ) -> None:
         """
         Sets the CXData associated with this CanvasXpress chart.
@@ -492,7 +670,7 @@ class CanvasXpress(CXHtmlConvertable):
             object; otherwise, a new CXData object will be created to manage
             the content.
         """
-        if value is not None and not isinstance(self.data, CXDataframeData):
+        if value is not None and not is_dataframe_data(self.data):
             raise ValueError(
                 "The data property must be a DataFrame before this property can be set."
             )
@@ -500,12 +678,14 @@ class CanvasXpress(CXHtmlConvertable):
         elif value is None or isinstance(value, bool):
             self.__variable_annotation = None
 
-        elif isinstance(value, DataFrame):
-            self.__variable_annotation = CXDataframeData(value)
+        elif is_dataframe(value):
+            from canvasxpress.data.matrix import CXDataframeData
 
-        elif isinstance(value, CXDataframeData):
             self.__variable_annotation = CXDataframeData(value)
 
+        elif is_dataframe_data(value):
+            self.__variable_annotation = value
+
         else:
             raise TypeError("data must be of type CXDataframeData,  DataFrame, or None")
 
@@ -797,9 +977,9 @@ class CanvasXpress(CXHtmlConvertable):
     def __init__(
         self,
         render_to: str = None,
-        data: Union[CXData, dict, DataFrame, str, None] = None,
-        sample_annotation: Union[CXDataframeData, DataFrame, None] = None,
-        variable_annotation: Union[CXDataframeData, DataFrame, None] = None,
+        data: Union[CXData, dict, "DataFrame", str, None] = None,
+        sample_annotation: Union["CXDataframeData", "DataFrame", None] = None,
+        variable_annotation: Union["CXDataframeData", "DataFrame", None] = None,
         events: Union[List[CXEvent], CXEvents] = None,
         config: Union[List[CXConfig], List[tuple], dict, CXConfigs] = None,
         after_render: Union[List[CXConfig], List[tuple], dict, CXConfigs] = None,
@@ -847,7 +1027,7 @@ class CanvasXpress(CXHtmlConvertable):
                 "dict, CXConfigs]"
             )
 
-        existing_config_labels = [item.label for item in config_updated.configs]
+        existing_config_labels = {item.label for item in config_updated.configs}
 
         for key, value in kwargs.items():
             if key == "renderTo":
@@ -879,18 +1059,121 @@ class CanvasXpress(CXHtmlConvertable):
         self.width = width
         self.height = height
 
+    def data_fingerprint(self) -> str:
+        """
+        Provides a stable content fingerprint of the chart data, which covers
+        the data, annotations and the options that shape how the data is
+        rendered, but not the config.  Renderers can use it to establish that
+        the data of a chart is unchanged without rendering the data.  See
+        `fingerprint`.
+        :returns: `str`
+            The hexadecimal digest.
+        """
+        if is_dataframe_data(self.data):
+            data = [
+                annotation.dataframe if annotation is not None else None
+                for annotation in [
+                    self.data,
+                    self.sample_annotation,
+                    self.variable_annotation,
+                ]
+            ]
+
+        elif isinstance(self.data, CXDictData):
+            data = self.data.view
+
+        else:
+            data = self.data.render_to_dict()
+
+        return fingerprint_values(
+            type(self.data).__name__,
+            data,
+            [
+                self.point_budget,
+                self.precluster,
+                self.data_transport,
+                self.compress_data,
+            ],
+        )
+
+    def fingerprint(self) -> str:
+        """
+        Provides a stable content fingerprint of the chart, so that callers
+        can cheaply establish whether a chart is unchanged, such as for keying
+        caches.  The BLAKE2 digest covers the data, annotations, config,
+        after-render functions, events, other init params, dimensions and
+        rendering options, and the `render_to` ID unless the chart is
+        anonymous.  `dict` key order does not matter, and `DataFrame` data is
+        hashed from its buffers without conversion into JSON or Python objects.
+        :returns: `str`
+            The hexadecimal digest.
+        """
+        return fingerprint_values(
+            None if self.anonymous else self.render_to,
+            self.data_fingerprint(),
+            self.config.render_to_dict(),
+            self.after_render.render_to_list(),
+            self.events.render_to_js(),
+            self.other_init_params.render_to_dict(),
+            [self.width, self.height],
+        )
+
     def provide_data_object(self) -> CXData:
-        if isinstance(self.data, CXDataframeData):
-            return CXDictData(
+        if is_dataframe_data(self.data):
+            from canvasxpress.data.matrix import merge_dataframes_into_xyz_object
+
+            subset = None
+            if self.point_budget is not None:
+                from canvasxpress.data.decimate import decimate_dataframe
+
+                # Decimate before the frame is converted into Python objects
+                frame = decimate_dataframe(
+                    self.data.dataframe, self.config.render_to_dict(), self.point_budget
+                )
+                if frame is not self.data.dataframe:
+                    subset = frame
+
+            data_object = CXDictData(
                 merge_dataframes_into_xyz_object(
                     self.data,
                     self.sample_annotation,
                     self.variable_annotation,
-                )
+                    subset=subset,
+                ),
+                copy=False,
             )
 
         else:
-            return self.data
+            data_object = self.data
+
+        if self.point_budget is None or not isinstance(data_object, CXDictData):
+            return data_object
+
+        from canvasxpress.data.decimate import decimate_data
+
+        data = data_object.render_to_dict()
+        decimated = decimate_data(data, self.config.render_to_dict(), self.point_budget)
+        if decimated is data:
+            return data_object
+
+        return CXDictData(decimated, copy=False)
+
+    def __provide_render_dicts(self) -> Tuple[dict, dict]:
+        """
+        Provides the data and configuration used for rendering, applying
+        Heatmap clustering if `precluster` is set.
+        :returns: `Tuple[dict, dict]`
+            The data and configuration.
+        """
+        data = self.provide_data_object().render_to_dict()
+        config = self.config.render_to_dict()
+
+        if self.precluster:
+            from canvasxpress.data.cluster import cluster_data
+
+            data, config = cluster_data(data, config)
+
+        return data, config
 
     def prepare_html_element_parts(self) -> dict:
         """
@@ -906,10 +1189,11 @@ class CanvasXpress(CXHtmlConvertable):
         :returns: `dict` A map of values in anticipation of further conversion
             into html or a renderable.
         """
+        data, config = self.__provide_render_dicts()
         cx_element_params = {
             "renderTo": self.render_to,
-            "data": self.provide_data_object().render_to_dict(),
-            "config": self.config.render_to_dict(),
+            "data": data,
+            "config": config,
             "afterRender": self.after_render.render_to_list(),
             "otherParams": self.other_init_params.render_to_dict(),
             "events": "js_events",
@@ -1013,25 +1297,133 @@ class CanvasXpress(CXHtmlConvertable):
             `True`.  If `False` then no change to the data profile will be made
             if a profile is already associated with the data object.
         """
+        context = self.__prepare_html_context()
+        js_head, js_tail = context["cx_js_template"]
+
+        cx_js = "".join(
+            [
+                js_head,
+                context["substitute"](json.dumps(context["canvasxpress"])),
+                js_tail,
+            ]
+        )
+
+        cx_web_data = dict()
+        cx_web_data["cx_js"] = cx_js
+        cx_web_data["cx_canvas"] = context["cx_canvas"]
+        if self.license_available:
+            cx_web_data["cx_license"] = context["cx_license"]
+
+        return cx_web_data
+
+    def iter_html_parts(
+        self, chunk_size: int = _CX_STREAM_CHUNK_SIZE
+    ) -> Iterator[Tuple[str, str]]:
+        """
+        Streams the same content as `render_to_html_parts` as a series of
+        `(key, text)` chunks so that large charts can be written without
+        holding the complete JSON text in memory.  Joining the text of every
+        chunk sharing a key produces the value `render_to_html_parts` provides
+        for that key.
+
+        Chunks are provided in page order: `cx_license` (only if a license is
+        available), then `cx_canvas`, and then `cx_js`.
+
+        :param chunk_size: `int`
+            Defaults to `65536`.  The approximate number of characters
+            gathered before a `cx_js` chunk is provided.
+        :returns: `Iterator[Tuple[str, str]]`
+            The part key and a fragment of its text.
+        """
+        context = self.__prepare_html_context()
+        js_head, js_tail = context["cx_js_template"]
+        substitute = context["substitute"]
+
+        if self.license_available:
+            yield "cx_license", context["cx_license"]
+
+        yield "cx_canvas", context["cx_canvas"]
+
+        buffer = [js_head]
+        buffer_size = len(js_head)
+        for fragment in _iter_json_fragments(context["canvasxpress"]):
+            fragment = substitute(fragment)
+            buffer.append(fragment)
+            buffer_size += len(fragment)
+            if buffer_size >= chunk_size:
+                yield "cx_js", "".join(buffer)
+                buffer = []
+                buffer_size = 0
+
+        buffer.append(js_tail)
+        yield "cx_js", "".join(buffer)
+
+    def write_html_parts(
+        self, fp: TextIO, chunk_size: int = _CX_STREAM_CHUNK_SIZE
+    ) -> None:
+        """
+        Writes the license script (if any), the `<canvas>` element, and the
+        chart declaration wrapped in a `<script>` element to `fp` as they are
+        produced.  Peak memory stays close to a single copy of the chart data,
+        which makes this suitable for large charts written to files or WSGI
+        responses.
+
+        ```python
+        with open("chart.html", "w") as chart_file:
+            chart.write_html_parts(chart_file)
+        ```
+
+        :param fp: `TextIO`
+            Any object with a `write(str)` method.
+        :param chunk_size: `int`
+            Defaults to `65536`.  See `iter_html_parts`.
+        """
+        script_head, script_tail = _CX_FX_TEMPLATE.split("@code@")
+
+        script_started = False
+        for key, text in self.iter_html_parts(chunk_size=chunk_size):
+            if key == "cx_js" and not script_started:
+                fp.write(script_head)
+                script_started = True
+            fp.write(text)
+
+        fp.write(script_tail)
+
+    def __prepare_html_context(self) -> dict:
+        """
+        Prepares the values shared by `render_to_html_parts` and
+        `iter_html_parts` so that both produce identical text.
+        :returns: `dict`
+            The chart declaration `dict`, the JS template split around the
+            JSON payload, the text substitution applied to the JSON payload,
+            and the canvas and license elements.
+        """
         #  Capture the ID once to avoid anonymous object calls producing different IDs.
         render_id = self.render_to
 
-        formatted_data = self.provide_data_object().render_to_dict()
+        formatted_data, config = self.__provide_render_dicts()
 
         if len(formatted_data) == 0:
             formatted_data = "false"
 
         if isinstance(formatted_data, dict):
+            # Shallow copy as shared data objects provide their own dict
+            formatted_data = dict(formatted_data)
+
             if "x" not in formatted_data.keys():
                 formatted_data["x"] = None
 
             if "z" not in formatted_data.keys():
                 formatted_data["z"] = None
 
+        formatted_data = pack_data(
+            formatted_data, self.data_transport, self.compress_data
+        )
+
         primary_params = {
             "renderTo": render_id,
             "data": formatted_data,
-            "config": self.config.render_to_dict(),
+            "config": config,
             "events": "js_events",
         }
         secondary_params = self.other_init_params.render_to_dict()
@@ -1047,19 +1439,27 @@ class CanvasXpress(CXHtmlConvertable):
         if canvasxpress["data"] != "false" and canvasxpress["data"].get("raw"):
             canvasxpress["data"] = str(canvasxpress["data"]["raw"])
 
-        cx_js = render_from_template(
-            _CX_JS_TEMPLATE,
+        cx_functions = "\n" + "; ".join(after_render_functions) + ";\n"
+        cx_events = self.events.render_to_js()
+
+        def substitute(text: str) -> str:
+            # Mirrors the template placeholders and event marker applied to the
+            # complete declaration, in the same order.
+            return text.replace("@cx_functions@", cx_functions).replace(
+                '"js_events"', cx_events
+            )
+
+        js_template = _CX_JS_TEMPLATE
+        if is_packed(canvasxpress["data"]):
+            js_template = _CX_PACKED_JS_TEMPLATE
+
+        js_head, js_tail = render_from_template(
+            js_template,
             {
                 "cx_target_id": render_id,
-                "cx_json": json.dumps(canvasxpress),
-                "cx_functions": "\n" + "; ".join(after_render_functions) + ";\n",
+                "cx_decoder": DECODER_JS,
             },
-        )
-
-        cx_js = cx_js.replace(
-            '"js_events"',
-            self.events.render_to_js(),
-        )
+        ).split("@cx_json@", 1)
 
         canvas_configs = CXConfigs(
             {
@@ -1083,13 +1483,13 @@ class CanvasXpress(CXHtmlConvertable):
             _CX_LICENSE_TEMPLATE, {"cx_license": self.license_url}
         )
 
-        cx_web_data = dict()
-        cx_web_data["cx_js"] = cx_js
-        cx_web_data["cx_canvas"] = cx_canvas
-        if self.license_available:
-            cx_web_data["cx_license"] = cx_license
-
-        return cx_web_data
+        return {
+            "canvasxpress": canvasxpress,
+            "cx_js_template": (substitute(js_head), substitute(js_tail)),
+            "substitute": substitute,
+            "cx_canvas": cx_canvas,
+            "cx_license": cx_license,
+        }
 
     def __str__(self) -> str:
         """
@@ -1125,7 +1525,7 @@ class CanvasXpress(CXHtmlConvertable):
         str_data_parts = str_data.split("\n")
         str_data = "\n".join(["    " + line for line in str_data_parts])[4:]
 
-        str_config = json.dumps(self.config.render_to_dict())
+        str_config = str(self.config)
         str_config_parts = str_config.split("\n")
         str_config = "\n".join(["    " + line for line in str_config_parts])[4:]
 
@@ -1158,3 +1558,41 @@ class CanvasXpress(CXHtmlConvertable):
         )
 
         return repr_str
+
+
+def _iter_json_fragments(value: Any) -> Iterator[str]:
+    """
+    Encodes `value` as a series of JSON text fragments that, once joined, are
+    identical to `json.dumps(value)`.  Containers holding other containers are
+    walked so that no single fragment holds more than one nested member, while
+    containers of scalars (such as a row of a data matrix) are encoded in one
+    step.
+    :param value: `Any`
+        A JSON serializable value.
+    :returns: `Iterator[str]`
+        The JSON text fragments.
+    """
+    if isinstance(value, dict) and value:
+        if not all(isinstance(key, str) for key in value.keys()):
+            yield json.dumps(value)
+            return
+
+        separator = "{"
+        for key, member in value.items():
+            yield separator + json.dumps(key) + ": "
+            yield from _iter_json_fragments(member)
+            separator = ", "
+        yield "}"
+
+    elif isinstance(value, (list, tuple)) and any(
+        isinstance(member, (dict, list, tuple)) for member in value
+    ):
+        separator = "["
+        for member in value:
+            yield separator
+            yield from _iter_json_fragments(member)
+            separator = ", "
+        yield "]"
+
+    else:
+        yield json.dumps(value)
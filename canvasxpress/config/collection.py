@@ -1,7 +1,7 @@
 import json
 from copy import deepcopy
 from functools import total_ordering
-from typing import List, Any, Union
+from typing import Callable, Dict, List, Any, Union
 
 from canvasxpress.config.type import (
     CXConfig,
@@ -15,6 +15,76 @@ from canvasxpress.config.type import (
     CXGraphWeight,
 )
 from canvasxpress.data.convert import CXDictConvertable, CXListConvertable
+from canvasxpress.util.fingerprint import content_hash
+
+
+class _CXConfigList(list):
+    """
+    The list provided by `CXConfigs.configs`.  Changes made to the list are
+    written through to the `CXConfigs` object that provided it.
+    """
+
+    def __init__(self, configs, on_change: Callable[[], None]):
+        """
+        Initializes a new list.
+        :param configs: `Iterable[CXConfig]`
+            The initial contents.
+        :param on_change: `Callable[[], None]`
+            Called after each change to the list.
+        """
+        super().__init__(configs)
+        self.__on_change = on_change
+
+    def append(self, config) -> None:
+        super().append(config)
+        self.__on_change()
+
+    def extend(self, configs) -> None:
+        super().extend(configs)
+        self.__on_change()
+
+    def insert(self, index, config) -> None:
+        super().insert(index, config)
+        self.__on_change()
+
+    def remove(self, config) -> None:
+        super().remove(config)
+        self.__on_change()
+
+    def pop(self, index=-1):
+        config = super().pop(index)
+        self.__on_change()
+        return config
+
+    def clear(self) -> None:
+        super().clear()
+        self.__on_change()
+
+    def sort(self, *args, **kwargs) -> None:
+        super().sort(*args, **kwargs)
+        self.__on_change()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self.__on_change()
+
+    def __setitem__(self, index, value) -> None:
+        super().__setitem__(index, value)
+        self.__on_change()
+
+    def __delitem__(self, index) -> None:
+        super().__delitem__(index)
+        self.__on_change()
+
+    def __iadd__(self, configs) -> "_CXConfigList":
+        super().__iadd__(configs)
+        self.__on_change()
+        return self
+
+    def __imul__(self, count) -> "_CXConfigList":
+        super().__imul__(count)
+        self.__on_change()
+        return self
 
 
 @total_ordering
@@ -23,9 +93,31 @@ class CXConfigs(CXDictConvertable, CXListConvertable):
     CXConfigs provides support for addressing a collection of `CXConfig` values.
     """
 
-    __configs: List[CXConfig] = None
+    __configs: Dict[str, CXConfig] = None
+    """
+    The `CXConfig` objects associated with this collection, indexed by label in
+    order of insertion.
+    """
+
+    __configs_list: _CXConfigList = None
+    """
+    The list provided by `configs`, once requested, which is kept in step with
+    the collection.
+    """
+
+    __version: int = 0
+    """
+    Counts the additions and removals of `CXConfig` objects.
+    """
+
+    __rendered: tuple = None
+    """
+    The version key and `dict` form of the last render.
+    """
+
+    __rendered_json: str = None
     """
-    The `CXConfig` objects associated with this collection.
+    The JSON form of the last render, if requested.
     """
 
     def __init__(self, *configs: Union[CXConfig, tuple, dict, list]):
@@ -45,7 +137,7 @@ class CXConfigs(CXDictConvertable, CXListConvertable):
         :param configs: `Union[CXConfig, tuple, dict], ...`
             A list of zero or more `CXConfig` objects to associate.
         """
-        self.__configs: List[CXConfig] = list()
+        self.__configs: Dict[str, CXConfig] = dict()
         for config in configs:
             self.add(config)
 
@@ -58,12 +150,15 @@ class CXConfigs(CXDictConvertable, CXListConvertable):
         :returns: `Union[CXConfig, None]`
             If a CXConfig is removed then it is returned, otherwise None.
         """
-        candidate = None
-        for config in self.configs:
-            if str(label) == config.label:
-                candidate = config
-                self.configs.remove(config)
-                break
+        candidate = self.__configs.pop(str(label), None)
+        if candidate is not None:
+            self.__version += 1
+
+            if self.__configs_list is not None:
+                for index, config in enumerate(self.__configs_list):
+                    if config is candidate:
+                        list.__delitem__(self.__configs_list, index)
+                        break
 
         return candidate
 
@@ -85,7 +180,9 @@ class CXConfigs(CXDictConvertable, CXListConvertable):
             The `CXConfig` to associate.  Cannot be `None`.  `tuple` an d`list`
             config values are expected to be two elements in length, with the
             first representing the label and the second representing the value.
-            The label portion will be converted to a string using `str`.
+            The label portion will be converted to a string using `str`.  A
+            `CXConfig` replaces any associated `CXConfig` with the same label,
+            keeping its position in the collection.
         """
         if config is None:
             raise ValueError("configs cannot be None.")
@@ -111,8 +208,12 @@ class CXConfigs(CXDictConvertable, CXListConvertable):
                     self.set_param(str(config[0]), config[1])
 
         elif isinstance(config, CXConfig):
-            if config not in self.__configs:
-                self.__configs.append(config)
+            replaced = self.__configs.get(config.label)
+            self.__configs[config.label] = config
+            self.__version += 1
+
+            if self.__configs_list is not None:
+                self.__add_to_configs_list(config, replaced)
 
         else:
             raise TypeError("configs must be a type of CXConfig.")
@@ -127,13 +228,7 @@ class CXConfigs(CXDictConvertable, CXListConvertable):
         :returns: `Union[CXConfig, None]`
             The CXConfig or None if such a labelled item is not associated.
         """
-        candidate = None
-        for config in self.configs:
-            if config.label == label:
-                candidate = config
-                break
-
-        return candidate
+        return self.__configs.get(label)
 
     def set_param(self, label: str, value: Any) -> "CXConfigs":
         """
@@ -159,22 +254,19 @@ class CXConfigs(CXDictConvertable, CXListConvertable):
             raise ValueError("Label cannot be None.")
 
         else:
-            existing_config_used = False
-            for config in self.configs:
-                if config.label == label:
-                    if not isinstance(config.value, type(value)):
-                        raise ValueError(
-                            f"CXConfig {repr(config)} is already a member and"
-                            f" has a different type than what is provided."
-                            f" Remove the existing CXConfig object first or use"
-                            f" the same type."
-                        )
-                    else:
-                        config.value = value
-                        existing_config_used = True
-                        break
+            config = self.__configs.get(label)
+            if config is not None:
+                if not isinstance(config.value, type(value)):
+                    raise ValueError(
+                        f"CXConfig {repr(config)} is already a member and"
+                        f" has a different type than what is provided."
+                        f" Remove the existing CXConfig object first or use"
+                        f" the same type."
+                    )
+                else:
+                    config.value = value
 
-            if not existing_config_used:
+            else:
                 value_type = type(value)
                 if value is None:
                     candidate = CXNone(label, value)
@@ -201,13 +293,96 @@ class CXConfigs(CXDictConvertable, CXListConvertable):
 
             return self
 
+    def __add_to_configs_list(
+        self, config: CXConfig, replaced: Union[CXConfig, None]
+    ) -> None:
+        """
+        Updates the list provided by `configs` after a `CXConfig` is added.
+        :param config: `CXConfig`
+            The added object.
+        :param replaced: `Union[CXConfig, None]`
+            The object with the same label that was replaced, if any.
+        """
+        if replaced is not None:
+            for index, candidate in enumerate(self.__configs_list):
+                if candidate is replaced:
+                    list.__setitem__(self.__configs_list, index, config)
+                    return
+
+        list.append(self.__configs_list, config)
+
+    def __configs_list_changed(self) -> None:
+        """
+        Indexes the contents of the list provided by `configs` after it is
+        changed.  As when rendering, the last `CXConfig` with a label wins.
+        """
+        for config in self.__configs_list:
+            if not isinstance(config, CXConfig):
+                raise TypeError("configs must be a type of CXConfig.")
+
+        self.__configs = {config.label: config for config in self.__configs_list}
+        self.__version += 1
+
     @property
     def configs(self) -> List[CXConfig]:
         """
-        Provides access to the list of associated `CXConfig` objects.
+        Provides the list of the associated `CXConfig` objects in order of
+        insertion.  The same list is provided on each call, and changes to it
+        are applied to the collection.
         :returns: `List[CXConfig]`
         """
-        return self.__configs
+        if self.__configs_list is None:
+            self.__configs_list = _CXConfigList(
+                self.__configs.values(), self.__configs_list_changed
+            )
+
+        return self.__configs_list
+
+    @property
+    def version(self) -> Union[tuple, None]:
+        """
+        Provides a key that changes whenever a `CXConfig` is added, removed, or
+        has its value changed.  Used to reuse the results of previous renders.
+        `list` and `dict` values can be changed in place without an
+        assignment, so the key includes a content hash of each such value.
+        :returns: `Union[tuple, None]`
+            The key, or `None` if a `list` or `dict` value cannot be hashed, in
+            which case renders must not be reused.
+        """
+        config_versions = []
+        for config in self.__configs.values():
+            value = config.value
+            if isinstance(value, (list, dict)):
+                digest = content_hash(value)
+                if digest is None:
+                    return None
+
+                config_versions.append((config.version, digest))
+
+            else:
+                config_versions.append(config.version)
+
+        return self.__version, tuple(config_versions)
+
+    def __render(self) -> tuple:
+        """
+        Provides the `dict` form of the configuration values, reusing the
+        previous render if the collection is unchanged.
+        :returns: `tuple`
+            The version key of the render and the `dict` form.
+        """
+        version = self.version
+        if version is None or self.__rendered is None or self.__rendered[0] != version:
+            merged_configs = CXConfigs.merge_configs(self.__configs.values())
+
+            # Remove illegal options that cause crashes
+            if merged_configs.get("isHistogram") is not None:
+                del merged_configs["isHistogram"]
+
+            self.__rendered = (version, merged_configs)
+            self.__rendered_json = None
+
+        return self.__rendered
 
     def render_to_dict(self) -> dict:
         """
@@ -234,13 +409,8 @@ class CXConfigs(CXDictConvertable, CXListConvertable):
             }
             ```
         """
-        merged_configs = CXConfigs.merge_configs(self.configs)
-
-        # Remove illegal options that cause crashes
-        if merged_configs.get("isHistogram") is not None:
-            del merged_configs["isHistogram"]
-
-        return merged_configs
+        _, merged_configs = self.__render()
+        return dict(merged_configs)
 
     def render_to_list(self, **kwargs) -> list:
         """
@@ -281,15 +451,10 @@ class CXConfigs(CXDictConvertable, CXListConvertable):
         :returns: `dict`
             A dict of zero or more keys representing the CXConfigs.
         """
-        unique_configs = list()
+        dict_configs = dict()
         if not configs is None:
             for config in configs:
-                if not config in unique_configs:
-                    unique_configs.append(config)
-
-        dict_configs = dict()
-        for config in unique_configs:
-            dict_configs = {**dict_configs, **(config.render())}
+                dict_configs.update(config.render())
 
         return dict_configs
 
@@ -298,14 +463,14 @@ class CXConfigs(CXDictConvertable, CXListConvertable):
         *copy* constructor.  Returns the `CXConfig` objects within a new
         `CXConfigs` object.
         """
-        return CXConfigs(*self.configs)
+        return CXConfigs(*self.__configs.values())
 
     def __deepcopy__(self, memo) -> "CXConfigs":
         """
         *deepcopy* constructor.  Returns a deepcopy of the `CXConfig` objects
          within a new `CXConfigs` object.
         """
-        return CXConfigs(*([deepcopy(config) for config in self.configs]))
+        return CXConfigs(*([deepcopy(config) for config in self.__configs.values()]))
 
     def __lt__(self, other: "CXConfigs") -> bool:
         """
@@ -327,18 +492,18 @@ class CXConfigs(CXDictConvertable, CXListConvertable):
             return False
 
         else:
-            if (len(self.configs) + len(other.configs)) == 0:
+            if (len(self.__configs) + len(other.__configs)) == 0:
                 return False
 
-            if len(self.configs) == len(other.configs):
-                for config in self.configs:
-                    for oconfig in other.configs:
+            if len(self.__configs) == len(other.__configs):
+                for config in self.__configs.values():
+                    for oconfig in other.__configs.values():
                         if not config < oconfig:
                             return False
                 return True
 
             else:
-                return len(self.configs) < len(other.configs)
+                return len(self.__configs) < len(other.__configs)
 
     def __eq__(self, other: "CXConfigs") -> bool:
         """
@@ -360,8 +525,8 @@ class CXConfigs(CXDictConvertable, CXListConvertable):
             return False
 
         else:
-            if len(self.configs) == len(other.configs):
-                for config in self.configs:
+            if len(self.__configs) == len(other.__configs):
+                for config in self.__configs.values():
                     alt_config = other.get_param(config.label)
                     if alt_config is None:
                         return False
@@ -371,7 +536,7 @@ class CXConfigs(CXDictConvertable, CXListConvertable):
                 return True
 
             else:
-                return len(self.configs) == len(other.configs)
+                return len(self.__configs) == len(other.__configs)
 
     def __str__(self) -> str:
         """
@@ -380,7 +545,14 @@ class CXConfigs(CXDictConvertable, CXListConvertable):
         :returns" `str`
             JSON form of the collection.
         """
-        return json.dumps(self.render_to_dict())
+        version, merged_configs = self.__render()
+        if version is None:
+            return json.dumps(merged_configs)
+
+        if self.__rendered_json is None:
+            self.__rendered_json = json.dumps(merged_configs)
+
+        return self.__rendered_json
 
     def __repr__(self) -> str:
         """
@@ -388,6 +560,8 @@ class CXConfigs(CXDictConvertable, CXListConvertable):
         that can be used with `eval` to establish a copy of the object.
         :returns: `str` An evaluatable representation of the object.
         """
-        config_rep_list = ", ".join([repr(config) for config in self.configs])
+        config_rep_list = ", ".join(
+            [repr(config) for config in self.__configs.values()]
+        )
         rep_candidate = f"CXConfigs(" f"{config_rep_list}" f")"
         return rep_candidate
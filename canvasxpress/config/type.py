@@ -3,11 +3,51 @@ import json
 from abc import ABC, abstractmethod
 from copy import deepcopy
 from enum import Enum
-from functools import total_ordering
+from functools import total_ordering, wraps
 from typing import Union, Any
 
-from deepdiff import DeepDiff
-from deprecated import deprecated
+from canvasxpress.data.compare import count_key_changes, describe_differences
+
+
+def _deprecated(cls: type) -> type:
+    """
+    Marks a class as deprecated using the PEP 702 `__deprecated__` attribute.
+    As with the `@deprecated(action="ignore")` decorator this replaces, no
+    warning is issued on use, so the `Deprecated` package and its `wrapt`
+    dependency need not be imported with the config types.
+    :param cls: `type`
+        The class to mark.
+    :returns: `type`
+        The same class.
+    """
+    cls.__deprecated__ = f"{cls.__name__} is deprecated."
+    return cls
+
+
+def _hashable_form(value: Any) -> Any:
+    """
+    Provides a hashable equivalent of a configuration value, converting nested
+    `dict`, `list` and `set` values into immutable counterparts.
+    :param value: `Any`
+        The value to convert.
+    :returns: `Any`
+        A hashable object that is equal for equal values.
+    """
+    if isinstance(value, dict):
+        return frozenset((k, _hashable_form(v)) for k, v in value.items())
+
+    elif isinstance(value, (list, tuple)):
+        return tuple(_hashable_form(item) for item in value)
+
+    elif isinstance(value, (set, frozenset)):
+        return frozenset(_hashable_form(item) for item in value)
+
+    try:
+        hash(value)
+        return value
+
+    except TypeError:
+        return repr(value)
 
 
 @total_ordering
@@ -17,11 +57,42 @@ class CXConfig(ABC):
     customized rendering and interaction.
     """
 
-    __label: str = ""
+    __slots__ = ("__label", "__version", "__hash")
+
+    __label: str
     """
     The configuration object's label.
     """
 
+    __version: int
+    """
+    Counts the assignments made to the value of the configuration.
+    """
+
+    __hash: Union[int, None]
+    """
+    The hash of the label and value, computed when first requested.
+    """
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """
+        Wraps the `value` setter of each concrete class so that assignments
+        advance `version`.
+        """
+        super().__init_subclass__(**kwargs)
+
+        candidate = cls.__dict__.get("value")
+        if isinstance(candidate, property) and candidate.fset is not None:
+            assign = candidate.fset
+
+            @wraps(assign)
+            def versioned_assign(self, value: Any) -> None:
+                assign(self, value)
+                self.__version += 1
+                self.__hash = None
+
+            cls.value = candidate.setter(versioned_assign)
+
     @property
     def label(self) -> str:
         """
@@ -30,6 +101,17 @@ class CXConfig(ABC):
         """
         return self.__label
 
+    @property
+    def version(self) -> int:
+        """
+        Provides a counter that advances each time the value is assigned, for
+        use by collections that cache rendered configurations.  Changes made
+        within a mutable value, such as adding an item to a `CXList` value, are
+        not counted, so collections also compare the content of such values.
+        :returns: `int`
+        """
+        return self.__version
+
     @property
     @abstractmethod
     def value(self) -> Any:
@@ -76,6 +158,29 @@ class CXConfig(ABC):
         if label is None:
             raise ValueError("label cannot be None")
         self.__label = label
+        self.__version = 0
+        self.__hash = None
+
+    def __state(self) -> dict:
+        """
+        Provides the attributes of the object, whether held in slots or, for
+        subclasses that do not declare `__slots__`, in `__dict__`.
+        :returns: `dict`
+            The attribute values keyed by their mangled names.
+        """
+        state = dict(getattr(self, "__dict__", {}))
+        for cls in type(self).__mro__:
+            for name in cls.__dict__.get("__slots__", ()):
+                if name in ("__dict__", "__weakref__"):
+                    continue
+
+                if name.startswith("__") and not name.endswith("__"):
+                    name = f"_{cls.__name__.lstrip('_')}{name}"
+
+                if hasattr(self, name):
+                    state[name] = getattr(self, name)
+
+        return state
 
     def __copy__(self) -> "CXConfig":
         """
@@ -85,7 +190,8 @@ class CXConfig(ABC):
         """
         cls = self.__class__
         result = cls.__new__(cls)
-        result.__dict__.update(self.__dict__)
+        for k, v in self.__state().items():
+            setattr(result, k, v)
         return result
 
     def __deepcopy__(self, memo):
@@ -97,16 +203,21 @@ class CXConfig(ABC):
         cls = self.__class__
         result = cls.__new__(cls)
         memo[id(self)] = result
-        for k, v in self.__dict__.items():
+        for k, v in self.__state().items():
             setattr(result, k, deepcopy(v, memo))
         return result
 
     def __hash__(self) -> int:
         """
-        Provides a hash proxy for the object as converted into its `repr` form.
+        Provides a hash of the label and value.  The hash is computed once and
+        kept until the value is next assigned, so changes made within a mutable
+        value must be followed by an assignment of the value.
         :returns: `int`
         """
-        return hash(repr(self))
+        if self.__hash is None:
+            self.__hash = hash((self.label, _hashable_form(self.value)))
+
+        return self.__hash
 
     def __lt__(self, other: "CXConfig") -> bool:
         """
@@ -188,7 +299,9 @@ class CXString(CXConfig):
     A `CXConfig` object that manages `str` values.
     """
 
-    __value: str = ""
+    __slots__ = ("__value",)
+
+    __value: str
     """
     The managed value.
     """
@@ -226,7 +339,9 @@ class CXNone(CXConfig):
     A `CXConfig` object that manages `None` values.
     """
 
-    __value: Any = None
+    __slots__ = ("__value",)
+
+    __value: Any
     """
     The managed value.
     """
@@ -264,7 +379,9 @@ class CXBool(CXConfig):
     A `CXConfig` object that manages `bool` values.
     """
 
-    __value: bool = False
+    __slots__ = ("__value",)
+
+    __value: bool
     """
     The managed value.
     """
@@ -326,7 +443,9 @@ class CXFloat(CXConfig):
     A `CXConfig` object that manages `float` values.
     """
 
-    __value: float = 0.0
+    __slots__ = ("__value",)
+
+    __value: float
     """
     The managed value.
     """
@@ -366,7 +485,9 @@ class CXInt(CXConfig):
     A `CXConfig` object that manages `int` values.
     """
 
-    __value: int = 0
+    __slots__ = ("__value",)
+
+    __value: int
     """
     The managed value.
     """
@@ -406,7 +527,9 @@ class CXDict(CXConfig):
     A `CXConfig` object that manages `dict` values.
     """
 
-    __value: dict = dict()
+    __slots__ = ("__value",)
+
+    __value: dict
     """
     The managed value.
     """
@@ -478,11 +601,9 @@ class CXDict(CXConfig):
             return False
 
         else:
-            delta: dict = DeepDiff(self.value, other.value, ignore_order=True)
-            other_added: int = len(delta.get("dictionary_item_added", []))
-            other_removed: int = len(delta.get("dictionary_item_removed", []))
+            key_changes: int = count_key_changes(self.value, other.value)
 
-            if (other_added - other_removed) == 0:
+            if key_changes == 0:
                 for skey in self.value.keys():
                     if skey not in other.value.keys():
                         for okey in other.value.keys():
@@ -495,7 +616,9 @@ class CXDict(CXConfig):
                 return False
 
             else:
-                return (other_added - other_removed) > 0
+                return key_changes > 0
+
+    __hash__ = CXConfig.__hash__
 
     def __eq__(self, other: "CXDict") -> bool:
         """
@@ -507,7 +630,8 @@ class CXDict(CXConfig):
             <li> If `other` is `None` then `False`
             <li> If `other` is not a `CXDict` object then `False`
             <li> If `other` is a `CXDict` object then True if the label and
-                value parts are equal to that of self.
+                value parts are equal to that of self, as established by native
+                `dict` comparison which stops at the first difference found.
             </ul>
         """
         if other is None:
@@ -523,22 +647,19 @@ class CXDict(CXConfig):
             return False
 
         else:
-            delta: dict = DeepDiff(self.value, other.value, ignore_order=True)
-            other_added: int = len(delta.get("dictionary_item_added", []))
-            other_removed: int = len(delta.get("dictionary_item_removed", []))
+            return self.value is other.value or self.value == other.value
 
-            if (other_added - other_removed) == 0:
-                for skey in self.value.keys():
-                    if skey not in other.value.keys():
-                        return False
-
-                    elif self.value[skey] != other.value[skey]:
-                        return False
-
-                return True
-
-            else:
-                return False
+    def diff(self, other: "CXDict") -> dict:
+        """
+        Provides a detailed report of how the value of `other` differs from
+        that of `self`.  Requires the `deepdiff` package.
+        :param other: `CXDict`
+            The object to compare.
+        :returns: `dict`
+            The difference report, which is empty if the values are equivalent
+            irrespective of item order.
+        """
+        return describe_differences(self.value, other.value)
 
     def __repr__(self) -> str:
         """
@@ -554,7 +675,9 @@ class CXList(CXConfig):
     A `CXConfig` object that manages `list` values.
     """
 
-    __value: list = list()
+    __slots__ = ("__value",)
+
+    __value: list
     """
     The managed value.
     """
@@ -594,7 +717,9 @@ class CXGraphWeight(CXConfig):
     A `CXConfig` object that manages and normalizes `CXGraphWeight list` values.
     """
 
-    __value: list = list()
+    __slots__ = ("__value",)
+
+    __value: list
     """
     The managed value.
     """
@@ -668,12 +793,14 @@ class CXGraphWeight(CXConfig):
         self.value = value
 
 
-@deprecated(action="ignore")
+@_deprecated
 class CXRGBAColor(CXDict):
     """
     A `CXConfig` object that manages `str` Javascript rgba() values.
     """
 
+    __slots__ = ()
+
     @staticmethod
     def is_color_str(value: str):
         """
@@ -924,12 +1051,14 @@ class CXRGBAColor(CXDict):
         )
 
 
-@deprecated(action="ignore")
+@_deprecated
 class CXRGBColor(CXDict):
     """
     A `CXConfig` object that manages `str` Javascript rgb() values.
     """
 
+    __slots__ = ()
+
     @staticmethod
     def is_color_str(value: str):
         """
@@ -1220,6 +1349,8 @@ class CXGraphType(CXString):
     A CXString that is aware of CanvasXpress types of graphs, such as 'Bar'.
     """
 
+    __slots__ = ()
+
     CX_ATTRIBUTE = "graphType"
 
     @CXString.value.setter
@@ -0,0 +1,369 @@
+"""
+Computes Heatmap clustering in Python rather than in the browser.  When a
+Heatmap is configured with `samplesClustered` or `variablesClustered`,
+CanvasXpress clusters the data in the browser, which stalls the page for large
+matrices.  `cluster_data` performs the same hierarchical clustering with
+vectorized NumPy operations, reorders the chart data to the dendrogram leaf
+order and provides the dendrograms as Newick trees in the `t` member of the
+data, so that the browser only needs to draw them.
+
+Orderings are cached by a fingerprint of the matrix and the clustering
+options, so repeated renders of the same data do not cluster again.
+"""
+
+import hashlib
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, List, Tuple
+
+import numpy
+
+from canvasxpress.data.base import SMPS, VARS, Y
+from canvasxpress.data.decimate import numeric_matrix, subset_data
+
+DEFAULT_DISTANCE: str = "euclidian"
+"""
+The distance used if the configuration does not specify one.
+"""
+
+DEFAULT_LINKAGE: str = "single"
+"""
+The linkage used if the configuration does not specify one.
+"""
+
+VALID_DISTANCES: dict = {
+    "euclidian": "euclidian",
+    "euclidean": "euclidian",
+    "manhattan": "manhattan",
+    "max": "maximum",
+    "maximum": "maximum",
+}
+"""
+The supported `distance` configuration values and the metric each denotes.
+"""
+
+VALID_LINKAGES: list = ["single", "complete", "average"]
+"""
+The supported `linkage` configuration values.
+"""
+
+CLUSTER_CACHE_SIZE: int = 32
+"""
+The number of orderings retained by the cache.
+"""
+
+_AXES: list = [
+    # Configuration flag, data member, dendrogram flag, transpose
+    ("variablesClustered", VARS, "showVarDendrogram", False),
+    ("samplesClustered", SMPS, "showSmpDendrogram", True),
+]
+
+_BLOCK_VALUES: int = 2**22
+"""
+The number of differences computed at once for the non-euclidian distances.
+"""
+
+_NEWICK_RESERVED: frozenset = frozenset("()[]':;, \t\n")
+
+_cluster_cache: OrderedDict = OrderedDict()
+_cluster_cache_lock: Lock = Lock()
+
+
+def distance_matrix(matrix: numpy.ndarray, distance: str) -> numpy.ndarray:
+    """
+    Computes the pairwise distances between the rows of a matrix.
+    :param matrix: `numpy.ndarray`
+        The observations, one per row, without missing values.
+    :param distance: `str`
+        `euclidian`, `manhattan` or `maximum`.
+    :returns: `numpy.ndarray`
+        The square matrix of distances.
+    """
+    if distance == "euclidian":
+        squares = numpy.einsum("ij,ij->i", matrix, matrix)
+        distances = squares[:, None] + squares[None, :] - 2 * (matrix @ matrix.T)
+        numpy.maximum(distances, 0, out=distances)
+        return numpy.sqrt(distances, out=distances)
+
+    if distance not in ["manhattan", "maximum"]:
+        raise ValueError(f"distance must be one of {list(VALID_DISTANCES.keys())}.")
+
+    reduce = numpy.sum if distance == "manhattan" else numpy.max
+    count, width = matrix.shape
+    distances = numpy.empty((count, count))
+    block = max(1, _BLOCK_VALUES // max(1, count * width))
+    for start in range(0, count, block):
+        differences = numpy.abs(matrix[start : start + block, None, :] - matrix)
+        distances[start : start + block] = reduce(differences, axis=2)
+
+    return distances
+
+
+def linkage_merges(
+    distances: numpy.ndarray, linkage: str
+) -> List[Tuple[int, int, float]]:
+    """
+    Performs agglomerative clustering using the nearest-neighbour chain
+    algorithm, which needs O(n²) time for the supported linkages.
+    :param distances: `numpy.ndarray`
+        The square matrix of distances, which is modified.
+    :param linkage: `str`
+        `single`, `complete` or `average`.
+    :returns: `List[Tuple[int, int, float]]`
+        The merges as `(left, right, height)`, in which observations are
+        numbered from `0` and each merge creates the next number after the
+        observations and earlier merges.
+    """
+    if linkage not in VALID_LINKAGES:
+        raise ValueError(f"linkage must be one of {VALID_LINKAGES}.")
+
+    count = len(distances)
+    numpy.fill_diagonal(distances, numpy.inf)
+    sizes = numpy.ones(count)
+    nodes = list(range(count))
+    merges = []
+    chain = []
+
+    for node in range(count, 2 * count - 1):
+        if not chain:
+            chain.append(int(numpy.flatnonzero(sizes)[0]))
+
+        while True:
+            a = chain[-1]
+            b = int(numpy.argmin(distances[a]))
+            if len(chain) > 1 and distances[a, chain[-2]] <= distances[a, b]:
+                b = chain[-2]
+                break
+            chain.append(b)
+
+        del chain[-2:]
+
+        if linkage == "single":
+            merged = numpy.minimum(distances[a], distances[b])
+        elif linkage == "complete":
+            merged = numpy.maximum(distances[a], distances[b])
+        else:
+            merged = (sizes[a] * distances[a] + sizes[b] * distances[b]) / (
+                sizes[a] + sizes[b]
+            )
+
+        merges.append((nodes[a], nodes[b], float(distances[a, b])))
+
+        keep, drop = min(a, b), max(a, b)
+        distances[keep, :] = merged
+        distances[:, keep] = merged
+        distances[drop, :] = numpy.inf
+        distances[:, drop] = numpy.inf
+        distances[keep, keep] = numpy.inf
+        sizes[keep] += sizes[drop]
+        sizes[drop] = 0
+        nodes[keep] = node
+
+    return _orient(merges, count)
+
+
+def _orient(
+    merges: List[Tuple[int, int, float]], count: int
+) -> List[Tuple[int, int, float]]:
+    """
+    Orders the children of each merge by their first observation so that the
+    leaf order is deterministic.
+    """
+    first = list(range(count))
+    oriented = []
+    for left, right, height in merges:
+        if first[right] < first[left]:
+            left, right = right, left
+        first.append(first[left])
+        oriented.append((left, right, height))
+
+    return oriented
+
+
+def leaf_order(merges: List[Tuple[int, int, float]], count: int) -> List[int]:
+    """
+    Provides the order of the observations at the leaves of the dendrogram.
+    :param merges: `List[Tuple[int, int, float]]`
+        The merges provided by `linkage_merges`.
+    :param count: `int`
+        The number of observations.
+    :returns: `List[int]`
+    """
+    order = []
+    stack = [2 * count - 2]
+    while stack:
+        node = stack.pop()
+        if node < count:
+            order.append(node)
+        else:
+            left, right, _ = merges[node - count]
+            stack.extend([right, left])
+
+    return order
+
+
+def _newick_label(name: Any) -> str:
+    label = str(name)
+    if label == "" or any(character in _NEWICK_RESERVED for character in label):
+        return "'" + label.replace("'", "''") + "'"
+
+    return label
+
+
+def newick_tree(merges: List[Tuple[int, int, float]], names: list) -> str:
+    """
+    Provides the dendrogram in Newick format, as used for the `t` member of
+    CanvasXpress data.
+    :param merges: `List[Tuple[int, int, float]]`
+        The merges provided by `linkage_merges`.
+    :param names: `list`
+        The names of the observations.
+    :returns: `str`
+    """
+    count = len(names)
+    heights = [0.0] * count + [height for _, _, height in merges]
+    parts = []
+    stack = [(2 * count - 2, None)]
+    while stack:
+        node, parent = stack.pop()
+        if isinstance(node, str):
+            parts.append(node)
+            continue
+
+        length = "" if parent is None else f":{heights[parent] - heights[node]:g}"
+        if node < count:
+            parts.append(_newick_label(names[node]) + length)
+        else:
+            left, right, _ = merges[node - count]
+            stack.extend(
+                [(")" + length, None), (right, node), (",", None), (left, node)]
+            )
+            parts.append("(")
+
+    return "".join(parts) + ";"
+
+
+def cluster_axis(
+    matrix: numpy.ndarray, distance: str, linkage: str
+) -> Tuple[List[int], List[Tuple[int, int, float]]]:
+    """
+    Clusters the rows of a matrix, reusing a cached result for identical
+    values and options.
+    :param matrix: `numpy.ndarray`
+        The observations, one per row, without missing values.
+    :param distance: `str`
+        `euclidian`, `manhattan` or `maximum`.
+    :param linkage: `str`
+        `single`, `complete` or `average`.
+    :returns: `Tuple[List[int], List[Tuple[int, int, float]]]`
+        The leaf order and the merges provided by `linkage_merges`.
+    """
+    matrix = numpy.ascontiguousarray(matrix, dtype=float)
+    fingerprint = hashlib.blake2b(digest_size=16)
+    fingerprint.update(f"{matrix.shape}|{distance}|{linkage}".encode("utf-8"))
+    fingerprint.update(memoryview(matrix).cast("B"))
+    key = fingerprint.hexdigest()
+
+    with _cluster_cache_lock:
+        if key in _cluster_cache:
+            _cluster_cache.move_to_end(key)
+            return _cluster_cache[key]
+
+    if len(matrix) == 1:
+        result = ([0], [])
+    else:
+        merges = linkage_merges(distance_matrix(matrix, distance), linkage)
+        result = (leaf_order(merges, len(matrix)), merges)
+
+    with _cluster_cache_lock:
+        _cluster_cache[key] = result
+        while len(_cluster_cache) > CLUSTER_CACHE_SIZE:
+            _cluster_cache.popitem(last=False)
+
+    return result
+
+
+def clear_cluster_cache() -> None:
+    """
+    Discards all cached orderings.
+    """
+    with _cluster_cache_lock:
+        _cluster_cache.clear()
+
+
+def _impute(matrix: numpy.ndarray) -> numpy.ndarray:
+    """
+    Replaces missing values with the mean of their variable, or zero if the
+    variable has no values.
+    """
+    missing = numpy.isnan(matrix)
+    if not missing.any():
+        return matrix
+
+    counts = (~missing).sum(axis=1)
+    sums = numpy.where(missing, 0, matrix).sum(axis=1)
+    means = numpy.divide(sums, counts, out=numpy.zeros(len(matrix)), where=counts > 0)
+
+    return numpy.where(missing, means[:, None], matrix)
+
+
+def cluster_data(data: Any, config: dict) -> Tuple[Any, dict]:
+    """
+    Clusters the variables and/or samples of Heatmap data as requested by the
+    `samplesClustered` and `variablesClustered` configuration, using the
+    configured `distance` and `linkage`.  Missing values are replaced by the
+    mean of their variable.
+
+    Data that cannot be clustered here, such as non-numeric data or data
+    configured with an unsupported `distance` or `linkage`, is provided
+    unchanged so that the browser clusters it as before.
+    :param data: `Any`
+        The chart data.
+    :param config: `dict`
+        The chart configuration, such as provided by `CXConfigs.render_to_dict`.
+    :returns: `Tuple[Any, dict]`
+        The data reordered to the dendrogram leaf order with the Newick trees in
+        `t`, and a copy of the configuration in which the clustered axes are
+        no longer clustered by the browser but their dendrograms are shown.  If
+        nothing was clustered then `data` and `config` themselves.
+    """
+    if config.get("graphType") != "Heatmap":
+        return data, config
+
+    axes = [axis for axis in _AXES if config.get(axis[0]) is True]
+    distance = VALID_DISTANCES.get(str(config.get("distance", DEFAULT_DISTANCE)))
+    linkage = config.get("linkage", DEFAULT_LINKAGE)
+    if not axes or distance is None or linkage not in VALID_LINKAGES:
+        return data, config
+
+    if not isinstance(data, dict) or not isinstance(data.get(Y), dict):
+        return data, config
+
+    matrix = numeric_matrix(data)
+    if matrix is None:
+        return data, config
+
+    matrix = _impute(matrix)
+    trees = dict(data.get("t") or {})
+    clustered_config = dict(config)
+    orders = {}
+
+    for flag, member, dendrogram, transpose in axes:
+        observations = matrix.T if transpose else matrix
+        names = data[Y].get(member)
+        if not isinstance(names, list) or len(names) != len(observations):
+            continue
+
+        order, merges = cluster_axis(observations, distance, linkage)
+        orders[member] = order
+        trees[member] = newick_tree(merges, names)
+        clustered_config[flag] = False
+        clustered_config[dendrogram] = True
+
+    if not orders:
+        return data, config
+
+    clustered = subset_data(data, orders.get(VARS), orders.get(SMPS))
+    clustered["t"] = trees
+
+    return clustered, clustered_config
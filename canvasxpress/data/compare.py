@@ -0,0 +1,57 @@
+from typing import Any
+
+
+def count_key_changes(reference: dict, candidate: dict) -> int:
+    """
+    Counts the keys added less the keys removed when moving from `reference` to
+    `candidate`, descending into the `dict` values shared by both.  This is the
+    basis of the ordering used by `dict` based classes such as `CXDictData`,
+    and is much cheaper to establish than a full difference report.
+    :param reference: `dict`
+        The original `dict`.
+    :param candidate: `dict`
+        The `dict` to compare with the original.
+    :returns: `int`
+        A positive value if `candidate` adds more keys than it removes, a
+        negative value if it removes more than it adds, otherwise zero.
+    """
+    delta = 0
+    for key, value in reference.items():
+        if key not in candidate:
+            delta -= 1
+
+        else:
+            other_value = candidate[key]
+            if value is not other_value:
+                if isinstance(value, dict) and isinstance(other_value, dict):
+                    delta += count_key_changes(value, other_value)
+
+    for key in candidate.keys():
+        if key not in reference:
+            delta += 1
+
+    return delta
+
+
+def describe_differences(reference: Any, candidate: Any) -> dict:
+    """
+    Provides a detailed report of the differences between two values.  The
+    report is prepared by `deepdiff`, which is only imported when a report is
+    requested so that comparisons do not depend on it.
+    :param reference: `Any`
+        The original value.
+    :param candidate: `Any`
+        The value to compare with the original.
+    :returns: `dict`
+        The `DeepDiff` report, which is empty if the values are equivalent
+        irrespective of item order.
+    """
+    try:
+        from deepdiff import DeepDiff
+
+    except ImportError as e:
+        raise ImportError(
+            "The deepdiff package is required to describe differences."
+        ) from e
+
+    return DeepDiff(reference, candidate, ignore_order=True)
@@ -0,0 +1,454 @@
+"""
+Reduces the number of points sent to the browser for very large charts.  A
+`CXDecimator` is chosen by the `graphType` of the chart, and returns a copy of
+the chart data whose `y`, `x` and `z` members are consistently subset so that
+annotations remain aligned with the retained variables and samples.
+
+Decimators only select which variables (rows) or samples (columns) to keep;
+the retained values are passed through unchanged.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Tuple, Union
+
+import numpy
+
+from canvasxpress.data.base import DATA, SMPS, VARS, X, Y, Z
+
+
+def numeric_matrix(data: dict) -> Union[numpy.ndarray, None]:
+    """
+    Provides the `y.data` matrix of chart data as a float array.
+    :param data: `dict`
+        The chart data.
+    :returns: `Union[numpy.ndarray, None]`
+        A two dimensional array in which missing values are NaN, or `None` if
+        the data does not include a rectangular numeric matrix.
+    """
+    y = data.get(Y)
+    if not isinstance(y, dict) or not isinstance(y.get(DATA), list):
+        return None
+
+    try:
+        matrix = numpy.asarray(y[DATA], dtype=float)
+    except (TypeError, ValueError):
+        return None
+
+    if matrix.ndim != 2 or matrix.size == 0:
+        return None
+
+    return matrix
+
+
+def subset_data(
+    data: dict,
+    rows: Union[List[int], None] = None,
+    columns: Union[List[int], None] = None,
+) -> dict:
+    """
+    Provides a copy of chart data limited to, or reordered by, the given
+    variables and samples.  Members of `z` are subset alongside the variables
+    and members of `x` alongside the samples when their lengths match.
+    :param data: `dict`
+        The chart data.
+    :param rows: `Union[List[int], None]`
+        The indices of the variables to keep, in order, or `None` for all.
+    :param columns: `Union[List[int], None]`
+        The indices of the samples to keep, in order, or `None` for all.
+    :returns: `dict`
+        The subset chart data, sharing all unaffected members.
+    """
+
+    def pick(values: Any, indices: Union[List[int], None], size: int) -> Any:
+        if indices is None or not isinstance(values, list) or len(values) != size:
+            return values
+        return [values[index] for index in indices]
+
+    y = dict(data[Y])
+    matrix = y[DATA]
+    row_count = len(matrix)
+    column_count = len(matrix[0]) if row_count else 0
+
+    matrix = pick(matrix, rows, row_count)
+    if columns is not None:
+        matrix = [pick(row, columns, column_count) for row in matrix]
+
+    y[DATA] = matrix
+    y[VARS] = pick(y.get(VARS), rows, row_count)
+    y[SMPS] = pick(y.get(SMPS), columns, column_count)
+
+    subset = dict(data)
+    subset[Y] = {key: value for key, value in y.items() if value is not None}
+
+    for key, indices, size in [(Z, rows, row_count), (X, columns, column_count)]:
+        annotations = subset.get(key)
+        if isinstance(annotations, dict):
+            subset[key] = {
+                name: pick(values, indices, size)
+                for name, values in annotations.items()
+            }
+
+    return subset
+
+
+def _stratified_indices(count: int, keep: int) -> numpy.ndarray:
+    """
+    Provides evenly spaced indices, always including the first and last.
+    :param count: `int`
+        The number of candidates.
+    :param keep: `int`
+        The number of indices required.
+    :returns: `numpy.ndarray`
+    """
+    return numpy.unique(numpy.linspace(0, count - 1, max(keep, 1)).round().astype(int))
+
+
+class CXDecimator(ABC):
+    """
+    CXDecimator reduces chart data to approximately a target number of points
+    by selecting the variables (rows) and samples (columns) to retain.
+    """
+
+    @abstractmethod
+    def select(
+        self, matrix: numpy.ndarray, samples: list, config: dict, budget: int
+    ) -> Tuple[Union[List[int], None], Union[List[int], None]]:
+        """
+        Selects the variables and samples to retain if the data exceeds the
+        budget.
+        :param matrix: `numpy.ndarray`
+            The `y.data` values as floats, with NaN for missing values.
+        :param samples: `list`
+            The sample names, aligned with the columns of `matrix`.
+        :param config: `dict`
+            The chart configuration, such as provided by
+            `CXConfigs.render_to_dict`.
+        :param budget: `int`
+            The approximate number of points to retain.
+        :returns: `Tuple[Union[List[int], None], Union[List[int], None]]`
+            The ascending row and column indices to retain, where `None`
+            retains all.
+        """
+        pass
+
+    def decimate(self, data: dict, config: dict, budget: int) -> dict:
+        """
+        Reduces chart data if it exceeds the budget.
+        :param data: `dict`
+            The chart data in CanvasXpress `y`/`x`/`z` form.
+        :param config: `dict`
+            The chart configuration.
+        :param budget: `int`
+            The approximate number of points to retain.
+        :returns: `dict`
+            The reduced data, or `data` itself if no reduction was required or
+            possible.
+        """
+        matrix = numeric_matrix(data)
+        if matrix is None:
+            return data
+
+        rows, columns = self.select(matrix, data[Y].get(SMPS), config, budget)
+        if rows is None and columns is None:
+            return data
+
+        return subset_data(data, rows, columns)
+
+
+class CXSampleDecimator(CXDecimator):
+    """
+    CXSampleDecimator keeps a stratified (evenly spaced) or random selection of
+    the variables or samples, whichever are more numerous, so that about
+    `budget` values remain.  Used for charts without a dedicated decimator.
+    """
+
+    STRATIFIED: str = "stratified"
+    RANDOM: str = "random"
+
+    __method: str = STRATIFIED
+    """
+    The sampling method.
+    """
+
+    __seed: int = 0
+    """
+    The seed used for random sampling, so that renders are reproducible.
+    """
+
+    def __init__(self, method: str = STRATIFIED, seed: int = 0) -> None:
+        """
+        Initializes a new sampling decimator.
+        :param method: `str`
+            `CXSampleDecimator.STRATIFIED` or `CXSampleDecimator.RANDOM`.
+        :param seed: `int`
+            The seed used for random sampling.
+        """
+        if method not in [CXSampleDecimator.STRATIFIED, CXSampleDecimator.RANDOM]:
+            raise ValueError("method must be one of STRATIFIED or RANDOM.")
+
+        self.__method = method
+        self.__seed = seed
+
+    def sample_indices(self, count: int, keep: int) -> List[int]:
+        """
+        Selects the indices to retain.
+        :param count: `int`
+            The number of candidates.
+        :param keep: `int`
+            The number of indices to retain.
+        :returns: `List[int]`
+            The ascending indices.
+        """
+        if self.__method == CXSampleDecimator.RANDOM:
+            generator = numpy.random.default_rng(self.__seed)
+            indices = numpy.sort(generator.choice(count, size=keep, replace=False))
+        else:
+            indices = _stratified_indices(count, keep)
+
+        return indices.tolist()
+
+    def select(
+        self, matrix: numpy.ndarray, samples: list, config: dict, budget: int
+    ) -> Tuple[Union[List[int], None], Union[List[int], None]]:
+        if matrix.size <= budget:
+            return None, None
+
+        rows, columns = matrix.shape
+        if rows >= columns:
+            return self.sample_indices(rows, max(1, budget // columns)), None
+
+        return None, self.sample_indices(columns, max(1, budget // rows))
+
+
+class CXLTTBDecimator(CXDecimator):
+    """
+    CXLTTBDecimator applies Largest-Triangle-Three-Buckets downsampling to the
+    samples of line-like charts, in which each variable is a series plotted
+    across the samples.  Each series contributes its visually significant
+    samples, and the union is retained for all series.  With several series
+    each keeps fewer samples so that the union remains within the budget.
+    """
+
+    @staticmethod
+    def lttb_indices(values: numpy.ndarray, threshold: int) -> numpy.ndarray:
+        """
+        Selects the indices of a series retained by LTTB.
+        :param values: `numpy.ndarray`
+            The series values, with NaN for missing values.
+        :param threshold: `int`
+            The number of indices to retain; at least 3.
+        :returns: `numpy.ndarray`
+            The ascending indices.
+        """
+        count = len(values)
+        if threshold >= count or threshold < 3:
+            return numpy.arange(count)
+
+        finite = numpy.isfinite(values)
+        if not finite.any():
+            return _stratified_indices(count, threshold)
+
+        values = numpy.where(finite, values, numpy.mean(values[finite]))
+        positions = numpy.arange(count, dtype=float)
+
+        # The first and last points are fixed; the rest fill equal buckets
+        edges = numpy.linspace(1, count - 1, threshold - 1).astype(int)
+        selected = numpy.empty(threshold, dtype=int)
+        selected[0] = 0
+        selected[-1] = count - 1
+
+        # Bucket averages are the third vertex of each triangle
+        sums = numpy.add.reduceat(values[1 : count - 1], edges[:-1] - 1)
+        sizes = numpy.diff(edges)
+        averages = numpy.append(sums / sizes, values[-1])
+        average_positions = numpy.append(
+            (edges[:-1] + edges[1:] - 1) / 2.0, float(count - 1)
+        )
+
+        previous = 0
+        for bucket in range(threshold - 2):
+            start, stop = edges[bucket], edges[bucket + 1]
+            areas = numpy.abs(
+                (positions[previous] - average_positions[bucket + 1])
+                * (values[start:stop] - values[previous])
+                - (positions[previous] - positions[start:stop])
+                * (averages[bucket + 1] - values[previous])
+            )
+            previous = start + int(numpy.argmax(areas))
+            selected[bucket + 1] = previous
+
+        return selected
+
+    def select(
+        self, matrix: numpy.ndarray, samples: list, config: dict, budget: int
+    ) -> Tuple[Union[List[int], None], Union[List[int], None]]:
+        rows, columns = matrix.shape
+        # Each series keeps its own extrema, so the union of the selections
+        # is bounded to budget // rows samples to respect the budget overall
+        threshold = max(3, budget // (rows * rows))
+        if matrix.size <= budget or threshold >= columns:
+            return None, None
+
+        selected = numpy.unique(
+            numpy.concatenate(
+                [self.lttb_indices(series, threshold) for series in matrix]
+            )
+        )
+
+        return None, selected.tolist()
+
+
+class CXGridDecimator(CXDecimator):
+    """
+    CXGridDecimator bins the points of scatter-like charts, in which each
+    variable is a point and the `xAxis` and `yAxis` samples are its
+    coordinates, into a square grid of about `budget` cells and keeps the
+    first point of each occupied cell.  Outliers and the overall density
+    shape are preserved, while overplotted points are removed.
+    """
+
+    @staticmethod
+    def axis_index(samples: list, config: dict, axis: str, default: int) -> int:
+        """
+        Provides the sample index used for an axis.
+        :param samples: `list`
+            The sample names.
+        :param config: `dict`
+            The chart configuration.
+        :param axis: `str`
+            `xAxis` or `yAxis`.
+        :param default: `int`
+            The index used if the configuration does not name a sample.
+        :returns: `int`
+        """
+        names = config.get(axis)
+        if isinstance(names, list) and len(names) > 0 and isinstance(samples, list):
+            if names[0] in samples:
+                return samples.index(names[0])
+
+        return default
+
+    def select(
+        self, matrix: numpy.ndarray, samples: list, config: dict, budget: int
+    ) -> Tuple[Union[List[int], None], Union[List[int], None]]:
+        if matrix.shape[0] <= budget:
+            return None, None
+
+        if matrix.shape[1] < 2:
+            return _fallback_decimator.select(matrix, samples, config, budget)
+
+        x = matrix[:, self.axis_index(samples, config, "xAxis", 0)]
+        y = matrix[:, self.axis_index(samples, config, "yAxis", 1)]
+        finite = numpy.flatnonzero(numpy.isfinite(x) & numpy.isfinite(y))
+        if len(finite) == 0:
+            return _fallback_decimator.select(matrix, samples, config, budget)
+
+        side = max(1, int(numpy.sqrt(budget)))
+
+        def bins(values: numpy.ndarray) -> numpy.ndarray:
+            low, high = values.min(), values.max()
+            if high == low:
+                return numpy.zeros(len(values), dtype=numpy.int64)
+            scaled = (values - low) / (high - low) * side
+            return numpy.minimum(scaled.astype(numpy.int64), side - 1)
+
+        cells = bins(x[finite]) * side + bins(y[finite])
+        _, first = numpy.unique(cells, return_index=True)
+
+        return numpy.sort(finite[first]).tolist(), None
+
+
+_graph_type_decimators: Dict[str, CXDecimator] = {
+    "Area": CXLTTBDecimator(),
+    "DotLine": CXLTTBDecimator(),
+    "Line": CXLTTBDecimator(),
+    "Scatter2D": CXGridDecimator(),
+    "ScatterBubble2D": CXGridDecimator(),
+}
+
+_fallback_decimator: CXDecimator = CXSampleDecimator()
+
+
+def register_decimator(graph_type: str, decimator: Union[CXDecimator, None]) -> None:
+    """
+    Associates a decimator with a `graphType`, replacing any existing
+    association.
+    :param graph_type: `str`
+        The `graphType` value, such as `Line`.
+    :param decimator: `Union[CXDecimator, None]`
+        The decimator to use, or `None` to use the sampling fallback.
+    """
+    if decimator is None:
+        _graph_type_decimators.pop(str(graph_type), None)
+
+    elif not isinstance(decimator, CXDecimator):
+        raise TypeError("decimator must be a CXDecimator or None.")
+
+    else:
+        _graph_type_decimators[str(graph_type)] = decimator
+
+
+def get_decimator(graph_type: Union[str, None]) -> CXDecimator:
+    """
+    Provides the decimator associated with a `graphType`.
+    :param graph_type: `Union[str, None]`
+        The `graphType` value.
+    :returns: `CXDecimator`
+        The associated decimator, otherwise a stratified `CXSampleDecimator`.
+    """
+    return _graph_type_decimators.get(str(graph_type), _fallback_decimator)
+
+
+def decimate_data(data: Any, config: dict, budget: int) -> Any:
+    """
+    Reduces chart data to about `budget` points using the decimator for the
+    configured `graphType`.
+    :param data: `Any`
+        The chart data.  Data other than a `dict` bearing a numeric `y.data`
+        matrix is returned as-is.
+    :param config: `dict`
+        The chart configuration.
+    :param budget: `int`
+        The approximate number of points to retain.
+    :returns: `Any`
+        The reduced data, or `data` itself if no reduction was made.
+    """
+    if not isinstance(data, dict) or not isinstance(data.get(Y), dict):
+        return data
+
+    return get_decimator(config.get("graphType")).decimate(data, config, budget)
+
+
+def decimate_dataframe(frame: Any, config: dict, budget: int) -> Any:
+    """
+    Reduces a `DataFrame` in the layout used by `CXDataframeData`, with
+    variables as rows and samples as columns, before it is converted into chart
+    data.  This avoids converting every value of a very large `DataFrame` into
+    Python objects.
+    :param frame: `DataFrame`
+        The data.
+    :param config: `dict`
+        The chart configuration.
+    :param budget: `int`
+        The approximate number of points to retain.
+    :returns: `DataFrame`
+        The reduced data, or `frame` itself if no reduction was made.
+    """
+    try:
+        matrix = frame.to_numpy(dtype=float)
+    except (TypeError, ValueError):
+        return frame
+
+    if matrix.ndim != 2 or matrix.size == 0:
+        return frame
+
+    rows, columns = get_decimator(config.get("graphType")).select(
+        matrix, frame.columns.tolist(), config, budget
+    )
+    if rows is None and columns is None:
+        return frame
+
+    return frame.iloc[
+        rows if rows is not None else slice(None),
+        columns if columns is not None else slice(None),
+    ]
@@ -1,12 +1,11 @@
 import json
 from copy import deepcopy
 from functools import total_ordering
+from types import MappingProxyType
 from typing import Union
 
-import requests
-from deepdiff import DeepDiff
-
 from canvasxpress.data.base import CXKeyPairData
+from canvasxpress.data.compare import count_key_changes, describe_differences
 
 
 @total_ordering
@@ -20,13 +19,52 @@ class CXDictData(CXKeyPairData):
     The data managed by an object of this class.
     """
 
+    __copy: bool = True
+    """
+    Indicates if assigned dicts are deep copied rather than shared with the
+    caller.
+    """
+
+    __shared: bool = False
+    """
+    Indicates if the tracked dict is still the structure provided by the
+    caller, in which case it is copied the first time mutable access is
+    requested.
+    """
+
+    @property
+    def copy(self) -> bool:
+        """
+        Indicates if assigned dicts are deep copied.  If `False` then the
+        caller's dict is shared: rendering and read-only access via `view` use
+        it as-is, and a private deep copy is only made the first time `data` is
+        accessed, as that accessor permits mutation.
+        :returns: `bool`
+        """
+        return self.__copy
+
+    @property
+    def view(self) -> MappingProxyType:
+        """
+        Provides a read-only perspective of the tracked dict without copying
+        it.  Nested values are not protected and should not be modified.
+        :returns: `MappingProxyType`
+        """
+        return MappingProxyType(self.__data)
+
     @property
     def data(self) -> dict:
         """
-        Provides a reference to the dict tracked by the object.
+        Provides a reference to the dict tracked by the object.  If the dict is
+        still shared with the caller (see `copy`) then it is first deep copied
+        so that changes made via the reference remain private to the object.
         :returns: `dict`
             The associated dictionary, with zero or more keys as appropriate.
         """
+        if self.__shared:
+            self.__data = deepcopy(self.__data)
+            self.__shared = False
+
         return self.__data
 
     @data.setter
@@ -36,19 +74,26 @@ class CXDictData(CXKeyPairData):
         :param value: `dict`
             The dictionary to be tracked by the object.  `None` will result in
             an empty dict.  A deep copy will be made of a valid `CXDict` or
-            `dict` provided.
+            `dict` provided unless `copy` is `False`, in which case it is
+            shared.
         """
         if value == None:
             self.__data = dict()
+            self.__shared = False
 
-        elif not type(value) in [dict, CXDictData]:
+        elif not (type(value) is dict or isinstance(value, CXDictData)):
             raise TypeError("value must be type dict or compatible.")
 
-        elif isinstance(value, CXDictData):
-            self.__data = deepcopy(value.data)
-
         else:
-            self.__data = deepcopy(value)
+            candidate = value.__data if isinstance(value, CXDictData) else value
+
+            if self.copy:
+                self.__data = deepcopy(candidate)
+                self.__shared = False
+
+            else:
+                self.__data = candidate
+                self.__shared = True
 
     def get_raw_dict_form(self) -> dict:
         """
@@ -58,13 +103,19 @@ class CXDictData(CXKeyPairData):
         modification or enhancement.
 
         This implementation provides matrix data formatted in a `dict` object
-        with `DataFrame.to_dict('split')` behaviour.
+        with `DataFrame.to_dict('split')` behaviour.  A deep copy is provided
+        unless `copy` is `False`, in which case the shared dict is provided and
+        must be treated as read-only.
 
         :returns: `dict`
             The `dict` perspective of the data with as little modification or
             interpretation as is reasonable.
         """
-        return deepcopy(self.data)
+        if self.copy:
+            return deepcopy(self.__data)
+
+        else:
+            return self.__data
 
     def render_to_dict(self, **kwargs) -> dict:
         """
@@ -74,15 +125,20 @@ class CXDictData(CXKeyPairData):
         """
         return self.get_raw_dict_form()
 
-    def __init__(self, data: Union[dict, None] = None) -> None:
+    def __init__(self, data: Union[dict, None] = None, copy: bool = True) -> None:
         """
         Initializes the CXData object with data.  Only dict or compatible data
         types are accepted.
         :param data: `Union[dict, None]`
             `None` to initialize with an empty dictionary, or a `dict`-like
             object to assign mapped data.
+        :param copy: `bool`
+            Defaults to `True`.  See the `copy` property.  Use `False` to share
+            a large dict with the object rather than copy it on assignment and
+            each render.
         """
         super().__init__(data)
+        self.__copy = bool(copy)
         self.data = data
 
     def __copy__(self) -> "CXDictData":
@@ -90,7 +146,7 @@ class CXDictData(CXKeyPairData):
         *copy constructor* that returns a copy of the CXDictData object.
         :returns: `CXDictData` A copy of the wrapping object.
         """
-        return self.__class__(self.data)
+        return self.__class__(self.__data, copy=self.copy)
 
     def __deepcopy__(self, memo) -> "CXDictData":
         """
@@ -98,7 +154,7 @@ class CXDictData(CXKeyPairData):
         :returns: `CXDictData` A copy of the wrapping object and deepcopy of
             the tracked data.
         """
-        return self.__class__(deepcopy(self.data))
+        return self.__class__(self.__data)
 
     def __lt__(self, other: "CXDictData") -> bool:
         """
@@ -121,24 +177,22 @@ class CXDictData(CXKeyPairData):
             return False
 
         else:
-            delta: dict = DeepDiff(self.data, other.data, ignore_order=True)
-            other_added: int = len(delta.get("dictionary_item_added", []))
-            other_removed: int = len(delta.get("dictionary_item_removed", []))
-
-            if (other_added - other_removed) == 0:
-                for skey in self.data.keys():
-                    if not skey in other.data.keys():
-                        for okey in other.data.keys():
+            key_changes: int = count_key_changes(self.__data, other.__data)
+
+            if key_changes == 0:
+                for skey in self.__data.keys():
+                    if not skey in other.__data.keys():
+                        for okey in other.__data.keys():
                             if skey < okey:
                                 return True
 
-                    elif self.data[skey] < other.data[skey]:
+                    elif self.__data[skey] < other.__data[skey]:
                         return True
 
                 return False
 
             else:
-                return (other_added - other_removed) > 0
+                return key_changes > 0
 
     def __eq__(self, other: "CXDictData") -> bool:
         """
@@ -149,9 +203,9 @@ class CXDictData(CXKeyPairData):
             <ul>
             <li> If `other` is `None` then `False`
             <li> If `other` is not a `CXDictData` object then False
-            <li> If `other` is a `CXDictData` object then True of all
-                `CXDictData` objects are also equal to the data tracked by
-                `self`.
+            <li> If `other` is a `CXDictData` object then True if the data
+                tracked by both is equal, as established by native `dict`
+                comparison which stops at the first difference found.
             </ul>
         """
         if other is None:
@@ -161,22 +215,19 @@ class CXDictData(CXKeyPairData):
             return False
 
         else:
-            delta: dict = DeepDiff(self.data, other.data, ignore_order=True)
-            other_added: int = len(delta.get("dictionary_item_added", []))
-            other_removed: int = len(delta.get("dictionary_item_removed", []))
-
-            if (other_added - other_removed) == 0:
-                for skey in self.data.keys():
-                    if not skey in other.data.keys():
-                        return False
-
-                    elif self.data[skey] != other.data[skey]:
-                        return False
-
-                return True
+            return self.__data is other.__data or self.__data == other.__data
 
-            else:
-                return False
+    def diff(self, other: "CXDictData") -> dict:
+        """
+        Provides a detailed report of how the data of `other` differs from that
+        tracked by `self`.  Requires the `deepdiff` package.
+        :param other: `CXDictData`
+            The object to compare.
+        :returns: `dict`
+            The difference report, which is empty if the data is equivalent
+            irrespective of item order.
+        """
+        return describe_differences(self.__data, other.__data)
 
     def __str__(self) -> str:
         """
@@ -184,7 +235,7 @@ class CXDictData(CXKeyPairData):
         representation.
         :returns" `str` JSON form of the `CXDictData`.
         """
-        return json.dumps(self.data)
+        return json.dumps(self.__data)
 
     def __repr__(self) -> str:
         """
@@ -192,7 +243,7 @@ class CXDictData(CXKeyPairData):
         that can be used with `eval` to establish a copy of the object.
         :returns: `str` An evaluatable representation of the object.
         """
-        return f"CXDictData(data={json.dumps(self.data)})"
+        return f"CXDictData(data={json.dumps(self.__data)})"
 
 
 class CXJSONData(CXDictData):
@@ -220,6 +271,8 @@ class CXJSONData(CXDictData):
         """
         if isinstance(value, str) and value.lower().startswith("http"):
             try:
+                import requests
+
                 result = requests.get(value, allow_redirects=True)
                 self.data = result.json()
 
@@ -234,7 +287,7 @@ class CXJSONData(CXDictData):
     @CXDictData.data.setter
     def data(self, value: Union[dict, str]) -> None:
         if isinstance(value, CXJSONData):
-            CXDictData.data.fset(self, value.data)
+            CXDictData.data.fset(self, value)
 
         elif isinstance(value, str):
             candidate = json.loads(value)
@@ -243,30 +296,17 @@ class CXJSONData(CXDictData):
         else:
             CXDictData.data.fset(self, value)
 
-    def __init__(self, data: Union[dict, str, None] = None) -> None:
+    def __init__(self, data: Union[dict, str, None] = None, copy: bool = True) -> None:
         """
         Initializes the CXData object with data.  Only dict or compatible data
         types are accepted.
         :param data: `Union[dict, str, None]`
             `None` to initialize with an empty JSON, or a JSON/`dict`-like
             object to assign mapped data.
+        :param copy: `bool`
+            Defaults to `True`.  See `CXDictData.copy`.
         """
-        super().__init__(data)
-
-    def __copy__(self) -> "CXJSONData":
-        """
-        *copy constructor* that returns a copy of the CXDictData objct.
-        :returns: `CXDictData` A copy of the wrapping object.
-        """
-        return CXJSONData(self.data)
-
-    def __deepcopy__(self, memo) -> "CXJSONData":
-        """
-        *deepcopy constructor* that returns a copy of the CXJSONData object.
-        :returns: `CXJSONData` A copy of the wrapping object and deepcopy of
-            the tracked data.
-        """
-        return CXJSONData(self.data)
+        super().__init__(data, copy=copy)
 
     def __repr__(self) -> str:
         """
@@ -274,4 +314,4 @@ class CXJSONData(CXDictData):
         that can be used with `eval` to establish a copy of the object.
         :returns: `str` An evaluatable representation of the object.
         """
-        return f"CXJSONData(data={str(self.data)})"
+        return f"CXJSONData(data={str(dict(self.view))})"
@@ -2,11 +2,33 @@ import json
 from functools import total_ordering
 from typing import Union
 
-from pandas import DataFrame
+import pandas
+from numpy import ndarray
+from pandas import DataFrame, Index
 
 from canvasxpress.data.base import CXMatrixData
 
 
+def copy_on_write_active() -> bool:
+    """
+    Indicates if pandas Copy-on-Write semantics are active, in which case a
+    shallow copy of a DataFrame is isolated from later changes to the original
+    without duplicating its memory.  Copy-on-Write is always active for pandas
+    3 and later, and can be enabled for pandas 2 via
+    `pandas.options.mode.copy_on_write = True`.
+    :returns: `bool`
+        `True` if Copy-on-Write is active.
+    """
+    try:
+        if int(pandas.__version__.split(".")[0]) >= 3:
+            return True
+
+        return pandas.get_option("mode.copy_on_write") is True
+
+    except Exception:
+        return False
+
+
 @total_ordering
 class CXDataframeData(CXMatrixData):
     """
@@ -19,6 +41,38 @@ class CXDataframeData(CXMatrixData):
     The data managed by an object of this class.
     """
 
+    __copy: bool = True
+    """
+    Indicates if assigned DataFrames are copied (or isolated via Copy-on-Write)
+    rather than shared with the caller.
+    """
+
+    @property
+    def copy(self) -> bool:
+        """
+        Indicates if assigned DataFrames are copied.  If `False` then no memory
+        is duplicated.  If pandas Copy-on-Write is active the DataFrame is
+        still isolated from the caller, as a shallow copy shares its memory
+        until either side changes.  Otherwise the caller's DataFrame is
+        tracked as-is: changes made by the caller are visible to the chart and
+        changes made via `dataframe` alter the caller's DataFrame, so it
+        should not be modified while the chart is in use.
+        :returns: `bool`
+        """
+        return self.__copy
+
+    @property
+    def values(self) -> ndarray:
+        """
+        Provides the matrix of values managed by the object without building a
+        `dict` or Python lists.  For DataFrames with a single dtype this is a
+        view of the managed data rather than a copy, and it should be treated
+        as read-only.
+        :returns: `ndarray`
+            The two dimensional array of values.
+        """
+        return self.dataframe.to_numpy()
+
     @property
     def dataframe(self) -> DataFrame:
         """
@@ -57,8 +111,11 @@ class CXDataframeData(CXMatrixData):
         """
         Sets the dataframe managed by the object.
         :param value: `Union['CXDataframeData', DataFrame, dict, str, None]`
-            `None` results in an empty `DataFrame`.  A deepcopy will be made of
-            `DataFrame` or equivalent values.
+            `None` results in an empty `DataFrame`.  The object is isolated
+            from the provided `DataFrame` by a shallow copy if pandas
+            Copy-on-Write is active, otherwise by a deepcopy if `copy` is
+            `True`.  If `copy` is `False` and Copy-on-Write is not active the
+            `DataFrame` is shared with the caller.
         """
         if value is None:
             self.__data = DataFrame()
@@ -66,14 +123,17 @@ class CXDataframeData(CXMatrixData):
         elif not isinstance(value, (CXDataframeData, DataFrame, type(None))):
             raise TypeError("The assignment value must be a DataFrame or None.")
 
-        elif isinstance(value, CXDataframeData):
-            self.__data = value.dataframe.copy(deep=True)
+        else:
+            candidate = value.dataframe if isinstance(value, CXDataframeData) else value
 
-        elif isinstance(value, DataFrame):
-            self.__data = value.copy(deep=True)
+            if copy_on_write_active():
+                self.__data = candidate.copy(deep=False)
 
-        else:
-            self.__data = DataFrame()
+            elif not self.copy:
+                self.__data = candidate
+
+            else:
+                self.__data = candidate.copy(deep=True)
 
     def get_raw_dict_form(self) -> dict:
         """ "
@@ -100,15 +160,25 @@ class CXDataframeData(CXMatrixData):
         candidate = self.get_raw_dict_form()
         return candidate
 
-    def __init__(self, data: Union["CXDataframeData", DataFrame, None] = None) -> None:
+    def __init__(
+        self,
+        data: Union["CXDataframeData", DataFrame, None] = None,
+        copy: bool = True,
+    ) -> None:
         """
         Initializes the CXData object with data.  Only `DataFrame` or compatible
          data types are accepted.
         :param data: `Union['CXDataframeData', DataFrame, dict, str, None]`
             `None` to initialize with an empty `DataFrame`, or a `DataFrame`
             like object to assign mapped data.
+        :param copy: `bool`
+            Defaults to `True`.  See the `copy` property.  Use `False` to wrap
+            a large DataFrame without duplicating it when pandas Copy-on-Write
+            is not active, in which case the DataFrame is shared with the
+            caller.
         """
         super().__init__(data)
+        self.__copy = bool(copy)
         self.data = data
 
     def __copy__(self) -> "CXDataframeData":
@@ -117,7 +187,7 @@ class CXDataframeData(CXMatrixData):
         :returns: `CXDataframeData`
             A copy of the wrapping object.
         """
-        return self.__class__(self.dataframe)
+        return self.__class__(self.dataframe, copy=self.copy)
 
     def __deepcopy__(self, memo) -> "CXDataframeData":
         """
@@ -226,91 +296,107 @@ class CXDataframeData(CXMatrixData):
         return candidate
 
 
+def _annotation_rows(frame: DataFrame) -> list:
+    """
+    Provides the rows of a DataFrame as lists of native Python values.  Each
+    column is converted in one step and the results are then zipped into rows,
+    which avoids per-cell conversion of NumPy scalars.
+    :param frame: `DataFrame`
+        The annotation frame to convert.
+    :returns: `list`
+        One `list` of native values per row of `frame`.
+    """
+    columns = [frame.iloc[:, index].tolist() for index in range(frame.shape[1])]
+    if not columns:
+        return [[] for _ in range(frame.shape[0])]
+
+    return [list(row) for row in zip(*columns)]
+
+
+def _align_annotation(frame: DataFrame, identifiers: list) -> dict:
+    """
+    Aligns an annotation DataFrame with the sample or variable identifiers of
+    the chart data.  Membership tests are hash based and values are converted
+    to native Python types a column at a time.
+
+    The layout of the annotation is detected using the following rules, in
+    order:
+
+    1.  The first column holds the identifiers - use values in each row.
+    2.  Else the first row holds the identifiers - use values in each column.
+    3.  Else the header holds the identifiers - use values in each column.
+    4.  Else use the index - use values in each row.
+
+    :param frame: `DataFrame`
+        The annotation data.
+    :param identifiers: `list`
+        The `smps` or `vars` of the chart data.
+    :returns: `dict`
+        The annotation values keyed by identifier.
+    """
+    # 1.  Scan first column - use values in each row.
+    if frame.iloc[:, 0].isin(identifiers).all():
+        return dict(zip(frame.iloc[:, 0].tolist(), _annotation_rows(frame.iloc[:, 1:])))
+
+    # 2.  Else use first row - use values in each column
+    if frame.iloc[0].isin(identifiers).all():
+        return {
+            meta_name: frame.iloc[1:, column_index].tolist()
+            for column_index, meta_name in enumerate(frame.iloc[0].tolist())
+        }
+
+    # 3.  Else scan header for a matching identifier - use values in each column.
+    if frame.columns.isin(identifiers).all():
+        return {
+            column: frame.iloc[:, column_index].tolist()
+            for column_index, column in enumerate(frame.columns.tolist())
+        }
+
+    # 4.  Else scan the index - use values in each row
+    return dict(zip(frame.index.tolist(), _annotation_rows(frame)))
+
+
 def merge_dataframes_into_xyz_object(
     data: CXDataframeData,
     sample_annotation: CXDataframeData = None,
     variable_annotation: CXDataframeData = None,
+    subset: DataFrame = None,
 ) -> dict:
     """
-    Converts a set of DataFrame like objects into an XYZ dict.
+    Converts a set of DataFrame like objects into an XYZ dict.  Sample (x) and
+    variable (z) annotations are aligned with the chart data (y) as described
+    by `_align_annotation`.
+
+    `subset` can provide a selection of the rows and columns of `data`, such
+    as made by `decimate_dataframe`, to be used as the chart data.  The
+    annotations are then aligned with all of `data`, so that their layout is
+    detected as for the full chart, and limited to the retained samples and
+    variables.
     """
     xyz_data = {}
 
     if data is not None:
+        frame = data.dataframe if subset is None else subset
         xyz_data["y"] = {}
-        xyz_data["y"]["data"] = data.dataframe.values.tolist()
-        xyz_data["y"]["smps"] = data.dataframe.columns.tolist()
-        xyz_data["y"]["vars"] = data.dataframe.index.tolist()
+        xyz_data["y"]["data"] = frame.values.tolist()
+        xyz_data["y"]["smps"] = frame.columns.tolist()
+        xyz_data["y"]["vars"] = frame.index.tolist()
 
-    if sample_annotation is not None and sample_annotation.dataframe.size > 0:
+    def align(annotation: DataFrame, identifiers: Index, retained: list) -> dict:
+        if subset is None:
+            return _align_annotation(annotation, retained)
 
-        xyz_data["x"] = {}
+        aligned = _align_annotation(annotation, identifiers.tolist())
+        dropped = set(identifiers).difference(retained)
+        return {key: value for key, value in aligned.items() if key not in dropped}
 
+    if sample_annotation is not None and sample_annotation.dataframe.size > 0:
         try:
-
-            # 1.  Scan first column - use values in each row.
-            # 2.  Else use first row - use values in each column
-            # 3.  Else scan index for a matching sample identifier - use values in each row.
-            # 4.  Else scan the header - use values in each column
-
-            # 1.  Scan first column - use values in each row.
-            found_strategy = True
-            for field in sample_annotation.dataframe[
-                sample_annotation.dataframe.columns[0]
-            ].values:
-                if field not in xyz_data["y"]["smps"]:
-                    found_strategy = False
-                    break
-
-            if found_strategy:
-                for row_index in range(sample_annotation.dataframe.shape[0]):
-                    key = sample_annotation.dataframe.iloc[row_index, 0]
-                    if not isinstance(key, str):
-                        x_key = key.item()
-                    xyz_data["x"][key] = sample_annotation.dataframe.iloc[row_index][1:]
-
-            # 2.  Else use first row - use values in each column
-            else:
-                found_strategy = True
-                for column_index in range(sample_annotation.dataframe.shape[1]):
-                    if (
-                        sample_annotation.dataframe.iloc[0, column_index]
-                        not in xyz_data["y"]["smps"]
-                    ):
-                        found_strategy = False
-                        break
-
-                if found_strategy:
-                    for column_index in range(sample_annotation.dataframe.shape[1]):
-                        column = sample_annotation.dataframe.columns[column_index]
-                        meta_name = sample_annotation.dataframe[column][0]
-                        if not isinstance(meta_name, str):
-                            meta_name = meta_name.item()
-                        meta_data = sample_annotation.dataframe[column][1:]
-                        xyz_data["x"][meta_name] = meta_data
-
-                # 3.  Else scan header for a matching sample identifier - use values in each column.
-                else:
-                    found_strategy = True
-                    for header in sample_annotation.dataframe.columns.values:
-                        if header not in xyz_data["y"]["smps"]:
-                            found_strategy = False
-                            break
-
-                    if found_strategy:
-                        for column_index, column in enumerate(
-                            sample_annotation.dataframe.columns.values
-                        ):
-                            xyz_data["x"][
-                                column if isinstance(column, str) else column.item()
-                            ] = sample_annotation.dataframe[column]
-
-                    # 4.  Else scan the index - use values in each row
-                    else:
-                        for index in sample_annotation.dataframe.index.values:
-                            xyz_data["x"][
-                                index if isinstance(index, str) else index.item()
-                            ] = sample_annotation.dataframe.loc[index]
+            xyz_data["x"] = align(
+                sample_annotation.dataframe,
+                data.dataframe.columns,
+                xyz_data["y"]["smps"],
+            )
 
         except Exception as e:
             raise ValueError(
@@ -318,96 +404,16 @@ def merge_dataframes_into_xyz_object(
             )
 
     if variable_annotation is not None and variable_annotation.dataframe.size > 0:
-
-        xyz_data["z"] = {}
-
         try:
-
-            # 1.  Scan first column - use values in each row.
-            # 2.  Else use first row - use values in each column
-            # 3.  Else scan index for a matching sample identifier - use values in each row.
-            # 4.  Else scan the header - use values in each column
-
-            # 1.  Scan first column - use values in each row.
-            found_strategy = True
-            for field in variable_annotation.dataframe[
-                variable_annotation.dataframe.columns[0]
-            ].values:
-                if field not in xyz_data["y"]["vars"]:
-                    found_strategy = False
-                    break
-
-            if found_strategy:
-                for row_index in range(variable_annotation.dataframe.shape[0]):
-                    key = variable_annotation.dataframe.iloc[row_index, 0]
-                    if not isinstance(key, str):
-                        key = key.item()
-                    xyz_data["z"][key] = variable_annotation.dataframe.iloc[row_index][
-                        1:
-                    ]
-
-            # 2.  Else use first row - use values in each column
-            else:
-                found_strategy = True
-                for column_index in range(variable_annotation.dataframe.shape[1]):
-                    if (
-                        variable_annotation.dataframe.iloc[0, column_index]
-                        not in xyz_data["y"]["vars"]
-                    ):
-                        found_strategy = False
-                        break
-
-                if found_strategy:
-                    for column_index in range(variable_annotation.dataframe.shape[1]):
-                        column = sample_annotation.dataframe.columns[column_index]
-                        meta_name = sample_annotation.dataframe[column][0]
-                        if not isinstance(meta_name, str):
-                            meta_name = meta_name.item()
-                        meta_data = sample_annotation.dataframe[column][1:]
-                        xyz_data["z"][meta_name] = meta_data
-
-                # 3.  Else scan header for a matching sample identifier - use values in each column.
-                else:
-                    found_strategy = True
-                    for header in variable_annotation.dataframe.columns.values:
-                        if header not in xyz_data["y"]["vars"]:
-                            found_strategy = False
-                            break
-
-                    if found_strategy:
-                        for column_index, column in enumerate(
-                            variable_annotation.dataframe.columns.values
-                        ):
-                            xyz_data["z"][
-                                column if isinstance(column, str) else column.item()
-                            ] = variable_annotation.dataframe[column]
-
-                    # 4.  Else scan the index - use values in each rpw
-                    else:
-                        for index in variable_annotation.dataframe.index.values:
-                            xyz_data["z"][
-                                index if isinstance(index, str) else index.item()
-                            ] = variable_annotation.dataframe.loc[index]
+            xyz_data["z"] = align(
+                variable_annotation.dataframe,
+                data.dataframe.index,
+                xyz_data["y"]["vars"],
+            )
 
         except Exception as e:
             raise ValueError(
                 "Variable Annotation data (z) cannot be parsed or aligned with Chart data (y)"
             )
 
-    # Convert to Python native types for serialization
-
-    if "x" in xyz_data:
-        for annotation in xyz_data["x"].keys():
-            xyz_data["x"][annotation] = [
-                element if isinstance(element, str) else element.item()
-                for element in xyz_data["x"][annotation]
-            ]
-
-    if "z" in xyz_data:
-        for annotation in xyz_data["z"].keys():
-            xyz_data["z"][annotation] = [
-                element if isinstance(element, str) else element.item()
-                for element in xyz_data["z"][annotation]
-            ]
-
     return xyz_data
@@ -1,10 +1,12 @@
 import csv
 import json
-from typing import Union
-
-from pandas import DataFrame
+from typing import TYPE_CHECKING, Union
 
 from canvasxpress.data.base import CXData
+from canvasxpress.util.lazy import is_dataframe
+
+if TYPE_CHECKING:
+    from pandas import DataFrame
 
 
 class CXTextData(CXData):
@@ -112,7 +114,7 @@ class CXDataframeData(CXTextData):
     the CanvasXpress for Javascript object by converting a Pandas DataFrame into a text matrix.
     """
 
-    __data: DataFrame = DataFrame()
+    __data: "DataFrame" = None
     """
     The data managed by an object of this class.
     """
@@ -148,7 +150,7 @@ class CXDataframeData(CXTextData):
             self.__delimiter = value
 
     @property
-    def dataframe(self) -> DataFrame:
+    def dataframe(self) -> "DataFrame":
         """
         Provides the data managed by the object.
         :returns: `DataFrame` The managed data.
@@ -156,7 +158,7 @@ class CXDataframeData(CXTextData):
         return self.__data
 
     @dataframe.setter
-    def dataframe(self, value: Union[DataFrame, None] = None) -> None:
+    def dataframe(self, value: Union["DataFrame", None] = None) -> None:
         """
         Sets the dataframe managed by the object.
         :param value: `Union[DataFrame, None]`
@@ -164,7 +166,7 @@ class CXDataframeData(CXTextData):
             `DataFrame` values.
         """
 
-        if value is not None and not isinstance(value, DataFrame):
+        if value is not None and not is_dataframe(value):
             raise TypeError("The value of dataframe must be a valid DataFrame or None.")
 
         self.dataframe = value
@@ -203,7 +205,7 @@ class CXDataframeData(CXTextData):
 
     def __init__(
         self,
-        data: Union[DataFrame, None] = None,
+        data: Union["DataFrame", None] = None,
         delimiter: str = ",",
     ) -> None:
         """
@@ -0,0 +1,166 @@
+"""
+Packs numeric chart data into compact typed-array form for embedding in
+generated HTML.  JSON text typically needs three to five times as many
+characters as the underlying float data, whereas a base64 encoded `Float64Array`
+needs 10.7 characters per value and a `Float32Array` half that, before optional
+deflate compression.  The browser inflates packed values via the decoder in
+`DECODER_JS` before the CanvasXpress object is created.
+"""
+
+import base64
+import sys
+import zlib
+from array import array
+from typing import Any, Union
+
+TRANSPORT_JSON: str = "json"
+"""
+Data is embedded as JSON text.  The default.
+"""
+
+TRANSPORT_FLOAT64: str = "float64"
+"""
+Numeric matrices are embedded as base64 encoded `Float64Array` data, which is
+lossless for Python `float` values.
+"""
+
+TRANSPORT_FLOAT32: str = "float32"
+"""
+Numeric matrices are embedded as base64 encoded `Float32Array` data, which
+halves the size again at the cost of precision beyond about seven significant
+digits.
+"""
+
+VALID_TRANSPORTS: list = [TRANSPORT_JSON, TRANSPORT_FLOAT64, TRANSPORT_FLOAT32]
+
+_TYPECODES: dict = {TRANSPORT_FLOAT64: "d", TRANSPORT_FLOAT32: "f"}
+
+DECODER_JS: str = """
+window.cxUnpackData = window.cxUnpackData || (async function (declaration) {
+  const unpack = async (packed) => {
+    let bytes = Uint8Array.from(atob(packed.data), (c) => c.charCodeAt(0));
+    if (packed.encoding === "deflate") {
+      const inflated = new Blob([bytes]).stream().pipeThrough(new DecompressionStream("deflate"));
+      bytes = new Uint8Array(await new Response(inflated).arrayBuffer());
+    }
+    const values = packed.cxPacked === "float32"
+      ? new Float32Array(bytes.buffer, bytes.byteOffset, bytes.byteLength / 4)
+      : new Float64Array(bytes.buffer, bytes.byteOffset, bytes.byteLength / 8);
+    const rows = [];
+    for (let row = 0; row < packed.rows; row++) {
+      rows.push(Array.from(values.subarray(row * packed.cols, (row + 1) * packed.cols)));
+    }
+    return rows;
+  };
+  const y = declaration.data && declaration.data.y;
+  if (y && y.data && y.data.cxPacked) {
+    y.data = await unpack(y.data);
+  }
+  return declaration;
+});
+"""
+"""
+Defines `window.cxUnpackData(declaration)`, which resolves to the declaration
+with packed matrices restored to nested arrays.  Safe to include repeatedly.
+"""
+
+
+def pack_matrix(
+    matrix: Any, transport: str = TRANSPORT_FLOAT64, compress: bool = False
+) -> Union[dict, None]:
+    """
+    Packs a rectangular matrix of numbers into typed-array form.
+    :param matrix: `Any`
+        The candidate matrix, typically the `y.data` list of rows.
+    :param transport: `str`
+        `TRANSPORT_FLOAT64` or `TRANSPORT_FLOAT32`.
+    :param compress: `bool`
+        If `True` the bytes are deflate compressed before encoding.
+    :returns: `Union[dict, None]`
+        The packed form, or `None` if the matrix is not a non-empty list of
+        equally sized rows of `int` or `float` values, in which case it should
+        be embedded as JSON.
+    """
+    typecode = _TYPECODES.get(transport)
+    if typecode is None:
+        raise ValueError(f"transport must be one of {list(_TYPECODES.keys())}.")
+
+    if not isinstance(matrix, list) or len(matrix) == 0:
+        return None
+
+    columns = None
+    values = array(typecode)
+    for row in matrix:
+        if not isinstance(row, list):
+            return None
+
+        if columns is None:
+            columns = len(row)
+        elif len(row) != columns:
+            return None
+
+        for value in row:
+            if type(value) not in (int, float):
+                return None
+
+        try:
+            values.extend(row)
+        except (OverflowError, TypeError):
+            return None
+
+    if sys.byteorder != "little":
+        values.byteswap()
+
+    payload = values.tobytes()
+    if compress:
+        payload = zlib.compress(payload)
+
+    return {
+        "cxPacked": transport,
+        "encoding": "deflate" if compress else "base64",
+        "rows": len(matrix),
+        "cols": columns,
+        "data": base64.b64encode(payload).decode("ascii"),
+    }
+
+
+def pack_data(data: Any, transport: str, compress: bool = False) -> Any:
+    """
+    Provides chart data with its `y.data` matrix packed, if possible.
+    :param data: `Any`
+        The data as provided to the CanvasXpress declaration.
+    :param transport: `str`
+        One of `VALID_TRANSPORTS`.
+    :param compress: `bool`
+        If `True` packed bytes are deflate compressed.
+    :returns: `Any`
+        `data` itself if nothing was packed, otherwise a copy sharing all
+        members except the packed matrix.
+    """
+    if transport == TRANSPORT_JSON or not isinstance(data, dict):
+        return data
+
+    y = data.get("y")
+    if not isinstance(y, dict):
+        return data
+
+    packed = pack_matrix(y.get("data"), transport, compress)
+    if packed is None:
+        return data
+
+    return {**data, "y": {**y, "data": packed}}
+
+
+def is_packed(data: Any) -> bool:
+    """
+    Indicates if `pack_data` packed any part of the data.
+    :param data: `Any`
+        The data provided by `pack_data`.
+    :returns: `bool`
+    """
+    return (
+        isinstance(data, dict)
+        and isinstance(data.get("y"), dict)
+        and isinstance(data["y"].get("data"), dict)
+        and "cxPacked" in data["y"]["data"]
+    )
@@ -1,3 +1,4 @@
+import asyncio
 from typing import Any, Union
 
 from canvasxpress.canvas import CanvasXpress
@@ -10,19 +11,11 @@ from canvasxpress.render.environment import (
     CONTEXT_STREAMLIT,
     CONTEXT_BROWSER,
 )
+from canvasxpress.render.cache import CXImageCache, get_default_image_cache
 from canvasxpress.render.image import CXImage
 from canvasxpress.render.json import CXJSON
 from canvasxpress.render.popup import CXBrowserPopup
 
-# Track the runtime context
-_g_context = get_target_context()
-
-if _g_context == CONTEXT_JUPYTER:
-    from canvasxpress.render.jupyter import inject_cx_assets
-    from IPython.core.display_functions import display
-
-    display(inject_cx_assets())
-
 
 def convert_from_reproducible_json(json: str) -> Union[None, CanvasXpress]:
     """
@@ -38,12 +31,46 @@ def convert_to_reproducible_json(canvas: CanvasXpress) -> str:
     return CXJSON.render_to_json(canvas)
 
 
-def convert_to_image(canvas: CanvasXpress, type: str = "png") -> Union[None, bytes]:
+def convert_to_image(
+    canvas: CanvasXpress,
+    type: str = "png",
+    cache: Union[CXImageCache, None] = None,
+) -> Union[None, bytes]:
     """
     Converts the CanvasXpress object to an image of the specified type.
+
+    Images are reused from `cache` if provided, otherwise from the cache
+    configured via the ENV variable `CANVASXPRESS_IMAGE_CACHE_DIR` if set.
+    """
+    converter = CXImage(canvas)
+    candidates = converter.render(
+        format=type,
+        cache=cache if cache is not None else get_default_image_cache(),
+    )
+    for conversion in candidates:
+        if conversion.get("image", {}).get("format") == type:
+            return conversion.get("image", {}).get("binary")
+
+
+async def convert_to_image_async(
+    canvas: CanvasXpress,
+    type: str = "png",
+    cache: Union[CXImageCache, None] = None,
+    semaphore: Union[asyncio.Semaphore, None] = None,
+) -> Union[None, bytes]:
+    """
+    Converts the CanvasXpress object to an image of the specified type without
+    blocking the event loop.
+
+    Caching is as for `convert_to_image`.  A `semaphore` shared by concurrent
+    calls caps the number of NodeJS processes running at once.
     """
     converter = CXImage(canvas)
-    candidates = converter.render(format=type)
+    candidates = await converter.render_async(
+        format=type,
+        cache=cache if cache is not None else get_default_image_cache(),
+        semaphore=semaphore,
+    )
     for conversion in candidates:
         if conversion.get("image", {}).get("format") == type:
             return conversion.get("image", {}).get("binary")
@@ -74,6 +101,8 @@ def graph(canvas: CanvasXpress, debug: bool = False, **kwargs: Any) -> Any:
     :returns: An `object` or `None` depending on the target context.  In the case of `browser` a popup browser will
         be launched.`
     """
+    _g_context = get_target_context()
+
     if _g_context == CONTEXT_RSTUDIO:
         from canvasxpress.render.shiny import CXShinyWidget
 
@@ -111,7 +140,7 @@ def graph(canvas: CanvasXpress, debug: bool = False, **kwargs: Any) -> Any:
 
     elif _g_context == CONTEXT_BROWSER:
         plotter = CXBrowserPopup(canvas)
-        plotter.render(kwargs)
+        plotter.render(**kwargs)
 
     else:
         return """
@@ -0,0 +1,297 @@
+import hashlib
+import os
+import threading
+from pathlib import Path
+from tempfile import NamedTemporaryFile, gettempdir
+from typing import Union
+
+from canvasxpress.canvas import CanvasXpress
+
+IMAGE_CACHE_DIR_ENV: str = "CANVASXPRESS_IMAGE_CACHE_DIR"
+"""
+The ENV variable that, if set, names the directory of the image cache used by
+default by `canvasxpress.plot.convert_to_image`.
+"""
+
+DEFAULT_IMAGE_CACHE_BYTES: int = 256 * 1024 * 1024
+"""
+The default size limit of an image cache.
+"""
+
+
+class CXImageCache:
+    """
+    CXImageCache keeps rendered chart images on disk, addressed by the
+    `CanvasXpress.fingerprint` of the chart together with the image format and
+    dimensions, so that regenerating an unchanged chart does not require
+    NodeJS.  The least recently used images are removed once the cache exceeds
+    its size limit.  Entries are written atomically, so a cache directory can
+    be shared by concurrent threads and processes.
+
+    Example:
+    ```python
+    cache = CXImageCache("/var/cache/charts")
+    images = CXImage(chart).render(format="png", cache=cache)
+    print(cache.hits, cache.misses)
+    ```
+    """
+
+    __directory: Path = None
+    """
+    The directory in which images are kept.
+    """
+
+    __max_bytes: int = DEFAULT_IMAGE_CACHE_BYTES
+    """
+    The size limit of the cache.
+    """
+
+    __hits: int = 0
+    """
+    The number of lookups answered by the cache.
+    """
+
+    __misses: int = 0
+    """
+    The number of lookups not answered by the cache.
+    """
+
+    __total_bytes: Union[int, None] = None
+    """
+    The size of the cache when last measured plus that of the images added
+    since, or `None` until the directory is first measured.
+    """
+
+    __lock: threading.Lock = None
+    """
+    Guards the counters and eviction.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path, None] = None,
+        max_bytes: int = DEFAULT_IMAGE_CACHE_BYTES,
+    ) -> None:
+        """
+        Initializes a new cache, creating the directory if required.
+        :param directory: `Union[str, Path, None]`
+            The directory in which to keep images.  `None` uses a directory
+            within the system's temporary directory.
+        :param max_bytes: `int`
+            The size limit of the cache.  Must be positive.
+        """
+        if not isinstance(max_bytes, int) or max_bytes <= 0:
+            raise ValueError("max_bytes must be a positive int.")
+
+        if directory is None:
+            directory = Path(gettempdir()) / "canvasxpress-python-image-cache"
+
+        self.__directory = Path(directory)
+        self.__directory.mkdir(parents=True, exist_ok=True)
+        self.__max_bytes = max_bytes
+        self.__lock = threading.Lock()
+
+    @property
+    def directory(self) -> Path:
+        """
+        Provides the directory in which images are kept.
+        :returns: `Path`
+        """
+        return self.__directory
+
+    @property
+    def max_bytes(self) -> int:
+        """
+        Provides the size limit of the cache.
+        :returns: `int`
+        """
+        return self.__max_bytes
+
+    @property
+    def hits(self) -> int:
+        """
+        Provides the number of lookups answered by this cache object.
+        :returns: `int`
+        """
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        """
+        Provides the number of lookups not answered by this cache object.
+        :returns: `int`
+        """
+        return self.__misses
+
+    @staticmethod
+    def key(
+        cx: CanvasXpress,
+        format: str,
+        width: Union[int, None] = None,
+        height: Union[int, None] = None,
+    ) -> str:
+        """
+        Provides the cache key for an image of a chart.  The key is derived
+        from `CanvasXpress.fingerprint`, so it does not depend on the order of
+        dict keys or on the generated ID of an anonymous chart.
+        :param cx: `CanvasXpress`
+            The chart.
+        :param format: `str`
+            The image format.
+        :param width: `Union[int, None]`
+            The optional image width.
+        :param height: `Union[int, None]`
+            The optional image height.
+        :returns: `str`
+            A hexadecimal digest.
+        """
+        digest = hashlib.sha256()
+        digest.update(f"{format}:{width}:{height}:".encode("utf-8"))
+        digest.update(cx.fingerprint().encode("utf-8"))
+
+        return digest.hexdigest()
+
+    def __path(self, key: str, format: str) -> Path:
+        """
+        Provides the path of the image with the given key and format.
+        """
+        return self.__directory / f"{key}.{format}"
+
+    def get(self, key: str, format: str) -> Union[bytes, None]:
+        """
+        Provides the cached image for the key, if any, and marks it as
+        recently used.
+        :param key: `str`
+            The key provided by `key`.
+        :param format: `str`
+            The image format.
+        :returns: `Union[bytes, None]`
+            The image, or `None` if it is not cached.
+        """
+        path = self.__path(key, format)
+        try:
+            image = path.read_bytes()
+            os.utime(path)
+
+        except OSError:
+            image = None
+
+        with self.__lock:
+            if image is None:
+                self.__misses += 1
+            else:
+                self.__hits += 1
+
+        return image
+
+    def put(self, key: str, format: str, image: bytes) -> None:
+        """
+        Adds an image to the cache and removes the least recently used images
+        if the size limit is exceeded.  The directory is only scanned when the
+        running total of image sizes exceeds the limit.
+        :param key: `str`
+            The key provided by `key`.
+        :param format: `str`
+            The image format.
+        :param image: `bytes`
+            The image.
+        """
+        path = self.__path(key, format)
+        with NamedTemporaryFile(
+            dir=self.__directory, suffix=".tmp", delete=False
+        ) as temp_file:
+            temp_file.write(image)
+
+        with self.__lock:
+            try:
+                replaced_bytes = path.stat().st_size
+            except OSError:
+                replaced_bytes = 0
+
+            os.replace(temp_file.name, path)
+
+            if self.__total_bytes is None:
+                self.__total_bytes = sum(
+                    status.st_size for _, status in self.__entries()
+                )
+            else:
+                self.__total_bytes += len(image) - replaced_bytes
+
+            if self.__total_bytes > self.__max_bytes:
+                self.__evict()
+
+    def clear(self) -> None:
+        """
+        Removes all cached images.
+        """
+        with self.__lock:
+            for path, _ in self.__entries():
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+
+            self.__total_bytes = None
+
+    def __entries(self) -> list:
+        """
+        Provides the cached images and their status, ignoring writes in
+        progress.
+        """
+        entries = list()
+        for path in self.__directory.iterdir():
+            if path.suffix == ".tmp":
+                continue
+
+            try:
+                entries.append((path, path.stat()))
+            except OSError:
+                pass
+
+        return entries
+
+    def __evict(self) -> None:
+        """
+        Removes the least recently used images until the cache is within its
+        size limit.  The directory is measured again as other processes may
+        share it.  Must be called with the lock held.
+        """
+        entries = self.__entries()
+        total_bytes = sum(status.st_size for _, status in entries)
+
+        entries.sort(key=lambda entry: entry[1].st_mtime)
+        for path, status in entries:
+            if total_bytes <= self.__max_bytes:
+                break
+
+            try:
+                path.unlink()
+                total_bytes -= status.st_size
+            except OSError:
+                pass
+
+        self.__total_bytes = total_bytes
+
+
+_default_image_cache: Union[CXImageCache, None] = None
+
+
+def get_default_image_cache() -> Union[CXImageCache, None]:
+    """
+    Provides the image cache configured via the `CANVASXPRESS_IMAGE_CACHE_DIR`
+    ENV variable.
+    :returns: `Union[CXImageCache, None]`
+        The shared cache, or `None` if the ENV variable is not set.
+    """
+    global _default_image_cache
+
+    directory = os.environ.get(IMAGE_CACHE_DIR_ENV)
+    if not directory:
+        return None
+
+    if _default_image_cache is None or _default_image_cache.directory != Path(
+        directory
+    ):
+        _default_image_cache = CXImageCache(directory)
+
+    return _default_image_cache
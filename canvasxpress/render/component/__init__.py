@@ -0,0 +1,6 @@
+"""
+The browser side of the live Streamlit component provided by
+`canvasxpress.render.streamlit.plot_live`.  `index.html` implements the
+Streamlit component messaging protocol without a build step, so it is shipped
+as package data.
+"""
@@ -4,12 +4,93 @@ rich integration with Plotly's Dash framework.
 """
 
 import json
+from collections import OrderedDict
+from threading import Lock
 from typing import List, Union, Any
 
+from dash import Patch, no_update
+
 from canvasxpress.canvas import CanvasXpress
 from canvasxpress.render.base import CXRenderFactory
+from canvasxpress.util.fingerprint import (
+    content_hash,
+    fingerprint_values,
+    serialize_data,
+)
 from cxdash import CXDashElement
 
+UPDATABLE_PROPS: list = [
+    "data",
+    "config",
+    "events",
+    "after_render",
+    "width",
+    "height",
+]
+"""
+The `CXDashElement` properties that are compared to provide partial updates.
+"""
+
+RENDERED_HASH_CACHE_SIZE: int = 128
+"""
+The number of charts for which the content hashes of the rendered data and
+config are retained, so that `update` need not render a previous state again.
+"""
+
+_rendered_hashes: OrderedDict = OrderedDict()
+"""
+The content hashes of rendered data and config, keyed by chart fingerprint.
+"""
+
+_rendered_hashes_lock = Lock()
+
+
+def _hash_rendered(value: Any) -> str:
+    """
+    Provides a content hash for rendered data or config, falling back to the
+    JSON string for values that cannot be pickled.
+    :param value: `Any`
+    :returns: `str`
+    """
+    return content_hash(value) or content_hash(json.dumps(value))
+
+
+def _rendered_parts(cx: CanvasXpress, fingerprint: str, render: bool) -> tuple:
+    """
+    Provides the content hashes of the data and config rendered for a chart,
+    and optionally the rendered element parts.
+    :param cx: `CanvasXpress`
+        The chart.
+    :param fingerprint: `str`
+        The fingerprint of the chart.
+    :param render: `bool`
+        Whether the element parts are required even if the hashes are known.
+    :returns: `tuple` of the hashes, keyed by property, and the element parts
+        or `None`
+    """
+    with _rendered_hashes_lock:
+        hashes = _rendered_hashes.get(fingerprint)
+        if hashes is not None:
+            _rendered_hashes.move_to_end(fingerprint)
+
+    if hashes is not None and not render:
+        return hashes, None
+
+    element_parts = cx.prepare_html_element_parts()
+    hashes = {
+        "data": _hash_rendered(element_parts["data"]),
+        "config": _hash_rendered(
+            {**element_parts["config"], **element_parts["otherParams"]}
+        ),
+    }
+
+    with _rendered_hashes_lock:
+        _rendered_hashes[fingerprint] = hashes
+        while len(_rendered_hashes) > RENDERED_HASH_CACHE_SIZE:
+            _rendered_hashes.popitem(last=False)
+
+    return hashes, element_parts
+
 
 class CXElementFactory(CXRenderFactory):
     """
@@ -28,6 +109,137 @@ class CXElementFactory(CXRenderFactory):
         """
         super().__init__(*cx)
 
+    @classmethod
+    def render_props(cls, cx: CanvasXpress) -> dict:
+        """
+        Provides the `CXDashElement` properties that represent the provided
+        CanvasXpress object.
+        :param cx: `CanvasXpress` The CanvasXpress object to convert.
+        :returns: `dict` The properties, keyed by name.
+        """
+        element_parts = cx.prepare_html_element_parts()
+
+        return {
+            "id": element_parts["renderTo"],
+            "data": serialize_data(element_parts["data"]),
+            "config": json.dumps(
+                {**element_parts["config"], **element_parts["otherParams"]}
+            ),
+            "events": element_parts["events"],
+            "after_render": json.dumps(element_parts["afterRender"]),
+            "js_url": cx.js_library_url(),
+            "css_url": cx.css_library_url(),
+            "width": str(element_parts["width"]),
+            "height": str(element_parts["height"]),
+        }
+
+    @classmethod
+    def update(cls, previous: CanvasXpress, current: CanvasXpress) -> dict:
+        """
+        Provides the properties of a rendered `CXDashElement` that differ
+        between two states of a chart, so that a callback only sends what
+        changed.  Changes are recognized by `CanvasXpress.fingerprint`, the
+        data and config are rendered only if their sources changed, and only
+        the properties that changed are serialized.  The content hashes of
+        recently rendered states are retained so that the previous state is
+        usually not rendered again.
+        :param previous: `CanvasXpress`
+            The state that was last rendered.  This must be a distinct object
+            from `current`, such as the object built by the previous callback.
+        :param current: `CanvasXpress`
+            The new state.
+        :returns: `dict`
+            The changed properties among `UPDATABLE_PROPS`, keyed by name.
+        """
+        if previous is None or current is None:
+            raise ValueError("previous and current cannot be None.")
+
+        previous_fingerprint = previous.fingerprint()
+        current_fingerprint = current.fingerprint()
+        if previous_fingerprint == current_fingerprint:
+            return {}
+
+        changes = {}
+
+        if previous.events.render_to_js() != current.events.render_to_js():
+            changes["events"] = current.events.render_to_js()
+
+        after_render = current.after_render.render_to_list()
+        if previous.after_render.render_to_list() != after_render:
+            changes["after_render"] = json.dumps(after_render)
+
+        for prop in ["width", "height"]:
+            if getattr(previous, prop) != getattr(current, prop):
+                changes[prop] = str(getattr(current, prop))
+
+        # The data and config are rendered together, as profiles and point
+        # budgets can adjust either according to the other
+        sources = [
+            fingerprint_values(
+                cx.data_fingerprint(),
+                cx.config.render_to_dict(),
+                cx.other_init_params.render_to_dict(),
+            )
+            for cx in [previous, current]
+        ]
+        if sources[0] != sources[1]:
+            before, _ = _rendered_parts(previous, previous_fingerprint, False)
+            after, element_parts = _rendered_parts(current, current_fingerprint, True)
+
+            if before["config"] != after["config"]:
+                changes["config"] = json.dumps(
+                    {**element_parts["config"], **element_parts["otherParams"]}
+                )
+
+            if before["data"] != after["data"]:
+                changes["data"] = serialize_data(element_parts["data"])
+
+        return {prop: changes[prop] for prop in UPDATABLE_PROPS if prop in changes}
+
+    @classmethod
+    def patch(cls, previous: CanvasXpress, current: CanvasXpress) -> Patch:
+        """
+        Provides a Dash `Patch` that updates a rendered `CXDashElement` from
+        one state of a chart to another.  The `Patch` applies to an `Output`
+        whose value is the element itself, such as the `children` of a
+        container holding only the chart.  See `update`.
+        :param previous: `CanvasXpress`
+            The state that was last rendered.
+        :param current: `CanvasXpress`
+            The new state.
+        :returns: `Patch`
+        """
+        patch = Patch()
+        for prop, value in cls.update(previous, current).items():
+            patch["props"][prop] = value
+
+        return patch
+
+    @classmethod
+    def update_outputs(
+        cls, previous: CanvasXpress, current: CanvasXpress, *props: str
+    ) -> tuple:
+        """
+        Provides the values for a callback with one `Output` per property of a
+        rendered `CXDashElement`, such as `Output("chart", "config")` and
+        `Output("chart", "data")`.  Unchanged properties are `no_update`.
+        See `update`.
+        :param previous: `CanvasXpress`
+            The state that was last rendered.
+        :param current: `CanvasXpress`
+            The new state.
+        :param props: `str`
+            The properties, in the order of the `Output` declarations.
+        :returns: `tuple`
+        """
+        for prop in props:
+            if prop not in UPDATABLE_PROPS:
+                raise ValueError(f"props must be among {UPDATABLE_PROPS}.")
+
+        changes = cls.update(previous, current)
+
+        return tuple(changes.get(prop, no_update) for prop in props)
+
     @classmethod
     def render(cls, cx: CanvasXpress) -> CXDashElement:
         """
@@ -38,24 +250,7 @@ class CXElementFactory(CXRenderFactory):
         :returns: `CXDashElement` A CXDashElement with the configuration as represented
             by cx.
         """
-        element_parts = cx.prepare_html_element_parts()
-        dash_element = CXDashElement(
-            id=element_parts["renderTo"],
-            data=(
-                element_parts["data"]
-                if isinstance(element_parts["data"], str)
-                else json.dumps(element_parts["data"])
-            ),
-            config=json.dumps(
-                {**element_parts["config"], **element_parts["otherParams"]}
-            ),
-            events=element_parts["events"],
-            after_render=json.dumps(element_parts["afterRender"]),
-            js_url=cx.js_library_url(),
-            css_url=cx.css_library_url(),
-            width=str(element_parts["width"]),
-            height=str(element_parts["height"]),
-        )
+        dash_element = CXDashElement(**cls.render_props(cx))
 
         return dash_element
 
@@ -2,6 +2,9 @@
 This module provides functionality for detecting the platform context that is active, such as RStudio.
 """
 import os
+import sys
+from functools import lru_cache
+from importlib.util import find_spec
 from os import environ
 
 CANVASXPRESS_TARGET_CONTEXT: str = "CANVASXPRESS_TARGET_CONTEXT"
@@ -34,56 +37,64 @@ VALID_CONTEXTS: list = [
 ]
 
 
-def is_rstudio_active() -> bool:
+def is_module_installed(name: str) -> bool:
     """
-    Indicates if RStudio is active at the time of function call.
-    :returns" `bool` `True` if the RStudio IDE is running.
+    Indicates if a module can be imported, without importing it.
+    :param name: `str`
+        The fully qualified name of the module.
+    :returns: `bool` `True` if the module is installed.
     """
     try:
-        import shiny
-
-        return bool(environ.get("RSTUDIO", False))
+        return find_spec(name) is not None
 
-    except ModuleNotFoundError:
+    except (ImportError, ValueError):
         return False
 
 
+def is_rstudio_active() -> bool:
+    """
+    Indicates if RStudio is active at the time of function call.
+    :returns" `bool` `True` if the RStudio IDE is running.
+    """
+    return bool(environ.get("RSTUDIO", False)) and is_module_installed("shiny")
+
+
 def is_shiny_available() -> bool:
     """
     Indicates if shiny is available at the time of function call.
     :returns" `bool` `True` if shiny is available.
     """
-    try:
-        import shiny
-
-        return os.environ.get("SHINY_HOST") is not None
-
-    except ModuleNotFoundError:
-        return False
+    return os.environ.get("SHINY_HOST") is not None and is_module_installed("shiny")
 
 
 def is_dash_available() -> bool:
     """
-    Indicates if dash is available at the time of function call.
+    Indicates if dash is available at the time of function call.  A Dash app
+    can only exist if the app has already imported dash, so dash is never
+    imported by this check.
     :returns" `bool` `True` if dash is available.
     """
-    try:
-        import dash
+    dash = sys.modules.get("dash")
+    if dash is None:
+        return False
 
+    try:
         return dash.get_app() is not None
 
-    except ModuleNotFoundError:
-        return False
-
     except Exception:
         return False
 
 
 def is_ipython_available() -> bool:
     """
-    Indicates if IPython is available at the time of function call.
+    Indicates if IPython is available at the time of function call.  A
+    notebook kernel always has IPython loaded, so IPython is never imported by
+    this check.
     :returns" `bool` `True` if IPython is available.
     """
+    if "IPython" not in sys.modules:
+        return False
+
     try:
         from IPython import get_ipython
 
@@ -97,56 +108,50 @@ def is_ipython_available() -> bool:
         else:
             return False  # Other type (?)
 
-    except NameError:
+    except (ImportError, NameError):
         return False
 
-    # try:
-    #     from IPython import get_ipython
-    #
-    #     return get_ipython().__class__.__name__ != "NoneType"
-    #
-    # except ModuleNotFoundError:
-    #     return False
-    #
-    # except NameError:
-    #     return False
-
 
 def is_streamlit_available() -> bool:
     """
     Indicates if streamlit is available at the time of function call.
     :returns" `bool` `True` if streamlit is available.
     """
-    try:
-        import streamlit
+    return is_module_installed("streamlit")
 
-        return True
 
-    except ModuleNotFoundError:
-        return False
+@lru_cache(maxsize=None)
+def detect_target_context() -> str:
+    """
+    Probes the runtime for the context that should be targetted for
+    illustrating charts.  Probing happens once per process; use
+    `detect_target_context.cache_clear()` to probe again.
+    :returns" `str` One of the options for VALID_CONTEXTS, or CONTEXT_UNKNOWN.
+    """
+    if is_ipython_available():
+        return CONTEXT_JUPYTER
+    if is_dash_available():
+        return CONTEXT_DASH
+    if is_rstudio_active():
+        return CONTEXT_RSTUDIO
+    if is_shiny_available():
+        return CONTEXT_SHINY
+    if is_streamlit_available():
+        return CONTEXT_STREAMLIT
+
+    return CONTEXT_UNKNOWN
 
 
 def get_target_context() -> str:
     """
-    Indicates the runtime context that should be targetted for illustrating charts.
-    :returns" `str` One of the options for VALID_CONTEXTS.
+    Indicates the runtime context that should be targetted for illustrating
+    charts.  A `CANVASXPRESS_TARGET_CONTEXT` ENV variable takes precedence and
+    avoids any probing, otherwise see `detect_target_context`.
+    :returns" `str` One of the options for VALID_CONTEXTS, or CONTEXT_UNKNOWN.
     """
     target = environ.get(CANVASXPRESS_TARGET_CONTEXT)
 
     if target is not None:
-        if target in VALID_CONTEXTS:
-            return target
-
-    else:
-        if is_ipython_available():
-            return CONTEXT_JUPYTER
-        if is_dash_available():
-            return CONTEXT_DASH
-        if is_rstudio_active():
-            return CONTEXT_RSTUDIO
-        if is_shiny_available():
-            return CONTEXT_SHINY
-        if is_streamlit_available():
-            return CONTEXT_STREAMLIT
-
-        return CONTEXT_UNKNOWN
+        return target if target in VALID_CONTEXTS else CONTEXT_UNKNOWN
+
+    return detect_target_context()
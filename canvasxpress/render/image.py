@@ -1,13 +1,20 @@
+import asyncio
+import functools
 import os
+import shutil
 import subprocess
 import json
-from typing import Any, Union, List
-from tempfile import gettempdir
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, AsyncIterator, Iterator, Union, List
+from tempfile import TemporaryDirectory, mkdtemp
 from pathlib import Path
 
 from canvasxpress.canvas import CanvasXpress
 from canvasxpress.render.base import CXRenderable
 from canvasxpress.render.json import CXJSON
+from canvasxpress.render.popup import _cx_fx_template, _cx_html_template
 
 PNG_IMAGE: str = "png"
 SVG_IMAGE: str = "svg"
@@ -66,15 +73,74 @@ def nodejs_modules_path() -> Path:
 
 CX_NODEJS_PATH: Path = None
 
+_CX_NODEJS_PATH_LOCK = threading.Lock()
+
 
 def get_nodejs_path() -> str:
     global CX_NODEJS_PATH
-    if CX_NODEJS_PATH is None:
-        CX_NODEJS_PATH = nodejs_modules_path() / "canvasxpress-cli/bin/canvasxpress"
+    with _CX_NODEJS_PATH_LOCK:
+        if CX_NODEJS_PATH is None:
+            CX_NODEJS_PATH = nodejs_modules_path() / "canvasxpress-cli/bin/canvasxpress"
 
     return CX_NODEJS_PATH
 
 
+def _size_arguments(width: Union[int, None], height: Union[int, None]) -> list:
+    """
+    Provides the canvasxpress-cli arguments for the optional image dimensions.
+    :param width: `Union[int, None]`
+        The image width, if any.
+    :param height: `Union[int, None]`
+        The image height, if any.
+    :returns: `list`
+        The arguments to append to the command.
+    """
+    if not (isinstance(width, int) or width is None):
+        raise ValueError("width must be an int or None.")
+
+    if not (isinstance(height, int) or height is None):
+        raise ValueError("height must be an int or None.")
+
+    arguments = []
+    if width is not None:
+        arguments.extend(["-x", str(width)])
+    if height is not None:
+        arguments.extend(["-y", str(height)])
+
+    return arguments
+
+
+def _collect_images(work_image_path: Path, image_format: str, image_id=None) -> list:
+    """
+    Reads the images of the indicated format produced in a working directory.
+    :param work_image_path: `Path`
+        The directory given to canvasxpress-cli for output.
+    :param image_format: `str`
+        The format of the images to collect.
+    :param image_id: `Union[str, None]`
+        The ID to report for each image, or `None` to use the file names.
+    :returns: `list`
+        A `list[dict]` of image data.
+    """
+    rendered_images: list = []
+    for image_file_path in sorted(work_image_path.glob(f"**/*.{image_format}")):
+        rendered_images.append(
+            {
+                "id": (
+                    image_id
+                    if image_id is not None
+                    else os.path.basename(os.path.splitext(image_file_path)[0])
+                ),
+                "image": {
+                    "binary": image_file_path.read_bytes(),
+                    "format": image_format,
+                },
+            }
+        )
+
+    return rendered_images
+
+
 def render_html_as_image(
     url: str,
     format: Union[str, list] = PNG_IMAGE,
@@ -91,20 +157,7 @@ def render_html_as_image(
         A `list[dict]` of image data, if any.
     """
     formats = format if isinstance(format, list) else [format]
-
-    if not (isinstance(width, int) or width is None):
-        raise ValueError("width must be an int or None.")
-    elif width is None:
-        width_text = ""
-    else:
-        width_text = f" -x {width}"
-
-    if not (isinstance(height, int) or height is None):
-        raise ValueError("height must be an int or None.")
-    elif height is None:
-        height_text = ""
-    else:
-        height_text = f" -y {height}"
+    size_arguments = _size_arguments(width, height)
 
     rendered_images: list = []
     for image_format in formats:
@@ -113,45 +166,322 @@ def render_html_as_image(
                 "format must be one of PNG_IMAGE or SVG_IMAGE, or a list of each."
             )
 
-        work_dir = Path(gettempdir()) / "canvasxpress-python"
-        work_dir.mkdir(exist_ok=True)
-        work_image_path = work_dir
+        with TemporaryDirectory(prefix="canvasxpress-python-") as work_dir:
+            work_image_path = Path(work_dir)
 
-        try:
-            result = subprocess.run(
-                [
-                    f"{get_nodejs_path()} {image_format}{width_text}{height_text} -i {url} -o {work_image_path}"
-                ],
-                shell=True,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                timeout=MAX_NODE_WAIT_SECONDS,
-            )
-            if result.returncode == 0:
-
-                image_file_options = list(work_image_path.glob(f"**/*.{image_format}"))
-                for image_file_path in image_file_options:
-                    with open(Path(image_file_path), "rb") as image_file:
-                        image: bytes = image_file.read()
-                    image_file_path.unlink()
-                    rendered_images.append(
-                        {
-                            "id": os.path.basename(
-                                os.path.splitext(image_file_path)[0]
-                            ),
-                            "image": {
-                                "binary": image,
-                                "format": image_format,
-                            },
-                        }
+            try:
+                result = subprocess.run(
+                    [str(get_nodejs_path()), image_format]
+                    + size_arguments
+                    + ["-i", url, "-o", str(work_image_path)],
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    timeout=MAX_NODE_WAIT_SECONDS,
+                )
+                if result.returncode == 0:
+                    rendered_images.extend(
+                        _collect_images(work_image_path, image_format)
                     )
 
-        except subprocess.TimeoutExpired as te:
-            pass
+            except subprocess.TimeoutExpired as te:
+                pass
 
     return rendered_images
 
 
+def render_json_as_image(
+    reproducible_json: str,
+    format: str = PNG_IMAGE,
+    width: Union[int, None] = None,
+    height: Union[int, None] = None,
+    check: bool = False,
+) -> list:
+    """
+    Renders reproducible JSON into an image using canvasxpress-cli.  Each call
+    uses its own working directory so that concurrent calls, whether from
+    threads or processes, cannot overwrite each other's input or collect each
+    other's images.
+    :param reproducible_json: `str`
+        The JSON produced by `CXJSON.render_to_json`.
+    :param format: `str`
+        `PNG_IMAGE` or `SVG_IMAGE`.
+    :param width: `Union[int, None]`
+        The optional image width.
+    :param height: `Union[int, None]`
+        The optional image height.
+    :param check: `bool`
+        Default `False`.  Indicate if a failure of canvasxpress-cli should
+        raise rather than produce an empty list.
+    :returns: `list`
+        A `list[dict]` of image data identified by the `renderTo` of the JSON,
+        which is empty if canvasxpress-cli fails.
+    :raises RuntimeError:
+        If `check` is `True` and canvasxpress-cli fails, with its output.
+    """
+    if format not in [PNG_IMAGE, SVG_IMAGE]:
+        raise ValueError("format must be one of PNG_IMAGE or SVG_IMAGE.")
+
+    size_arguments = _size_arguments(width, height)
+    render_to = json.loads(reproducible_json).get("renderTo", "anonymous")
+
+    with TemporaryDirectory(prefix="canvasxpress-python-") as work_dir:
+        work_json_path = Path(work_dir, "cx_data.json")
+        work_image_path = Path(work_dir, "images")
+        work_image_path.mkdir()
+
+        with open(work_json_path, "w") as json_temp_file:
+            json_temp_file.write(reproducible_json)
+
+        result = subprocess.run(
+            [str(get_nodejs_path()), format]
+            + size_arguments
+            + ["-i", str(work_json_path), "-o", str(work_image_path)],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            timeout=MAX_NODE_WAIT_SECONDS,
+        )
+        if result.returncode != 0:
+            if check:
+                raise RuntimeError(
+                    "canvasxpress-cli failed: "
+                    f"{result.stdout.decode('utf-8', 'replace')}"
+                )
+
+            return []
+
+        return _collect_images(work_image_path, format, render_to)
+
+
+async def render_json_as_image_async(
+    reproducible_json: str,
+    format: str = PNG_IMAGE,
+    width: Union[int, None] = None,
+    height: Union[int, None] = None,
+    timeout: float = MAX_NODE_WAIT_SECONDS,
+    check: bool = False,
+) -> list:
+    """
+    Renders reproducible JSON into an image using canvasxpress-cli without
+    blocking the event loop.  The process is started without a shell and is
+    killed if it exceeds the timeout or if the awaiting task is cancelled.
+    :param reproducible_json: `str`
+        The JSON produced by `CXJSON.render_to_json`.
+    :param format: `str`
+        `PNG_IMAGE` or `SVG_IMAGE`.
+    :param width: `Union[int, None]`
+        The optional image width.
+    :param height: `Union[int, None]`
+        The optional image height.
+    :param timeout: `float`
+        The number of seconds canvasxpress-cli may take.
+    :param check: `bool`
+        Default `False`.  Indicate if a failure of canvasxpress-cli should
+        raise rather than produce an empty list.
+    :returns: `list`
+        A `list[dict]` of image data identified by the `renderTo` of the JSON,
+        which is empty if canvasxpress-cli fails.
+    :raises TimeoutError:
+        If canvasxpress-cli does not finish in time.
+    :raises RuntimeError:
+        If `check` is `True` and canvasxpress-cli fails, with its output.
+    """
+    if format not in [PNG_IMAGE, SVG_IMAGE]:
+        raise ValueError("format must be one of PNG_IMAGE or SVG_IMAGE.")
+
+    size_arguments = _size_arguments(width, height)
+    render_to = json.loads(reproducible_json).get("renderTo", "anonymous")
+
+    # The first call may install canvasxpress-cli, and the files are written
+    # and read by blocking calls, so keep all but the wait off the loop
+    loop = asyncio.get_event_loop()
+    nodejs_path, work_dir = await loop.run_in_executor(
+        None, _prepare_async_work_dir, reproducible_json
+    )
+
+    try:
+        work_json_path = Path(work_dir, "cx_data.json")
+        work_image_path = Path(work_dir, "images")
+
+        process = await asyncio.create_subprocess_exec(
+            str(nodejs_path),
+            format,
+            *size_arguments,
+            "-i",
+            str(work_json_path),
+            "-o",
+            str(work_image_path),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+        )
+
+        try:
+            output, _ = await asyncio.wait_for(process.communicate(), timeout)
+
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"canvasxpress-cli did not finish within {timeout}s.")
+
+        finally:
+            if process.returncode is None:
+                process.kill()
+                await asyncio.shield(process.wait())
+
+        if process.returncode != 0:
+            if check:
+                raise RuntimeError(
+                    f"canvasxpress-cli failed: {output.decode('utf-8', 'replace')}"
+                )
+
+            return []
+
+        return await loop.run_in_executor(
+            None, _collect_images, work_image_path, format, render_to
+        )
+
+    finally:
+        await asyncio.shield(
+            loop.run_in_executor(
+                None, functools.partial(shutil.rmtree, work_dir, ignore_errors=True)
+            )
+        )
+
+
+def _prepare_async_work_dir(reproducible_json: str) -> tuple:
+    """
+    Provides the canvasxpress-cli path and a new working directory holding the
+    reproducible JSON for `render_json_as_image_async`, which must remove the
+    directory.
+    :param reproducible_json: `str`
+        The JSON produced by `CXJSON.render_to_json`.
+    :returns: `tuple` of the canvasxpress-cli path and the directory path
+    """
+    nodejs_path = get_nodejs_path()
+
+    work_dir = mkdtemp(prefix="canvasxpress-python-")
+    try:
+        Path(work_dir, "images").mkdir()
+        with open(Path(work_dir, "cx_data.json"), "w") as json_temp_file:
+            json_temp_file.write(reproducible_json)
+
+    except Exception:
+        shutil.rmtree(work_dir, ignore_errors=True)
+        raise
+
+    return nodejs_path, work_dir
+
+
+def _find_cached_images(
+    cache, chart: CanvasXpress, reproducible_json: str, image_format: str
+) -> tuple:
+    """
+    Looks up the image for a job in an optional `CXImageCache`.
+    :param cache: `Union[CXImageCache, None]`
+        The cache to consult, if any.
+    :param chart: `CanvasXpress`
+        The chart of the job.
+    :param reproducible_json: `str`
+        The JSON of the job, which provides the ID of a cached image.
+    :param image_format: `str`
+        The format of the job.
+    :returns: `tuple`
+        The cache key, or `None` without a cache, and the cached images, or
+        `None` if the job must be rendered.
+    """
+    if cache is None:
+        return None, None
+
+    key = cache.key(chart, image_format)
+    image = cache.get(key, image_format)
+    if image is None:
+        return key, None
+
+    return key, [
+        {
+            "id": json.loads(reproducible_json).get("renderTo", "anonymous"),
+            "image": {
+                "binary": image,
+                "format": image_format,
+            },
+        }
+    ]
+
+
+def _store_cached_images(cache, key: str, image_format: str, images: list) -> None:
+    """
+    Adds the image rendered for a job to an optional `CXImageCache`.
+    :param cache: `Union[CXImageCache, None]`
+        The cache to update, if any.
+    :param key: `str`
+        The key provided by `_find_cached_images`.
+    :param image_format: `str`
+        The format of the job.
+    :param images: `list`
+        The images rendered for the job.  Only a single image is cached.
+    """
+    if cache is not None and len(images) == 1:
+        cache.put(key, image_format, images[0]["image"]["binary"])
+
+
+@contextmanager
+def _fixed_render_to(cx: CanvasXpress, render_to: str) -> Iterator[None]:
+    """
+    Gives an anonymous chart the indicated ID while it is rendered, so that
+    each rendering step reports the same ID rather than a new one per read.
+    :param cx: `CanvasXpress`
+        The chart.
+    :param render_to: `str`
+        An ID previously read from the chart.
+    """
+    if not cx.anonymous:
+        yield
+        return
+
+    cx.render_to = render_to
+    try:
+        yield
+
+    finally:
+        cx.render_to = None
+
+
+def _batch_page_html(charts: List[CanvasXpress], render_targets: List[str]) -> str:
+    """
+    Provides a Web page declaring each of the charts, suitable for rendering
+    all of them with one invocation of canvasxpress-cli per image format.
+    :param charts: `List[CanvasXpress]`
+        The charts.
+    :param render_targets: `List[str]`
+        The distinct ID to use for each chart.
+    :returns: `str`
+        The HTML of the page.
+    """
+    html_parts = []
+    for chart, render_to in zip(charts, render_targets):
+        with _fixed_render_to(chart, render_to):
+            html_parts.append(chart.render_to_html_parts())
+
+    cx_license = ""
+    for part in html_parts:
+        if part.get("cx_license"):
+            cx_license = part["cx_license"]
+            break
+
+    return (
+        _cx_html_template.replace(
+            "@canvases@",
+            "\n".join(f"<div>{part['cx_canvas']}</div>" for part in html_parts),
+        )
+        .replace("@canvasxpress_license@", cx_license)
+        .replace(
+            "@js_functions@",
+            "\n".join(
+                _cx_fx_template.replace("@code@", part["cx_js"]) for part in html_parts
+            ),
+        )
+        .replace("@css_url@", CanvasXpress.css_library_url())
+        .replace("@js_url@", CanvasXpress.js_library_url())
+    )
+
+
 class CXImage(CXRenderable):
     """
     CXPng is a `CXRenderable` that renders `CanvasXpress` objects into PNG images without the need for a Web session
@@ -170,67 +500,276 @@ class CXImage(CXRenderable):
         """
         super().__init__(*cx)
 
+    def __prepare_jobs(self, kwargs: dict) -> tuple:
+        """
+        Validates the rendering options and lists the images to be produced.
+        :param kwargs: `dict`
+            The options given to `render` or `render_async`.
+        :returns: `tuple`
+            The `(chart, render_to, reproducible_json, format)` jobs, by format
+            and then in the order of the tracked CanvasXpress objects, and the
+            concurrency limit.  The ID of each chart is read once, as
+            anonymous charts provide a new ID per read.
+        """
+        format_arg = kwargs.get("format", [PNG_IMAGE])
+        formats = format_arg if isinstance(format_arg, list) else [format_arg]
+
+        for image_format in formats:
+            if image_format not in [PNG_IMAGE, SVG_IMAGE]:
+                raise ValueError(
+                    "format must be one of PNG_IMAGE or SVG_IMAGE, or a list of each."
+                )
+
+        max_workers = kwargs.get("max_workers")
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        elif not isinstance(max_workers, int) or max_workers < 1:
+            raise ValueError("max_workers must be an int of at least 1.")
+
+        if self.canvas is None:
+            charts = []
+        elif isinstance(self.canvas, list):
+            charts = self.canvas
+        else:
+            charts = [self.canvas]
+
+        chart_jsons = []
+        for chart in charts:
+            render_to = chart.render_to
+            with _fixed_render_to(chart, render_to):
+                chart_jsons.append((chart, render_to, CXJSON.render_to_json(chart)))
+
+        jobs = [
+            (chart, render_to, reproducible_json, image_format)
+            for image_format in formats
+            for chart, render_to, reproducible_json in chart_jsons
+        ]
+
+        return jobs, max_workers
+
     def render(self, **kwargs: Any) -> list:
         """
         Renders the associated CanvasXpress object appropriate to create PNGs.
         :param kwargs: `Any`
             * `format`: Accepts a `str` or `list[str]` with the values `png`, or `svg`.  Each tracked CanvasXpress
               object will be rendered into the specified image formats.  If not provided, then `png` is assumed.
+            * `max_workers`: The number of images rendered concurrently.  Defaults to the number of CPUs.  Use `1`
+              to render serially.
+            * `cache`: An optional `CXImageCache` consulted before rendering each image and updated afterwards.
+            * `batch`: If `True`, all charts are declared in one Web page that canvasxpress-cli renders once per
+              format, rather than once per chart and format, which is much faster for many charts as Node and
+              its headless browser are started once.
+            * `pool`: An optional `CXImageWorkerPool` whose warm workers render the images rather than
+              canvasxpress-cli.  Cannot be combined with `batch`.
         :returns: `list{dict}`
             A list `dict`, each containing a PNGs or SVG and the `render_to` ID of the corresponding CanvasXpress.
+            Images are listed by format and then in the order of the tracked CanvasXpress objects.
         """
-        format_arg = kwargs.get("format", [PNG_IMAGE])
-        formats = format_arg if isinstance(format_arg, list) else [format_arg]
+        jobs, max_workers = self.__prepare_jobs(kwargs)
+        if len(jobs) == 0:
+            return []
 
-        json_renderer = CXJSON(self.canvas)
-        reproducible_jsons = json_renderer.render()
+        cache = kwargs.get("cache")
+        pool = kwargs.get("pool")
 
-        rendered_images: list = []
+        if kwargs.get("batch", False):
+            if pool is not None:
+                raise ValueError("batch rendering cannot use a pool.")
 
-        for image_format in formats:
-            if image_format not in [PNG_IMAGE, SVG_IMAGE]:
-                raise ValueError(
-                    "format must be one of PNG_IMAGE or SVG_IMAGE, or a list of each."
+            return self.__render_batch(jobs, cache)
+
+        render_image = render_json_as_image if pool is None else pool.render
+
+        def render_job(job: tuple) -> list:
+            chart, _, reproducible_json, image_format = job
+            key, images = _find_cached_images(
+                cache, chart, reproducible_json, image_format
+            )
+            if images is None:
+                images = render_image(reproducible_json, format=image_format)
+                _store_cached_images(cache, key, image_format, images)
+
+            return images
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(jobs))) as executor:
+            results = executor.map(render_job, jobs)
+
+            rendered_images: list = []
+            for images in results:
+                rendered_images.extend(images)
+
+        return rendered_images
+
+    def __render_batch(self, jobs: list, cache) -> list:
+        """
+        Renders the jobs from a single Web page declaring every chart that is
+        not already cached.
+        :param jobs: `list`
+            The jobs provided by `__prepare_jobs`.
+        :param cache: `Union[CXImageCache, None]`
+            The cache to consult and update, if any.
+        :returns: `list`
+            The images in the same order as produced by `render`.
+        """
+        # Jobs are ordered by format and then by chart
+        charts = self.canvas if isinstance(self.canvas, list) else [self.canvas]
+        render_targets = [render_to for _, render_to, _, _ in jobs[: len(charts)]]
+        if len(set(render_targets)) != len(render_targets):
+            raise ValueError("batch rendering requires distinct render_to targets.")
+
+        found = list()
+        missing_charts = dict()
+        missing_formats = list()
+        for chart, render_to, reproducible_json, image_format in jobs:
+            key, images = _find_cached_images(
+                cache, chart, reproducible_json, image_format
+            )
+            found.append((key, images))
+            if images is None:
+                missing_charts[render_to] = chart
+                if image_format not in missing_formats:
+                    missing_formats.append(image_format)
+
+        rendered = dict()
+        if len(missing_charts) != 0:
+            with TemporaryDirectory(prefix="canvasxpress-python-") as work_dir:
+                page_path = Path(work_dir, "cx_charts.html")
+                page_path.write_text(
+                    _batch_page_html(
+                        list(missing_charts.values()), list(missing_charts.keys())
+                    ),
+                    encoding="utf-8",
                 )
 
-            for reproducible_json in reproducible_jsons:
-                work_dir = Path(gettempdir()) / "canvasxpress-python"
-                work_dir.mkdir(exist_ok=True)
-                work_json_path = Path(work_dir, "cx_data.json")
-                work_image_path = work_dir
+                for image in render_html_as_image(
+                    page_path.as_uri(), format=missing_formats
+                ):
+                    rendered[(image["id"], image["image"]["format"])] = image
 
-                with open(work_json_path, "w") as json_temp_file:
-                    json_temp_file.write(reproducible_json)
+        rendered_images: list = []
+        for (_, render_to, _, image_format), (key, images) in zip(jobs, found):
+            if images is None:
+                image = rendered.get((render_to, image_format))
+                images = [] if image is None else [image]
+                _store_cached_images(cache, key, image_format, images)
 
-                result = subprocess.run(
-                    [
-                        f"{get_nodejs_path()} {image_format} -i {work_json_path} -o {work_image_path}",
-                    ],
-                    shell=True,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.STDOUT,
-                    timeout=MAX_NODE_WAIT_SECONDS,
+            rendered_images.extend(images)
+
+        return rendered_images
+
+    def __start_async_jobs(self, kwargs: dict) -> list:
+        """
+        Schedules a task per image on the running event loop.
+        :param kwargs: `dict`
+            The options given to `render_async` or `render_as_completed`.
+        :returns: `list`
+            The `asyncio.Task` objects, in the order of the jobs.
+        """
+        jobs, max_workers = self.__prepare_jobs(kwargs)
+
+        cache = kwargs.get("cache")
+        pool = kwargs.get("pool")
+        timeout = kwargs.get("timeout", MAX_NODE_WAIT_SECONDS)
+        semaphore = kwargs.get("semaphore")
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(max_workers)
+
+        loop = asyncio.get_event_loop()
+
+        async def render_job(job: tuple) -> list:
+            chart, _, reproducible_json, image_format = job
+
+            # Cache lookups read and write files, so keep them off the loop
+            key, images = None, None
+            if cache is not None:
+                key, images = await loop.run_in_executor(
+                    None,
+                    _find_cached_images,
+                    cache,
+                    chart,
+                    reproducible_json,
+                    image_format,
                 )
-                work_json_path.unlink()
-                if result.returncode == 0:
 
-                    image_file_options = list(
-                        work_image_path.glob(f"**/*.{image_format}")
-                    )
-                    for image_file_path in image_file_options:
-                        with open(Path(image_file_path), "rb") as image_file:
-                            image: bytes = image_file.read()
-                        image_file_path.unlink()
-                        rendered_images.append(
-                            {
-                                "id": json.loads(reproducible_json).get(
-                                    "renderTo", "anonymous"
-                                ),
-                                "image": {
-                                    "binary": image,
-                                    "format": image_format,
-                                },
-                            }
+            if images is None:
+                async with semaphore:
+                    if pool is None:
+                        images = await render_json_as_image_async(
+                            reproducible_json, format=image_format, timeout=timeout
+                        )
+                    else:
+                        # The pool applies its own timeout and restarts workers
+                        images = await loop.run_in_executor(
+                            None,
+                            functools.partial(
+                                pool.render, reproducible_json, format=image_format
+                            ),
                         )
 
+                if cache is not None:
+                    await loop.run_in_executor(
+                        None, _store_cached_images, cache, key, image_format, images
+                    )
+
+            return images
+
+        return [asyncio.ensure_future(render_job(job)) for job in jobs]
+
+    @staticmethod
+    async def __cancel_async_jobs(tasks: list) -> None:
+        """
+        Cancels the unfinished tasks, which kills their canvasxpress-cli
+        processes, and waits for them to stop.
+        :param tasks: `list`
+            The tasks provided by `__start_async_jobs`.
+        """
+        for task in tasks:
+            task.cancel()
+
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def render_async(self, **kwargs: Any) -> list:
+        """
+        Renders the associated CanvasXpress objects into images without blocking the event loop.  If the awaiting
+        task is cancelled, or any image fails, the remaining canvasxpress-cli processes are killed.
+        :param kwargs: `Any`
+            * `format`, `cache`, `pool`: See `render`.
+            * `max_workers`: The number of images rendered concurrently.  Defaults as for `render`.  Ignored if a
+              `semaphore` is provided.
+            * `semaphore`: An optional `asyncio.Semaphore` shared by several calls to cap the number of
+              canvasxpress-cli processes running across all of them.
+            * `timeout`: The number of seconds each canvasxpress-cli process may take.
+        :returns: `list{dict}`
+            The images in the same order as produced by `render`.
+        """
+        tasks = self.__start_async_jobs(kwargs)
+        try:
+            results = await asyncio.gather(*tasks)
+
+        finally:
+            await CXImage.__cancel_async_jobs(tasks)
+
+        rendered_images: list = []
+        for images in results:
+            rendered_images.extend(images)
+
         return rendered_images
+
+    async def render_as_completed(self, **kwargs: Any) -> AsyncIterator[dict]:
+        """
+        Renders the associated CanvasXpress objects into images without blocking the event loop, yielding each
+        image as soon as it is available.  Unfinished canvasxpress-cli processes are killed if iteration stops
+        early.
+        :param kwargs: `Any`
+            See `render_async`.
+        :returns: `AsyncIterator[dict]`
+            The images in the order in which they complete.
+        """
+        tasks = self.__start_async_jobs(kwargs)
+        try:
+            for next_completed in asyncio.as_completed(tasks):
+                for image in await next_completed:
+                    yield image
+
+        finally:
+            await CXImage.__cancel_async_jobs(tasks)
@@ -12,167 +12,99 @@ from canvasxpress.render.base import CXRenderable
 _cx_iframe_padding = 50
 
 
-def inject_cx_assets():
-    injection_script = """
-        // 1. First, handle CSS Insertion and wait for it to be completely ready
-        new Promise((cssResolve, cssReject) => {
-            const cssUrl = "{{css_url}}";
-            let existingLink = document.querySelector(`head link[href="${cssUrl}"]`);
-        
-            if (!existingLink) {
-                const link = document.createElement("link");
-                link.rel = "stylesheet";
-                link.type = "text/css";
-                link.href = cssUrl;
-                link.onload = () => {
-                    link.dataset.state = "loaded";
-                    link.dispatchEvent(new Event("assetLoaded"));
-                    cssResolve();
-                };
-                link.onerror = () => {
-                    link.dataset.state = "failed";
-                    link.dispatchEvent(new Event("assetFailed"));
-                    cssReject(new Error(`Failed to load CSS: ${cssUrl}`));
-                };
-                document.head.appendChild(link);
-            } else if (existingLink.dataset.state === "loaded") {
-                cssResolve();
-            } else if (existingLink.dataset.state === "failed") {
-                cssReject(new Error(`Failed to load CSS: ${cssUrl}`));
-            } else {
-                // Safe queueing for subsequent runs initiated while CSS is downloading
-                existingLink.addEventListener('assetLoaded', () => cssResolve(), { once: true });
-                existingLink.addEventListener('assetFailed', () => cssReject(new Error(`Failed to load CSS: ${cssUrl}`)), { once: true });
+_cx_assets_bootstrap_template = """
+(function () {
+    // Charts wait in a queue shared by every output of the page.  The first
+    // chart shown in a page, or after a failed attempt, loads the assets.
+    const readyQueue = window.cxReadyQueue = window.cxReadyQueue || [];
+    if (readyQueue.cxLoading) {
+        return;
+    }
+    readyQueue.cxLoading = true;
+
+    const load = (tag, attribute, url, isReady) => new Promise((resolve, reject) => {
+        let element = document.querySelector(`head ${tag}[${attribute}="${url}"]`);
+        if (element && (element.dataset.state === "loaded" || isReady(element))) {
+            resolve();
+            return;
+        }
+        if (!element || element.dataset.state === "failed") {
+            if (element) {
+                element.remove();
             }
-        })
+            element = document.createElement(tag);
+            if (tag === "link") {
+                element.rel = "stylesheet";
+            }
+            element.type = tag === "link" ? "text/css" : "text/javascript";
+            element[attribute] = url;
+            document.head.appendChild(element);
+        }
+        element.addEventListener("load", () => {
+            element.dataset.state = "loaded";
+            resolve();
+        }, {once: true});
+        element.addEventListener("error", () => {
+            element.dataset.state = "failed";
+            reject(new Error(`Failed to load ${url}`));
+        }, {once: true});
+    });
+
+    // The CSS is ready before the library is loaded
+    load("link", "href", "{{css_url}}", (link) => link.sheet !== null)
+        .then(() => load("script", "src", "{{js_url}}", () => typeof CanvasXpress !== "undefined"))
         .then(() => {
-            // 2. CSS is guaranteed ready. Now handle JS Insertion
-            return new Promise((jsResolve, jsReject) => {
-                const scriptUrl = '{{js_url}}';
-                let existingScript = document.querySelector(`script[src="${scriptUrl}"]`);
-        
-                if (existingScript) {
-                    if (existingScript.dataset.state === "loaded") {
-                        jsResolve();
-                    } else if (existingScript.dataset.state === "failed") {
-                        jsReject(new Error(`Failed to load script: ${scriptUrl}`));
-                    } else {
-                        // Safe queueing for subsequent runs initiated while JS is downloading
-                        existingScript.addEventListener('assetLoaded', () => jsResolve(), { once: true });
-                        existingScript.addEventListener('assetFailed', () => jsReject(new Error(`Failed to load script: ${scriptUrl}`)), { once: true });
-                    }
-                } else {
-                    const script = document.createElement("script");
-                    script.type = "text/javascript";
-                    script.src = scriptUrl;
-                    script.dataset.state = "loading";
-        
-                    script.onload = () => {
-                        script.dataset.state = "loaded";
-                        script.dispatchEvent(new Event("assetLoaded"));
-                        jsResolve();
-                    };
-                    script.onerror = () => {
-                        script.dataset.state = "failed";
-                        script.dispatchEvent(new Event("assetFailed"));
-                        jsReject(new Error(`Failed to load script: ${scriptUrl}`));
-                    };
-                    document.head.appendChild(script);
+            // Run the queued charts, and later charts as soon as they are queued
+            const runChart = (init) => {
+                try {
+                    init();
+                } catch (error) {
+                    console.error("CanvasXpress chart failed:", error);
                 }
-            });
+            };
+            readyQueue.splice(0, readyQueue.length).forEach(runChart);
+            readyQueue.push = (init) => {
+                runChart(init);
+                return readyQueue.length;
+            };
         })
         .catch((error) => {
+            // Permit a later chart to try again
+            readyQueue.cxLoading = false;
             console.error("CanvasXpress injection failed:", error);
         });
+})();
+"""
+
+_cx_js_intermixed_template = """
+// Runs once the CanvasXpress assets are ready; see inject_cx_assets()
+(window.cxReadyQueue = window.cxReadyQueue || []).push(() => {
+    {{code}}
+});
+"""
+
+
+def inject_cx_assets():
+    """
+    Provides the Javascript that loads the CanvasXpress CSS and JS assets into
+    the page and then runs each chart queued via `window.cxReadyQueue`.  The
+    script is provided once with each output so that the output is
+    self-contained, such as after other outputs are cleared, the notebook is
+    reopened, or when outputs are isolated in separate frames, but it only
+    loads the assets if the page is not already loading or has not already
+    loaded them.  Each chart of the output only adds itself to the queue.
+    :returns: `Javascript`
+        The loader.
     """
     return Javascript(
         data=(
-            injection_script.replace(
+            _cx_assets_bootstrap_template.replace(
                 "{{css_url}}", CanvasXpress.css_library_url()
             ).replace("{{js_url}}", CanvasXpress.js_library_url())
         ),
     )
 
 
-_cx_js_intermixed_template = """
-// 1. First, handle CSS Insertion and wait for it to be completely ready
-new Promise((cssResolve, cssReject) => {
-    const cssUrl = "{{css_url}}";
-    let existingLink = document.querySelector(`head link[href="${cssUrl}"]`);
-
-    if (!existingLink) {
-        const link = document.createElement("link");
-        link.rel = "stylesheet";
-        link.type = "text/css";
-        link.href = cssUrl;
-        link.onload = () => {
-            link.dataset.state = "loaded";
-            link.dispatchEvent(new Event("assetLoaded"));
-            cssResolve();
-        };
-        link.onerror = () => {
-            link.dataset.state = "failed";
-            link.dispatchEvent(new Event("assetFailed"));
-            cssReject(new Error(`Failed to load CSS: ${cssUrl}`));
-        };
-        document.head.appendChild(link);
-    } else if (existingLink.dataset.state === "loaded") {
-        cssResolve();
-    } else if (existingLink.dataset.state === "failed") {
-        cssReject(new Error(`Failed to load CSS: ${cssUrl}`));
-    } else {
-        // Safe queueing for subsequent runs initiated while CSS is downloading
-        existingLink.addEventListener('assetLoaded', () => cssResolve(), { once: true });
-        existingLink.addEventListener('assetFailed', () => cssReject(new Error(`Failed to load CSS: ${cssUrl}`)), { once: true });
-    }
-})
-.then(() => {
-    // 2. CSS is guaranteed ready. Now handle JS Insertion
-    return new Promise((jsResolve, jsReject) => {
-        const scriptUrl = '{{js_url}}';
-        let existingScript = document.querySelector(`script[src="${scriptUrl}"]`);
-
-        if (existingScript) {
-            if (existingScript.dataset.state === "loaded") {
-                jsResolve();
-            } else if (existingScript.dataset.state === "failed") {
-                jsReject(new Error(`Failed to load script: ${scriptUrl}`));
-            } else {
-                // Safe queueing for subsequent runs initiated while JS is downloading
-                existingScript.addEventListener('assetLoaded', () => jsResolve(), { once: true });
-                existingScript.addEventListener('assetFailed', () => jsReject(new Error(`Failed to load script: ${scriptUrl}`)), { once: true });
-            }
-        } else {
-            const script = document.createElement("script");
-            script.type = "text/javascript";
-            script.src = scriptUrl;
-            script.dataset.state = "loading";
-
-            script.onload = () => {
-                script.dataset.state = "loaded";
-                script.dispatchEvent(new Event("assetLoaded"));
-                jsResolve();
-            };
-            script.onerror = () => {
-                script.dataset.state = "failed";
-                script.dispatchEvent(new Event("assetFailed"));
-                jsReject(new Error(`Failed to load script: ${scriptUrl}`));
-            };
-            document.head.appendChild(script);
-        }
-    });
-})
-.then(() => { 
-    // 3. Both CSS and JS are ready in order. Run user payload.
-    {{code}} 
-})
-.catch((error) => {
-    console.error("CanvasXpress injection failed:", error);
-});
-
-"""
-
-
 class CXNoteBook(CXRenderable):
     """
     CXNoteBook is a `CXRenderable` that renders `CanvasXpress` objects into
@@ -254,15 +186,14 @@ class CXNoteBook(CXRenderable):
             HTML(data=canvas_table),
         ]
 
+        # The loader starts unless the page is already loading the assets,
+        # and each chart only queues itself
+        if len(functions) != 0:
+            content.append(inject_cx_assets())
+
         for fx in functions:
             content.append(
-                Javascript(
-                    data=(
-                        _cx_js_intermixed_template.replace("{{code}}", fx)
-                        .replace("{{css_url}}", CanvasXpress.css_library_url())
-                        .replace("{{js_url}}", CanvasXpress.js_library_url())
-                    ),
-                ),
+                Javascript(data=_cx_js_intermixed_template.replace("{{code}}", fx)),
             )
 
         return content
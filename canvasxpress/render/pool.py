@@ -0,0 +1,395 @@
+"""
+This module keeps warm image renderers running so that many charts can be
+converted into images without starting NodeJS and a headless browser for
+each one, as canvasxpress-cli does.
+
+The bundled worker, `worker.js`, holds one headless browser and renders PNG
+images.  Any executable that follows its protocol can be used instead: it
+reads one JSON request per line from stdin and writes one JSON response per
+line to stdout, and exits once stdin is closed.  Each request has the form:
+
+```python
+{
+    "id": "job-1",
+    "json": "<reproducible JSON produced by CXJSON>",
+    "format": "png",
+    "width": None,
+    "height": None,
+    "js_url": "<CanvasXpress.js_library_url()>",
+    "css_url": "<CanvasXpress.css_library_url()>",
+}
+```
+
+Each response has the form:
+
+```python
+{
+    "id": "job-1",
+    "images": [{"id": "chart-1", "format": "png", "binary": "<base64>"}],
+    "error": None,
+}
+```
+
+A response with `"unsupported": true` indicates that the worker does not
+render the requested format, which is then rendered using canvasxpress-cli.
+"""
+
+import base64
+import itertools
+import json
+import shutil
+import subprocess
+import threading
+import time
+from pathlib import Path
+from queue import Empty, Queue
+from typing import List, Union
+
+from canvasxpress.canvas import CanvasXpress
+from canvasxpress.render.image import (
+    MAX_NODE_WAIT_SECONDS,
+    PNG_IMAGE,
+    SVG_IMAGE,
+    nodejs_modules_path,
+    render_json_as_image,
+)
+
+WORKER_SCRIPT: Path = Path(__file__).with_name("worker.js")
+"""
+The NodeJS worker that renders images with a persistent headless browser.
+"""
+
+
+def default_worker_command() -> List[str]:
+    """
+    Provides the command that starts the bundled NodeJS worker, which uses the
+    puppeteer package installed alongside canvasxpress-cli.  canvasxpress-cli
+    is installed if needed.
+    :returns: `List[str]`
+    """
+    node = shutil.which("node")
+    if node is None:
+        raise RuntimeError("Image rendering is unavailable. NodeJS is not installed.")
+
+    return [node, str(WORKER_SCRIPT), str(nodejs_modules_path())]
+
+
+class CXImageWorker:
+    """
+    CXImageWorker manages one long-lived rendering process that answers
+    JSON requests over its stdin and stdout.
+    """
+
+    __command: List[str] = None
+    """
+    The command used to start the process.
+    """
+
+    __process: subprocess.Popen = None
+    """
+    The running process, if any.
+    """
+
+    __responses: Queue = None
+    """
+    The lines written by the running process, with `None` marking its exit.
+    """
+
+    def __init__(self, command: List[str]) -> None:
+        """
+        Initializes and starts a new worker.
+        :param command: `List[str]`
+            The command used to start the worker process.
+        """
+        self.__command = list(command)
+        self.start()
+
+    @property
+    def alive(self) -> bool:
+        """
+        Indicates if the worker process is running.
+        :returns: `bool`
+        """
+        return self.__process is not None and self.__process.poll() is None
+
+    def start(self) -> None:
+        """
+        Starts the worker process, stopping any process already running.
+        """
+        self.stop()
+
+        self.__responses = Queue()
+        self.__process = subprocess.Popen(
+            self.__command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            bufsize=1,
+        )
+
+        threading.Thread(
+            target=CXImageWorker.__collect,
+            args=(self.__process.stdout, self.__responses),
+            daemon=True,
+        ).start()
+
+    @staticmethod
+    def __collect(stream, responses: Queue) -> None:
+        """
+        Forwards each line written by a worker process to a queue, followed by
+        `None` once the process closes its output.
+        """
+        for line in stream:
+            responses.put(line)
+
+        responses.put(None)
+
+    def stop(self) -> None:
+        """
+        Stops the worker process if it is running.
+        """
+        if self.__process is not None:
+            try:
+                self.__process.stdin.close()
+            except Exception:
+                pass
+
+            # Allow the worker to close its browser
+            try:
+                self.__process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.__process.kill()
+                self.__process.wait()
+
+            self.__process = None
+
+    def request(self, request: dict, timeout: float) -> dict:
+        """
+        Sends a request to the worker process and waits for its response.
+        :param request: `dict`
+            The request to send.
+        :param timeout: `float`
+            The number of seconds to wait for the response.
+        :returns: `dict`
+            The response.
+        :raises TimeoutError:
+            If no response is received in time, in which case the process is
+            killed.
+        :raises ConnectionError:
+            If the process exits before answering.
+        """
+        if not self.alive:
+            raise ConnectionError("The worker process is not running.")
+
+        try:
+            self.__process.stdin.write(json.dumps(request) + "\n")
+            self.__process.stdin.flush()
+        except (BrokenPipeError, OSError) as e:
+            raise ConnectionError(f"The worker process is not accepting work: {e}")
+
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                line = self.__responses.get(timeout=max(deadline - time.monotonic(), 0))
+            except Empty:
+                self.__process.kill()
+                raise TimeoutError(f"The worker did not respond within {timeout}s.")
+
+            if line is None:
+                raise ConnectionError("The worker process exited unexpectedly.")
+
+            # Ignore any other output, such as logging by the worker
+            try:
+                response = json.loads(line)
+            except ValueError:
+                continue
+
+            if isinstance(response, dict) and response.get("id") == request.get("id"):
+                return response
+
+
+class CXImageWorkerPool:
+    """
+    CXImageWorkerPool keeps a number of warm rendering workers available so
+    that many charts can be converted into images without paying the start-up
+    cost of the renderer for each one.  Workers that crash or exceed the job
+    timeout are restarted.  The pool can be shared by multiple threads.
+
+    Example:
+    ```python
+    with CXImageWorkerPool(size=4) as pool:
+        images = CXImage([chart1, chart2]).render(format="png", pool=pool)
+    ```
+    """
+
+    __workers: List[CXImageWorker] = None
+    """
+    All workers managed by the pool.
+    """
+
+    __idle: Queue = None
+    """
+    The workers available to accept a job.
+    """
+
+    __timeout: float = MAX_NODE_WAIT_SECONDS
+    """
+    The number of seconds a job may take.
+    """
+
+    __job_ids = None
+    """
+    The source of unique job IDs.
+    """
+
+    def __init__(
+        self,
+        size: int = 2,
+        command: Union[List[str], None] = None,
+        timeout: float = MAX_NODE_WAIT_SECONDS,
+    ) -> None:
+        """
+        Initializes a new pool and starts its workers.
+        :param size: `int`
+            The number of workers to keep running.  Must be at least 1.
+        :param command: `Union[List[str], None]`
+            The command used to start a worker.  Defaults to
+            `default_worker_command()`, which starts the bundled NodeJS worker.
+        :param timeout: `float`
+            The number of seconds a job may take before its worker is
+            restarted and a `TimeoutError` raised.
+        """
+        if not isinstance(size, int) or size < 1:
+            raise ValueError("size must be an int of at least 1.")
+
+        if timeout is None or timeout <= 0:
+            raise ValueError("timeout must be a positive number of seconds.")
+
+        self.__timeout = timeout
+        self.__job_ids = itertools.count(1)
+        command = command or default_worker_command()
+        self.__workers = [CXImageWorker(command) for _ in range(size)]
+        self.__idle = Queue()
+        for worker in self.__workers:
+            self.__idle.put(worker)
+
+    @property
+    def size(self) -> int:
+        """
+        Provides the number of workers managed by the pool.
+        :returns: `int`
+        """
+        return 0 if self.__workers is None else len(self.__workers)
+
+    def render(
+        self,
+        reproducible_json: str,
+        format: str = PNG_IMAGE,
+        width: Union[int, None] = None,
+        height: Union[int, None] = None,
+    ) -> list:
+        """
+        Renders reproducible JSON into images using the next available worker.
+        A job interrupted by a worker crash is attempted once more using the
+        restarted worker.  Formats that the worker does not support are
+        rendered using canvasxpress-cli.
+        :param reproducible_json: `str`
+            The JSON produced by `CXJSON.render_to_json`.
+        :param format: `str`
+            `PNG_IMAGE` or `SVG_IMAGE`.
+        :param width: `Union[int, None]`
+            The optional image width.
+        :param height: `Union[int, None]`
+            The optional image height.
+        :returns: `list`
+            A `list[dict]` of image data in the form produced by
+            `CXImage.render`.
+        :raises TimeoutError:
+            If the job exceeds the pool's timeout.
+        :raises RuntimeError:
+            If the worker reports that the job failed.
+        """
+        if not (isinstance(width, int) or width is None):
+            raise ValueError("width must be an int or None.")
+
+        if not (isinstance(height, int) or height is None):
+            raise ValueError("height must be an int or None.")
+
+        if format not in [PNG_IMAGE, SVG_IMAGE]:
+            raise ValueError("format must be one of PNG_IMAGE or SVG_IMAGE.")
+
+        if self.__workers is None:
+            raise RuntimeError("The pool has been closed.")
+
+        request = {
+            "id": f"job-{next(self.__job_ids)}",
+            "json": reproducible_json,
+            "format": format,
+            "width": width,
+            "height": height,
+            "js_url": CanvasXpress.js_library_url(),
+            "css_url": CanvasXpress.css_library_url(),
+        }
+
+        worker = self.__idle.get()
+        try:
+            for attempt in range(2):
+                if not worker.alive:
+                    worker.start()
+
+                try:
+                    response = worker.request(request, self.__timeout)
+                    break
+
+                except ConnectionError:
+                    worker.start()
+                    if attempt > 0:
+                        raise RuntimeError(
+                            "The image worker exited while rendering the job."
+                        )
+
+                except TimeoutError:
+                    worker.start()
+                    raise
+
+        finally:
+            self.__idle.put(worker)
+
+        if response.get("unsupported"):
+            return render_json_as_image(
+                reproducible_json, format=format, width=width, height=height, check=True
+            )
+
+        if response.get("error"):
+            raise RuntimeError(f"Image rendering failed: {response['error']}")
+
+        return [
+            {
+                "id": image["id"],
+                "image": {
+                    "binary": base64.b64decode(image["binary"]),
+                    "format": image["format"],
+                },
+            }
+            for image in response.get("images", [])
+        ]
+
+    def close(self) -> None:
+        """
+        Stops all workers.  The pool cannot be used afterwards.
+        """
+        if self.__workers is not None:
+            for worker in self.__workers:
+                worker.stop()
+
+            self.__workers = None
+
+    def __enter__(self) -> "CXImageWorkerPool":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        self.close()
@@ -1,9 +1,9 @@
-import os
-import tempfile
+import atexit
 import uuid
 import webbrowser
-from copy import deepcopy
-from time import sleep
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Condition, Lock, Thread
 from typing import Any, Union, List
 
 from canvasxpress.canvas import CanvasXpress
@@ -45,6 +45,230 @@ _cx_html_template = """
 """
 
 
+PREVIEW_PAGE_LIMIT: int = 64
+"""
+The number of pages retained by a `CXPreviewServer`, so that recent pages can
+be reloaded in the browser.
+"""
+
+PREVIEW_EXIT_TIMEOUT: float = 10.0
+"""
+The number of seconds the interpreter waits on exit for the browser to fetch
+pages that were published but not yet served.
+"""
+
+
+class _CXPreviewRequestHandler(BaseHTTPRequestHandler):
+    """
+    Serves the pages published to the `CXPreviewServer` that owns the server.
+    """
+
+    def do_GET(self) -> None:
+        page = self.server.preview.page(self.path.lstrip("/"))
+        if page is None:
+            self.send_error(404)
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(page)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(page)
+        self.server.preview.page_served(self.path.lstrip("/"))
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+class CXPreviewServer:
+    """
+    CXPreviewServer serves chart pages from memory using a local HTTP server
+    that runs on a daemon thread, so that pages can be opened in a browser
+    without temporary files and without blocking the caller.
+    """
+
+    __pages: OrderedDict = None
+    """
+    The published pages, by name.
+    """
+
+    __page_limit: int = PREVIEW_PAGE_LIMIT
+    """
+    The number of pages retained.
+    """
+
+    __unserved: set = None
+    """
+    The names of the retained pages that have not been served yet.
+    """
+
+    __lock: Condition = None
+    """
+    Guards the published pages and signals when pages are served.
+    """
+
+    __server: Union[ThreadingHTTPServer, None] = None
+    """
+    The HTTP server, or `None` once shut down.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        page_limit: int = PREVIEW_PAGE_LIMIT,
+    ):
+        """
+        Initializes a new `CXPreviewServer` object and starts serving.
+        :param host: `str`
+            The interface to bind.  Defaults to the loopback interface.
+        :param port: `int`
+            The port to bind.  `0` selects any free port.
+        :param page_limit: `int`
+            The number of pages retained, of `1` or greater.
+        """
+        if page_limit < 1:
+            raise ValueError("page_limit must be 1 or greater.")
+
+        self.__pages = OrderedDict()
+        self.__unserved = set()
+        self.__page_limit = page_limit
+        self.__lock = Condition()
+
+        self.__server = ThreadingHTTPServer((host, port), _CXPreviewRequestHandler)
+        self.__server.daemon_threads = True
+        self.__server.preview = self
+
+        Thread(
+            target=self.__server.serve_forever,
+            name="canvasxpress-preview",
+            daemon=True,
+        ).start()
+
+    @property
+    def running(self) -> bool:
+        """
+        Indicates if the server is serving pages.
+        :returns: `bool`
+        """
+        return self.__server is not None
+
+    @property
+    def url(self) -> str:
+        """
+        Provides the base URL of the server.
+        :returns: `str`
+        """
+        if self.__server is None:
+            raise ValueError("The preview server has been shut down.")
+
+        host, port = self.__server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def publish(self, html: str) -> str:
+        """
+        Publishes a page.  The oldest pages are discarded once more than
+        `page_limit` pages have been published.
+        :param html: `str`
+            The page.
+        :returns: `str`
+            The URL of the page.
+        """
+        url = self.url
+        name = f"{uuid.uuid4().hex}.html"
+
+        with self.__lock:
+            self.__pages[name] = html.encode("utf-8")
+            self.__unserved.add(name)
+            while len(self.__pages) > self.__page_limit:
+                discarded, _ = self.__pages.popitem(last=False)
+                self.__unserved.discard(discarded)
+            self.__lock.notify_all()
+
+        return url + name
+
+    def page(self, name: str) -> Union[bytes, None]:
+        """
+        Provides a published page.
+        :param name: `str`
+            The name of the page, which is the last part of its URL.
+        :returns: `Union[bytes, None]`
+            The encoded page, or `None` if no such page is retained.
+        """
+        with self.__lock:
+            return self.__pages.get(name)
+
+    def page_served(self, name: str) -> None:
+        """
+        Records that a published page was sent to a client.
+        :param name: `str`
+            The name of the page, which is the last part of its URL.
+        """
+        with self.__lock:
+            self.__unserved.discard(name)
+            self.__lock.notify_all()
+
+    def wait_until_served(self, timeout: Union[float, None] = None) -> bool:
+        """
+        Waits until every retained page has been served at least once.
+        :param timeout: `Union[float, None]`
+            The maximum number of seconds to wait, or `None` to wait
+            indefinitely.
+        :returns: `bool`
+            `True` if no page remains to be served, or `False` if the timeout
+            expired first.
+        """
+        with self.__lock:
+            return self.__lock.wait_for(lambda: not self.__unserved, timeout)
+
+    def shutdown(self) -> None:
+        """
+        Stops serving and discards all pages.
+        """
+        server, self.__server = self.__server, None
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+
+        with self.__lock:
+            self.__pages.clear()
+            self.__unserved.clear()
+            self.__lock.notify_all()
+
+
+_cx_preview_server: Union[CXPreviewServer, None] = None
+_cx_preview_server_lock: Lock = Lock()
+
+
+def _wait_for_preview_pages() -> None:
+    """
+    Keeps the interpreter alive on exit, for up to `PREVIEW_EXIT_TIMEOUT`
+    seconds, until the browser has fetched every page opened by a popup.  The
+    server runs on a daemon thread and would otherwise stop with the caller.
+    """
+    server = _cx_preview_server
+    if server is not None and server.running:
+        server.wait_until_served(PREVIEW_EXIT_TIMEOUT)
+
+
+def get_preview_server() -> CXPreviewServer:
+    """
+    Provides the preview server shared by `CXBrowserPopup` objects, starting
+    it on first use.
+    :returns: `CXPreviewServer`
+    """
+    global _cx_preview_server
+
+    with _cx_preview_server_lock:
+        if _cx_preview_server is None or not _cx_preview_server.running:
+            if _cx_preview_server is None:
+                atexit.register(_wait_for_preview_pages)
+            _cx_preview_server = CXPreviewServer()
+
+        return _cx_preview_server
+
+
 class CXBrowserPopup(CXRenderable):
     """
     CXBrowserPopup is a `CXRenderable` that renders `CanvasXpress` objects into
@@ -66,12 +290,25 @@ class CXBrowserPopup(CXRenderable):
         """
         Renders the associated CanvasXpress object appropriate for display in
         a pop-up browser window.  Charts cannot have the same name,
-        so render_to will be updated with a uuid for each conflicting chart.
+        so render_to will be updated with a uuid for each conflicting chart for
+        the duration of the rendering.
+
+        The page is served from memory by the shared `CXPreviewServer` and this
+        method returns as soon as the browser has been asked to open it.  If
+        the interpreter exits before the browser fetches the page, the exit is
+        delayed by up to `PREVIEW_EXIT_TIMEOUT` seconds so that it can be
+        served, unless no browser could be opened.
+
+        Renaming a conflicting chart changes the `render_to` of the caller's
+        object until this method returns, so rendering is not thread-safe:
+        the charts must not be rendered or modified concurrently.
         :param kwargs: `Any`
             Supports `columns` for any positive `int` of `1` or greater, with a
             default value of `1`.  Values less that `1` are ignored.  `columns`
             indicates how many charts should be rendered horizontally in the
             browser if more than one chart is being tracked.
+        :returns: `str`
+            The URL of the page.
         """
         render_targets = list()
 
@@ -79,25 +316,33 @@ class CXBrowserPopup(CXRenderable):
             pass
 
         elif isinstance(self.canvas, CanvasXpress):
-            render_targets.append(deepcopy(self.canvas))
+            render_targets.append(self.canvas)
 
         else:
-            for chart in self.canvas:
-                render_targets.append(deepcopy(chart))
-
-        used_render_targets = list()
-        for target in render_targets:
-            original_render_target = target.render_to
-            if original_render_target in used_render_targets:
-                target.render_to = (
-                    original_render_target + "_" + str(uuid.uuid4()).replace("-", "_")
-                )
-
-            used_render_targets.append(target.render_to)
+            render_targets.extend(self.canvas)
 
         render_targets.reverse()
 
-        html_parts = [target.render_to_html_parts() for target in render_targets]
+        html_parts = [None] * len(render_targets)
+        used_render_targets = list()
+        for index in reversed(range(len(render_targets))):
+            target = render_targets[index]
+            original_render_target = target.render_to
+            if original_render_target not in used_render_targets:
+                used_render_targets.append(original_render_target)
+                html_parts[index] = target.render_to_html_parts()
+                continue
+
+            # Rename the chart only while its HTML is produced
+            target.render_to = (
+                original_render_target + "_" + str(uuid.uuid4()).replace("-", "_")
+            )
+            try:
+                used_render_targets.append(target.render_to)
+                html_parts[index] = target.render_to_html_parts()
+
+            finally:
+                target.render_to = original_render_target
 
         canvases = [part["cx_canvas"] for part in html_parts]
 
@@ -157,13 +402,11 @@ class CXBrowserPopup(CXRenderable):
             .replace("@js_url@", js_url)
         )
 
-        tempdir = tempfile.TemporaryDirectory()
-
-        temp_filename = os.path.join(tempdir.name, f"{str(uuid.uuid4())}.html")
-        with open(temp_filename, "w") as temp_file:
-            temp_file.write(html)
+        server = get_preview_server()
+        url = server.publish(html)
 
-        webbrowser.open("file://" + temp_filename, new=1)
+        # Exit need not wait for a page that no browser will request
+        if not webbrowser.open(url, new=1):
+            server.page_served(url.rsplit("/", 1)[-1])
 
-        sleep(2)
-        tempdir.cleanup()
+        return url
@@ -0,0 +1,278 @@
+"""
+This module exports many charts as a static Web site: a small index page, one
+shared script that draws each chart when it scrolls into view, and one gzip
+compressed JSON file per chart.  The site must be served over HTTP, for
+example via `python -m http.server`, as browsers do not fetch files from
+`file://` pages.
+"""
+
+import gzip
+import html
+import json
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, List, Union
+
+from canvasxpress.canvas import CanvasXpress
+from canvasxpress.render.base import CXRenderable
+from canvasxpress.render.popup import _cx_html_template
+
+SITE_INDEX: str = "index.html"
+SITE_SCRIPT: str = "canvasxpress-site.js"
+SITE_MANIFEST: str = "manifest.json"
+SITE_DATA_DIR: str = "data"
+
+_cx_safe_id = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+"""
+The chart IDs accepted by the exporter, which are used as file names and in
+the index page.
+"""
+
+_cx_site_script = """
+// Draws each chart of a CanvasXpress site as it scrolls into view
+(function () {
+    const parse = async (response) => {
+        let bytes = new Uint8Array(await response.arrayBuffer());
+        // Servers may already have removed the gzip encoding
+        if (bytes[0] === 0x1f && bytes[1] === 0x8b) {
+            const inflated = new Blob([bytes]).stream().pipeThrough(new DecompressionStream("gzip"));
+            bytes = new Uint8Array(await new Response(inflated).arrayBuffer());
+        }
+        return JSON.parse(new TextDecoder().decode(bytes));
+    };
+
+    const draw = async (canvas) => {
+        const response = await fetch(canvas.dataset.cxSrc);
+        if (!response.ok) {
+            throw new Error(`Failed to load ${canvas.dataset.cxSrc}: ${response.status}`);
+        }
+        const declaration = await parse(response);
+        new CanvasXpress({
+            ...declaration.chart,
+            events: new Function(`return (${declaration.events});`)(),
+        });
+        declaration.afterRender.forEach(([name, params]) => {
+            CanvasXpress.$(canvas.id)[name](...params);
+        });
+    };
+
+    const observer = new IntersectionObserver((entries) => {
+        entries.filter((entry) => entry.isIntersecting).forEach((entry) => {
+            observer.unobserve(entry.target);
+            draw(entry.target).catch((error) => {
+                console.error("CanvasXpress chart failed:", error);
+            });
+        });
+    }, {rootMargin: "200px"});
+
+    const observe = () => {
+        document.querySelectorAll("canvas[data-cx-src]").forEach((canvas) => {
+            observer.observe(canvas);
+        });
+    };
+
+    if (document.readyState === "loading") {
+        document.addEventListener("DOMContentLoaded", observe);
+    } else {
+        observe();
+    }
+})();
+"""
+
+
+def _write_atomically(path: Path, content: bytes) -> None:
+    """
+    Writes a file so that readers never observe it partially written.
+    :param path: `Path`
+        The file to write.
+    :param content: `bytes`
+        The content.
+    """
+    candidate = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    candidate.write_bytes(content)
+    os.replace(candidate, path)
+
+
+def _chart_declaration(cx: CanvasXpress, render_to: str) -> dict:
+    """
+    Provides the content of the data file for a chart.
+    :param cx: `CanvasXpress`
+        The chart.
+    :param render_to: `str`
+        The ID used for the chart.
+    :returns: `dict`
+    """
+    element_parts = cx.prepare_html_element_parts()
+
+    return {
+        "chart": {
+            **element_parts["otherParams"],
+            "renderTo": render_to,
+            "data": element_parts["data"],
+            "config": element_parts["config"],
+            "width": element_parts["width"],
+            "height": element_parts["height"],
+        },
+        "events": element_parts["events"],
+        "afterRender": element_parts["afterRender"],
+    }
+
+
+class CXSiteExporter(CXRenderable):
+    """
+    CXSiteExporter is a `CXRenderable` that exports `CanvasXpress` objects into
+    a directory as a static Web site.  The site has one index page that
+    references the CanvasXpress library once, one shared script, and one gzip
+    compressed JSON data file per chart that is fetched when the chart is
+    displayed.  Data files are written in parallel, and a manifest of
+    `CanvasXpress.fingerprint` values permits later exports to skip unchanged
+    charts without preparing their data.
+    """
+
+    def __init__(self, *cx: Union[List[CanvasXpress], CanvasXpress, None]):
+        """
+        Initializes a new `CXSiteExporter` object.
+        :param cx: `Union[List[CanvasXpress], CanvasXpress, None], ...`
+            The `CanvasXpress` object(s) to be tracked.  See the `canvas`
+            property, except that on initialization cx can be `None`.
+            Multiple CanvasXpress objects are supported provided that
+            they have distinct `render_to` targets, which must be set rather
+            than generated so that charts can be recognized across exports.
+        """
+        super().__init__(*cx)
+
+    def render(self, **kwargs: Any) -> dict:
+        """
+        Exports the associated CanvasXpress objects as a static Web site.
+        :param kwargs: `Any`
+            * Requires `output_dir` as a `str` or `Path` for the directory in
+              which the site is written.  It is created if needed.
+            * Supports `columns` for any positive `int` of `1` or greater, with a
+              default value of `1`, for the number of charts per row.
+            * Supports `max_workers` for the number of threads used to write
+              data files.  Defaults to the number of CPUs.
+            * Supports `incremental` as a `bool`, default `True`, which skips
+              charts whose fingerprint matches the previous export.  Data files
+              of charts that are no longer exported are removed.
+        :returns: `dict`
+            The IDs of the charts `written` and `skipped`, and of the data files
+            `removed`.  Raises a `ValueError` if a chart is anonymous, if its ID
+            is not an ASCII identifier, or if IDs are not distinct.
+        """
+        output_dir = kwargs.get("output_dir")
+        if output_dir is None:
+            raise ValueError("output_dir is required.")
+
+        columns_arg = int(kwargs.get("columns", 1))
+        columns = columns_arg if columns_arg > 0 else 1
+        max_workers = kwargs.get("max_workers") or os.cpu_count() or 1
+        incremental = bool(kwargs.get("incremental", True))
+
+        if self.canvas is None:
+            charts = []
+        elif isinstance(self.canvas, CanvasXpress):
+            charts = [self.canvas]
+        else:
+            charts = self.canvas
+
+        if any(chart.anonymous for chart in charts):
+            raise ValueError("Charts must have a render_to value to be exported.")
+
+        render_targets = [chart.render_to for chart in charts]
+        for render_to in render_targets:
+            if not _cx_safe_id.fullmatch(render_to):
+                raise ValueError(f"render_to {render_to!r} is not an ASCII identifier.")
+
+        if len(set(render_targets)) != len(render_targets):
+            raise ValueError("Charts must have distinct render_to values.")
+
+        output = Path(output_dir)
+        data_dir = output.joinpath(SITE_DATA_DIR)
+        data_dir.mkdir(parents=True, exist_ok=True)
+
+        manifest_path = output.joinpath(SITE_MANIFEST)
+        previous = {}
+        if incremental and manifest_path.is_file():
+            try:
+                previous = json.loads(manifest_path.read_text(encoding="utf-8"))
+            except ValueError:
+                previous = {}
+
+            if not isinstance(previous, dict):
+                previous = {}
+
+        def export(chart: CanvasXpress, render_to: str) -> tuple:
+            fingerprint = chart.fingerprint()
+            path = data_dir.joinpath(f"{render_to}.json.gz")
+
+            if previous.get(render_to) == fingerprint and path.is_file():
+                return render_to, fingerprint, False
+
+            declaration = _chart_declaration(chart, render_to)
+            content = json.dumps(declaration).encode("utf-8")
+            _write_atomically(path, gzip.compress(content, mtime=0))
+
+            return render_to, fingerprint, True
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(export, charts, render_targets))
+
+        manifest = {render_to: fingerprint for render_to, fingerprint, _ in results}
+
+        removed = []
+        for render_to in previous:
+            # The manifest may have been edited, so only IDs the exporter could
+            # have written are trusted as file names
+            if not _cx_safe_id.fullmatch(render_to):
+                continue
+
+            if render_to not in render_targets:
+                stale = data_dir.joinpath(f"{render_to}.json.gz")
+                if stale.is_file():
+                    stale.unlink()
+                    removed.append(render_to)
+
+        cx_license = ""
+        for chart in charts:
+            if chart.license_url is not None:
+                cx_license = (
+                    f'<script src="{html.escape(chart.license_url)}"'
+                    ' type="text/javascript"></script>'
+                )
+                break
+
+        canvases = "\n".join(
+            f'  <div><canvas id="{html.escape(render_to)}"'
+            f' width="{html.escape(str(chart.width))}"'
+            f' height="{html.escape(str(chart.height))}"'
+            f' data-cx-src="{SITE_DATA_DIR}/{html.escape(render_to)}.json.gz">'
+            "</canvas></div>"
+            for chart, render_to in zip(charts, render_targets)
+        )
+        index = (
+            _cx_html_template.replace(
+                "@canvases@",
+                '<div style="display: grid; grid-template-columns:'
+                f' repeat({columns}, 1fr); gap: 10px; width: 100%;">\n'
+                f"{canvases}\n</div>",
+            )
+            .replace("@canvasxpress_license@", cx_license)
+            .replace(
+                "@js_functions@",
+                f'<script src="{SITE_SCRIPT}" type="text/javascript"></script>',
+            )
+            .replace("@css_url@", CanvasXpress.css_library_url())
+            .replace("@js_url@", CanvasXpress.js_library_url())
+        )
+
+        _write_atomically(output.joinpath(SITE_SCRIPT), _cx_site_script.encode())
+        _write_atomically(output.joinpath(SITE_INDEX), index.encode("utf-8"))
+        _write_atomically(manifest_path, json.dumps(manifest, indent=2).encode())
+
+        return {
+            "written": [render_to for render_to, _, written in results if written],
+            "skipped": [render_to for render_to, _, written in results if not written],
+            "removed": removed,
+        }
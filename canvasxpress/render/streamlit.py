@@ -1,9 +1,32 @@
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Union
+
+import streamlit as st
 import streamlit.components.v1 as components
 
 from canvasxpress.canvas import CanvasXpress
+from canvasxpress.render import component
+from canvasxpress.util.fingerprint import (
+    content_hash,
+    fingerprint_values,
+    serialize_data,
+)
 
 _cx_iframe_padding = 50
 
+_cx_live_component = None
+"""
+The live chart component, declared on first use.
+"""
+
+_cx_sent_suffix = "__cx_sent"
+"""
+Appended to a live chart's key to name the session state that records what
+was last sent to its component.
+"""
+
 _cx_fx_template = """
 <script type="text/javascript">
     @code@
@@ -90,3 +113,131 @@ def plot(cx: CanvasXpress) -> None:
     html, iframe_width, iframe_height = _get_chart_display_code(cx)
 
     components.html(html, width=iframe_width, height=iframe_height)
+
+
+def _get_live_component() -> Any:
+    """
+    Provides the live chart component, declaring it on first use.
+    :returns: `Any`
+        The Streamlit component function.
+    """
+    global _cx_live_component
+    if _cx_live_component is None:
+        _cx_live_component = components.declare_component(
+            "canvasxpress", path=str(Path(component.__file__).parent)
+        )
+
+    return _cx_live_component
+
+
+def _get_live_chart_args(cx: CanvasXpress, sent: dict, render_to: str) -> tuple:
+    """
+    Get the arguments for the live chart component, omitting the data and the
+    chart declaration if they were already sent.
+    :param cx: `CanvasXpress`
+        The `CanvasXpress` object to be rendered.
+    :param sent: `dict`
+        The fingerprints last sent to the component, if any.
+    :param render_to: `str`
+        The ID of the chart, which must be the same on every run for an
+        unchanged chart to be recognized.
+    :returns: `tuple` of args and the fingerprints of the data and chart
+    """
+    element_parts = cx.prepare_html_element_parts()
+    data = element_parts["data"]
+    chart = json.dumps(
+        {
+            "render_to": render_to,
+            "config": element_parts["config"],
+            "other_params": element_parts["otherParams"],
+            "events": element_parts["events"],
+            "after_render": element_parts["afterRender"],
+            "width": element_parts["width"],
+            "height": element_parts["height"],
+        }
+    )
+
+    fingerprint = {
+        "data": content_hash(data) or content_hash(serialize_data(data)),
+        "chart": content_hash(chart),
+    }
+
+    args = {
+        "fingerprint": fingerprint,
+        "data": (
+            None if sent.get("data") == fingerprint["data"] else serialize_data(data)
+        ),
+        "chart": None if sent.get("chart") == fingerprint["chart"] else chart,
+        "js_url": CanvasXpress.js_library_url(),
+        "css_url": CanvasXpress.css_library_url(),
+        "license_url": cx.license_url,
+    }
+
+    return args, fingerprint
+
+
+def plot_live(cx: CanvasXpress, key: Union[str, None] = None) -> None:
+    """
+    Renders the provided CanvasXpress object into a live component that
+    persists across Streamlit reruns.  The CanvasXpress library is loaded once
+    for the life of the component, only the data or chart declaration that
+    changed since the previous run is sent, and an unchanged chart is not
+    drawn again.  An unchanged chart is recognized by `CanvasXpress.fingerprint`
+    and is not rendered again, and changes are recognized by content hash.
+    :param cx: `CanvasXpress`
+        The `CanvasXpress` object to be rendered.
+    :param key: `Union[str, None]`
+        Identifies the component across reruns.  Defaults to `cx.render_to`,
+        and is required if `cx` is anonymous, in which case the chart is given
+        an ID derived from the key.
+    :returns: `None` or raises a `TypeError` exception if `cx` is not a CanvasXpress
+        object, or a `ValueError` exception if `cx` is anonymous and `key` is
+        `None`.
+    """
+    if cx is None:
+        return None
+
+    elif not isinstance(cx, CanvasXpress):
+        raise TypeError("Argument 'cx' is not a CanvasXpress object")
+
+    if cx.anonymous:
+        if key is None:
+            raise ValueError("A key is required to plot an anonymous chart live.")
+
+        render_to = "cX" + hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]
+
+    else:
+        render_to = cx.render_to
+        key = key if key is not None else render_to
+
+    sent_key = key + _cx_sent_suffix
+    sent = st.session_state.get(sent_key) or {}
+
+    # The component requests everything again if it lacks the current state,
+    # such as after its iframe was recreated
+    value = st.session_state.get(key)
+    if isinstance(value, dict) and value.get("missing"):
+        if value.get("request") != sent.get("request"):
+            sent = {"request": value.get("request")}
+
+    # An unchanged chart is recognized without rendering it again
+    source = fingerprint_values(render_to, cx.fingerprint())
+    if sent.get("source") == source:
+        args = {
+            "fingerprint": {"data": sent["data"], "chart": sent["chart"]},
+            "data": None,
+            "chart": None,
+            "js_url": CanvasXpress.js_library_url(),
+            "css_url": CanvasXpress.css_library_url(),
+            "license_url": cx.license_url,
+        }
+
+    else:
+        args, fingerprint = _get_live_chart_args(cx, sent, render_to)
+        st.session_state[sent_key] = {
+            **fingerprint,
+            "source": source,
+            "request": sent.get("request"),
+        }
+
+    _get_live_component()(key=key, default=None, **args)
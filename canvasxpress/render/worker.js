@@ -0,0 +1,138 @@
+// A long-lived image rendering worker for CXImageWorkerPool.
+//
+// The worker keeps one headless browser running and reads one JSON request per
+// line from stdin, writing one JSON response per line to stdout:
+//
+//   {"id": "job-1", "json": "<reproducible JSON>", "format": "png",
+//    "width": null, "height": null, "js_url": "...", "css_url": "..."}
+//
+//   {"id": "job-1", "images": [{"id": "chart1", "format": "png",
+//    "binary": "<base64>"}], "error": null}
+//
+// Formats other than PNG are answered with "unsupported": true so that the
+// pool can render them with canvasxpress-cli instead.  The worker exits once
+// stdin is closed.
+//
+// Usage: node worker.js <node_modules directory holding canvasxpress-cli>
+
+const path = require("path");
+const readline = require("readline");
+const { createRequire } = require("module");
+
+const modules = process.argv[2];
+if (!modules) {
+    process.stderr.write("usage: node worker.js <node_modules directory>\n");
+    process.exit(2);
+}
+
+// Use the puppeteer release that canvasxpress-cli depends upon
+const puppeteer = createRequire(
+    path.join(modules, "canvasxpress-cli", "package.json")
+)("puppeteer");
+
+let browser = null;
+
+const getBrowser = async () => {
+    if (browser === null || !browser.connected) {
+        const args = [];
+        if (process.getuid && process.getuid() === 0) {
+            args.push("--no-sandbox");
+        }
+        // A pipe connection closes the browser if this process is killed
+        browser = await puppeteer.launch({ headless: true, pipe: true, args });
+    }
+    return browser;
+};
+
+const render = async (request) => {
+    const page = await (await getBrowser()).newPage();
+    const errors = [];
+    page.on("pageerror", (error) => errors.push(error.message));
+
+    try {
+        await page.setContent(
+            "<!DOCTYPE html><html><head><meta charset='UTF-8'></head><body></body></html>"
+        );
+        await page.addStyleTag({ url: request.css_url });
+        await page.addScriptTag({ url: request.js_url });
+
+        const renderTo = await page.evaluate((source, width, height) => {
+            // Reproducible JSON embeds event handlers as Javascript functions
+            const declaration = (0, eval)(`(${source})`);
+            const { otherParams, afterRender, ...params } = declaration;
+            params.width = width || params.width;
+            params.height = height || params.height;
+
+            const canvas = document.createElement("canvas");
+            canvas.id = params.renderTo;
+            canvas.width = params.width;
+            canvas.height = params.height;
+            document.body.appendChild(canvas);
+
+            new CanvasXpress({ ...params, ...(otherParams || {}) });
+            (afterRender || []).forEach(([name, args]) => {
+                CanvasXpress.$(params.renderTo)[name](...args);
+            });
+
+            return params.renderTo;
+        }, request.json, request.width, request.height);
+
+        // Let any drawing scheduled for the next frames complete
+        const binary = await page.evaluate(async (id) => {
+            for (let frame = 0; frame < 2; frame++) {
+                await new Promise((resolve) => requestAnimationFrame(resolve));
+            }
+            return document.getElementById(id).toDataURL("image/png").split(",")[1];
+        }, renderTo);
+
+        if (errors.length > 0) {
+            throw new Error(errors.join("; "));
+        }
+
+        return [{ id: renderTo, format: "png", binary }];
+
+    } finally {
+        await page.close();
+    }
+};
+
+const respond = (response) => {
+    process.stdout.write(JSON.stringify(response) + "\n");
+};
+
+const serve = async () => {
+    const lines = readline.createInterface({ input: process.stdin });
+    for await (const line of lines) {
+        if (line.trim() === "") {
+            continue;
+        }
+
+        let request = {};
+        try {
+            request = JSON.parse(line);
+            if (request.format !== "png") {
+                respond({
+                    id: request.id,
+                    images: [],
+                    error: `The worker does not render ${request.format} images.`,
+                    unsupported: true,
+                });
+                continue;
+            }
+
+            respond({ id: request.id, images: await render(request), error: null });
+
+        } catch (error) {
+            respond({ id: request.id, images: [], error: String(error) });
+        }
+    }
+
+    if (browser !== null) {
+        await browser.close();
+    }
+};
+
+serve().catch((error) => {
+    process.stderr.write(`${error.stack || error}\n`);
+    process.exit(1);
+});
@@ -1,13 +1,19 @@
 """
 This file can be executed to render the reproducible JSON files located at
 `[project]/tutorials/reproducible_json/*.json` into tutorials for general use.
+Files are rendered in parallel, and a manifest of input hashes kept with the
+tutorials permits later runs to render only the JSON files that changed.
 """
 
 import json
 import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from hashlib import blake2b
 from pathlib import Path
-from typing import List
+from typing import List, Optional, Tuple
 
+from canvasxpress.util.example import generator
 from canvasxpress.util.example.generator import (
     generate_canvasxpress_code_from_json_file,
 )
@@ -19,6 +25,7 @@ JUPYTER_TEMPLATE_PATH = (
 JUPYTER_EXAMPLES_DIR_PATH = (
     f"{os.getcwd()}/../../../tutorials/notebook/" f"cx_site_chart_examples/"
 )
+TUTORIAL_MANIFEST = ".tutorials_manifest.json"
 
 
 def get_json_file_paths() -> List[str]:
@@ -74,8 +81,25 @@ def get_index_from_filename(file_name: str) -> str:
     return assembled_index[::-1]
 
 
+@lru_cache(maxsize=None)
+def get_template_text(template_path: str = JUPYTER_TEMPLATE_PATH) -> str:
+    """
+    Returns the text of the Jupyter Notebook template, which is read once per
+    process.
+    :param template_path: `str`
+        The path to the template.  Defaults to `JUPYTER_TEMPLATE_PATH`.
+    :returns: `str`
+        The template text.
+    """
+    with open(template_path, "r") as template_file:
+        return template_file.read()
+
+
 def create_jupyer_template_text(
-    chart_type: str, chart_index: str, chart_code: str
+    chart_type: str,
+    chart_index: str,
+    chart_code: str,
+    template_text: Optional[str] = None,
 ) -> str:
     """
     Generates the text for a Jupyter Notebook example given a chart's type,
@@ -86,56 +110,227 @@ def create_jupyer_template_text(
         The index text (e.g., 1) for the chart.
     :param chart_code: `str`
         The chart source code.
+    :param template_text: `Optional[str]`
+        The template text.  Defaults to the template at
+        `JUPYTER_TEMPLATE_PATH`.
     :returns: `str`
         The text for the full example and instruction.
     """
-    with open(JUPYTER_TEMPLATE_PATH, "r") as template_file:
-        example_text = template_file.read()
-        example_text = example_text.replace("@type@", chart_type)
-        example_text = example_text.replace("@index@", chart_index)
+    if template_text is None:
+        template_text = get_template_text()
+
+    example_text = template_text.replace("@type@", chart_type)
+    example_text = example_text.replace("@index@", chart_index)
 
-        ipython_json = json.loads(example_text)
-        for line in chart_code.splitlines():
-            candidate = line
+    ipython_json = json.loads(example_text)
+    for line in chart_code.splitlines():
+        candidate = line
 
-            # Convert render statement to explicit output
-            if "display.render()" in candidate:
-                candidate = candidate.replace(
-                    "display.render()",
-                    f'display.render(output_file="{chart_type}_{chart_index}.html")',
-                )
+        # Convert render statement to explicit output
+        if "display.render()" in candidate:
+            candidate = candidate.replace(
+                "display.render()",
+                f'display.render(output_file="{chart_type}_{chart_index}.html")',
+            )
 
-            # Add the source line to the document
-            ipython_json["cells"][1]["source"].append(candidate + "\n")
+        # Add the source line to the document
+        ipython_json["cells"][1]["source"].append(candidate + "\n")
 
-        ipython_text = json.dumps(ipython_json)
-        return ipython_text
+    ipython_text = json.dumps(ipython_json)
+    return ipython_text
 
 
-if __name__ == "__main__":
-    json_paths = get_json_file_paths()
-    for json_path in json_paths:
+def get_file_hash(file_path: str) -> str:
+    """
+    Returns a digest of a file's content.
+    :param file_path: `str`
+        The path to the file.
+    :returns: `str`
+        The hexadecimal BLAKE2 digest.
+    """
+    with open(file_path, "rb") as hashed_file:
+        return blake2b(hashed_file.read(), digest_size=16).hexdigest()
+
+
+def generate_tutorial(json_path: str, output_dir: str, template_path: str) -> str:
+    """
+    Renders one reproducible JSON file into a Jupyter Notebook tutorial.
+    :param json_path: `str`
+        The path to the reproducible JSON file.
+    :param output_dir: `str`
+        The directory in which the tutorial is written.
+    :param template_path: `str`
+        The path to the Jupyter Notebook template.
+    :returns: `str`
+        The name of the tutorial file written.
+    """
+    json_name = Path(json_path).name
+
+    chart_type = get_type_from_filename(json_name)
+    chart_index = get_index_from_filename(json_name)
+
+    jupyter_notebook_content = create_jupyer_template_text(
+        chart_type,
+        chart_index,
+        generate_canvasxpress_code_from_json_file(
+            json_path, document_jupyter_render=True
+        ),
+        get_template_text(template_path),
+    )
+
+    example_file_name = f"{chart_type}_{chart_index}.ipynb"
+    example_file_path = Path(output_dir).joinpath(example_file_name)
+    with open(example_file_path, "w") as example_file:
+        example_file.write(jupyter_notebook_content)
+
+    return example_file_name
+
+
+def _generate_tutorial_safely(
+    json_path: str, output_dir: str, template_path: str
+) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Renders one tutorial in a worker, reporting failures rather than raising
+    them so that the remaining files are still processed.
+    :param json_path: `str`
+        The path to the reproducible JSON file.
+    :param output_dir: `str`
+        The directory in which the tutorial is written.
+    :param template_path: `str`
+        The path to the Jupyter Notebook template.
+    :returns: `Tuple[Optional[str], Optional[str]]`
+        The name of the tutorial written, or `None`, and the error, or `None`.
+    """
+    try:
+        return generate_tutorial(json_path, output_dir, template_path), None
+
+    except Exception as e:
+        return None, f"{type(e).__name__}: {e}"
+
+
+def generate_tutorials(
+    json_paths: Optional[List[str]] = None,
+    output_dir: str = JUPYTER_EXAMPLES_DIR_PATH,
+    template_path: str = JUPYTER_TEMPLATE_PATH,
+    max_workers: Optional[int] = None,
+    incremental: bool = True,
+) -> dict:
+    """
+    Renders reproducible JSON files into Jupyter Notebook tutorials.  Files are
+    rendered across a process pool, and unless `incremental` is `False` only
+    those whose content, or the template or generator, changed since the
+    previous run are rendered.  Tutorials recorded in the manifest for JSON
+    files that are no longer among `json_paths` are removed.
+    :param json_paths: `Optional[List[str]]`
+        The reproducible JSON files.  Defaults to `get_json_file_paths()`.
+    :param output_dir: `str`
+        The directory in which tutorials and the manifest are written.
+    :param template_path: `str`
+        The path to the Jupyter Notebook template.
+    :param max_workers: `Optional[int]`
+        The number of worker processes.  Defaults to the number of CPUs.
+    :param incremental: `bool`
+        Default `True`.  Indicate if unchanged files should be skipped.
+    :returns: `dict`
+        The JSON file names `written`, `skipped`, `failed`, mapped to the
+        error that occurred, and `removed`, whose tutorials were deleted.
+    """
+    if json_paths is None:
+        json_paths = get_json_file_paths()
+
+    manifest_path = Path(output_dir).joinpath(TUTORIAL_MANIFEST)
+    previous = {}
+    if manifest_path.is_file():
         try:
-            json_name = Path(json_path).name
+            previous = json.loads(manifest_path.read_text(encoding="utf-8"))
+        except ValueError:
+            previous = {}
 
-            chart_type = get_type_from_filename(json_name)
-            chart_index = get_index_from_filename(json_name)
+    if not isinstance(previous, dict) or not isinstance(previous.get("files"), dict):
+        previous = {}
+    tracked_files = previous.get("files", {})
 
-            jupyter_notebook_content = create_jupyer_template_text(
-                chart_type,
-                chart_index,
-                generate_canvasxpress_code_from_json_file(
-                    json_path, document_jupyter_render=True
-                ),
-            )
+    # A changed template or generator invalidates every tutorial
+    generator_hash = blake2b(
+        "".join(
+            get_file_hash(path)
+            for path in [template_path, generator.__file__, __file__]
+        ).encode(),
+        digest_size=16,
+    ).hexdigest()
+    if not incremental or previous.get("generator") != generator_hash:
+        previous = {}
+    previous_files = previous.get("files", {})
 
-            example_file_name = f"{chart_type}_{chart_index}.ipynb"
-            example_file_path = str(
-                Path(JUPYTER_EXAMPLES_DIR_PATH).joinpath(example_file_name)
-            )
-            with open(example_file_path, "w") as example_file:
-                example_file.write(jupyter_notebook_content)
+    hashes = {}
+    pending = []
+    skipped = []
+    for json_path in json_paths:
+        json_name = Path(json_path).name
+        hashes[json_name] = get_file_hash(json_path)
+
+        previous_file = previous_files.get(json_name, {})
+        tutorial = previous_file.get("tutorial")
+        if (
+            previous_file.get("hash") == hashes[json_name]
+            and tutorial is not None
+            and Path(output_dir).joinpath(tutorial).is_file()
+        ):
+            skipped.append(json_name)
+        else:
+            pending.append(json_path)
+
+    # A pool is only worth starting when there is more than one file to render
+    arguments = ([output_dir] * len(pending), [template_path] * len(pending))
+    if len(pending) > 1 and max_workers != 1:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_generate_tutorial_safely, pending, *arguments))
+    else:
+        results = list(map(_generate_tutorial_safely, pending, *arguments))
+
+    files = {json_name: previous_files[json_name] for json_name in skipped}
+    written = []
+    failed = {}
+    for json_path, (tutorial, error) in zip(pending, results):
+        json_name = Path(json_path).name
+        if error is None:
+            files[json_name] = {"hash": hashes[json_name], "tutorial": tutorial}
+            written.append(json_name)
+        else:
+            failed[json_name] = error
+
+    # Tutorials of JSON files that are no longer present are removed
+    removed = []
+    current_tutorials = {file["tutorial"] for file in files.values()}
+    for json_name, tracked_file in sorted(tracked_files.items()):
+        if json_name in hashes or not isinstance(tracked_file, dict):
+            continue
+
+        tutorial = tracked_file.get("tutorial")
+        if tutorial is not None and tutorial not in current_tutorials:
+            Path(output_dir).joinpath(Path(tutorial).name).unlink(missing_ok=True)
+
+        removed.append(json_name)
+
+    manifest = {"generator": generator_hash, "files": dict(sorted(files.items()))}
+    manifest_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+
+    return {
+        "written": written,
+        "skipped": skipped,
+        "failed": failed,
+        "removed": removed,
+    }
+
+
+if __name__ == "__main__":
+    result = generate_tutorials()
+    for json_name, error in result["failed"].items():
+        print(f"Cannot process file: {json_name}")
+        print(f"Exception: {error}")
 
-        except Exception as e:
-            print(f"Cannot process file: {json_path}")
-            print(f"Exception: {e}")
+    print(
+        f"Wrote {len(result['written'])} tutorials, skipped"
+        f" {len(result['skipped'])} unchanged, removed"
+        f" {len(result['removed'])} without JSON."
+    )
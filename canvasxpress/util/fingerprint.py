@@ -0,0 +1,189 @@
+"""
+Content fingerprints for chart state, and the serialization of chart data
+memoized by them, so that renderers updating a live chart can recognize
+unchanged data without encoding or sending it again.
+"""
+
+import hashlib
+import io
+import json
+import pickle
+from collections import OrderedDict
+from collections.abc import Mapping
+from threading import Lock
+from typing import Any, Union
+
+from canvasxpress.util.lazy import is_dataframe, is_loaded_instance
+
+DATA_CACHE_SIZE: int = 16
+"""
+The number of serialized data strings retained for reuse.
+"""
+
+_SCALAR_TYPES: frozenset = frozenset([str, int, float, bool, type(None)])
+
+_serialized_data_cache: OrderedDict = OrderedDict()
+_serialized_data_cache_lock: Lock = Lock()
+
+
+def _pickled(value: Any) -> bytes:
+    """
+    Pickles a value without the memo, so that equal values always provide
+    equal bytes regardless of which objects they share.
+    :param value: `Any`
+        The value, which must not be self-referential.
+    :returns: `bytes`
+    """
+    content = io.BytesIO()
+    pickler = pickle.Pickler(content, protocol=pickle.HIGHEST_PROTOCOL)
+    pickler.fast = True
+    pickler.dump(value)
+
+    return content.getvalue()
+
+
+def update_fingerprint(digest: Any, value: Any) -> None:
+    """
+    Feeds a canonical encoding of a value into a `hashlib` digest.  The
+    encoding is type exact, independent of `dict` key order, and encodes NumPy
+    arrays and pandas objects from their buffers rather than via JSON or Python
+    objects.  Lists of scalars, such as the rows of chart data, are encoded in
+    bulk.
+    :param digest: `Any`
+        The `hashlib` digest to update.
+    :param value: `Any`
+        The value.
+    """
+    kind = type(value)
+
+    if kind in _SCALAR_TYPES:
+        digest.update(b"S")
+        digest.update(_pickled(value))
+
+    elif isinstance(value, Mapping):
+        digest.update(b"M%d:" % len(value))
+        items = sorted(
+            value.items(), key=lambda item: (type(item[0]).__name__, str(item[0]))
+        )
+        for key, item in items:
+            update_fingerprint(digest, key)
+            update_fingerprint(digest, item)
+
+    elif kind is list or kind is tuple:
+        digest.update(b"L" if kind is list else b"T")
+        if all(type(item) in _SCALAR_TYPES for item in value):
+            digest.update(_pickled(value))
+        else:
+            digest.update(b"%d:" % len(value))
+            for item in value:
+                update_fingerprint(digest, item)
+
+    elif isinstance(value, (set, frozenset)):
+        digest.update(b"E%d:" % len(value))
+        for item in sorted(value, key=repr):
+            update_fingerprint(digest, item)
+
+    elif is_loaded_instance(value, "numpy", "ndarray"):
+        digest.update(b"A" + value.dtype.str.encode() + repr(value.shape).encode())
+        if value.dtype.hasobject:
+            update_fingerprint(digest, value.tolist())
+        else:
+            import numpy
+
+            digest.update(memoryview(numpy.ascontiguousarray(value)).cast("B"))
+
+    elif is_dataframe(value):
+        digest.update(b"F")
+        update_fingerprint(digest, value.columns.to_numpy())
+        update_fingerprint(digest, value.index.to_numpy())
+        for index in range(value.shape[1]):
+            update_fingerprint(digest, value.iloc[:, index].to_numpy())
+
+    elif is_loaded_instance(value, "pandas", "Series"):
+        digest.update(b"P")
+        update_fingerprint(digest, value.index.to_numpy())
+        update_fingerprint(digest, value.to_numpy())
+
+    elif is_loaded_instance(value, "pandas", "Index"):
+        digest.update(b"I")
+        update_fingerprint(digest, value.to_numpy())
+
+    else:
+        digest.update(b"O" + kind.__qualname__.encode())
+        try:
+            digest.update(_pickled(value))
+        except Exception:
+            digest.update(repr(value).encode("utf-8"))
+
+
+def fingerprint_values(*values: Any) -> str:
+    """
+    Provides a canonical BLAKE2 fingerprint of a sequence of values.  See
+    `update_fingerprint`.
+    :param values: `Any`
+        The values.
+    :returns: `str`
+        The hexadecimal digest.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for value in values:
+        update_fingerprint(digest, value)
+
+    return digest.hexdigest()
+
+
+def content_hash(value: Any) -> Union[str, None]:
+    """
+    Provides a content hash for a value, such as chart data.  Pickling is type
+    exact and considerably faster than JSON encoding, so the hash is cheap
+    relative to the serialization that it avoids.
+    :param value: `Any`
+        The value.
+    :returns: `Union[str, None]`
+        The hash, or `None` if the value cannot be hashed.
+    """
+    try:
+        content = _pickled(value)
+
+    except Exception:
+        return None
+
+    return hashlib.blake2b(content, digest_size=16).hexdigest()
+
+
+def serialize_data(data: Any) -> str:
+    """
+    Serializes chart data into a JSON string for a live chart component, such
+    as the `data` property of `CXDashElement`.  Strings are memoized by content
+    hash so that unchanged data is not encoded again.
+    :param data: `Any`
+        The chart data, as provided by `CanvasXpress.prepare_html_element_parts`.
+    :returns: `str`
+    """
+    if isinstance(data, str):
+        return data
+
+    key = content_hash(data)
+    if key is not None:
+        with _serialized_data_cache_lock:
+            if key in _serialized_data_cache:
+                _serialized_data_cache.move_to_end(key)
+                return _serialized_data_cache[key]
+
+    serialized = json.dumps(data)
+
+    if key is not None:
+        with _serialized_data_cache_lock:
+            _serialized_data_cache[key] = serialized
+            while len(_serialized_data_cache) > DATA_CACHE_SIZE:
+                _serialized_data_cache.popitem(last=False)
+
+    return serialized
+
+
+def clear_serialized_data_cache() -> None:
+    """
+    Discards all memoized data strings.
+    """
+    with _serialized_data_cache_lock:
+        _serialized_data_cache.clear()
@@ -0,0 +1,46 @@
+import sys
+from typing import Any
+
+
+def is_loaded_instance(value: Any, module_name: str, class_name: str) -> bool:
+    """
+    Indicates if the value is an instance of a class without importing the
+    module that defines it.  If the module has yet to be imported then no
+    instance of the class can exist, so heavy optional dependencies such as
+    `pandas` are only loaded by code that actually uses them.
+    :param value: `Any`
+        The value to check.
+    :param module_name: `str`
+        The fully qualified name of the module defining the class.
+    :param class_name: `str`
+        The name of the class within the module.
+    :returns: `bool`
+        `True` if the module is loaded and the value is an instance of the
+        class.
+    """
+    module = sys.modules.get(module_name)
+    if module is None:
+        return False
+
+    cls = getattr(module, class_name, None)
+    return isinstance(cls, type) and isinstance(value, cls)
+
+
+def is_dataframe(value: Any) -> bool:
+    """
+    Indicates if the value is a `pandas.DataFrame`, without importing `pandas`.
+    :param value: `Any`
+        The value to check.
+    :returns: `bool`
+    """
+    return is_loaded_instance(value, "pandas", "DataFrame")
+
+
+def is_dataframe_data(value: Any) -> bool:
+    """
+    Indicates if the value is a `CXDataframeData`, without importing `pandas`.
+    :param value: `Any`
+        The value to check.
+    :returns: `bool`
+    """
+    return is_loaded_instance(value, "canvasxpress.data.matrix", "CXDataframeData")
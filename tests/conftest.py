@@ -0,0 +1,50 @@
+import stat
+from pathlib import Path
+from typing import Callable, Union
+
+import pytest
+
+import canvasxpress.render.image as image_module
+from canvasxpress.canvas import CanvasXpress
+
+
+@pytest.fixture
+def fake_cli(tmp_path, monkeypatch) -> Callable[[str], Path]:
+    """
+    Provides a function that installs an executable script in place of
+    canvasxpress-cli for the duration of a test.  The function accepts the
+    script's source and returns its path.
+    """
+
+    def install(script: str) -> Path:
+        cli_path = tmp_path / "canvasxpress"
+        cli_path.write_text(script)
+        cli_path.chmod(cli_path.stat().st_mode | stat.S_IEXEC)
+        monkeypatch.setattr(image_module, "CX_NODEJS_PATH", cli_path)
+
+        return cli_path
+
+    return install
+
+
+@pytest.fixture
+def chart() -> Callable[..., CanvasXpress]:
+    """
+    Provides a function that creates a Bar chart of one value.  The function
+    accepts the chart's ID, which is `None` for an anonymous chart, the value,
+    and any other `CanvasXpress` arguments, which replace the defaults.
+    """
+
+    def create(
+        render_to: Union[str, None] = None, value: int = 10, **kwargs
+    ) -> CanvasXpress:
+        arguments = {
+            "render_to": render_to,
+            "data": {"y": {"vars": ["Gene1"], "smps": ["Smp1"], "data": [[value]]}},
+            "config": {"graphType": "Bar"},
+        }
+        arguments.update(kwargs)
+
+        return CanvasXpress(**arguments)
+
+    return create
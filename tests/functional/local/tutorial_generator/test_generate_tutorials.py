@@ -1 +1,73 @@
-from canvasxpress.util.example.generate_tutorials import get_json_file_paths
+import json
+import os
+import shutil
+from pathlib import Path
+
+from canvasxpress.util.example.generate_tutorials import (
+    TUTORIAL_MANIFEST,
+    generate_tutorials,
+)
+
+JSON_DIR = Path(os.path.dirname(__file__)).joinpath(
+    "..", "..", "..", "..", "tutorials", "reproducible_json"
+)
+TEMPLATE_PATH = str(
+    Path(os.path.dirname(__file__)).joinpath(
+        "..",
+        "..",
+        "..",
+        "..",
+        "canvasxpress",
+        "util",
+        "example",
+        "template_tutorials.ipynb",
+    )
+)
+
+
+def test_generate_tutorials_incrementally(tmp_path):
+    json_dir = tmp_path.joinpath("json")
+    json_dir.mkdir()
+    output_dir = tmp_path.joinpath("notebooks")
+    output_dir.mkdir()
+
+    json_paths = []
+    for name in ["bar1.json", "bar2.json", "area1.json"]:
+        shutil.copy(JSON_DIR.joinpath(name), json_dir)
+        json_paths.append(str(json_dir.joinpath(name)))
+
+    result = generate_tutorials(
+        json_paths, str(output_dir), TEMPLATE_PATH, max_workers=2
+    )
+    assert sorted(result["written"]) == ["area1.json", "bar1.json", "bar2.json"]
+    assert result["skipped"] == [] and result["failed"] == {}
+    assert result["removed"] == []
+
+    notebook = json.loads(output_dir.joinpath("bar_1.ipynb").read_text())
+    assert "bar_1.html" in "".join(notebook["cells"][1]["source"])
+
+    manifest = json.loads(output_dir.joinpath(TUTORIAL_MANIFEST).read_text())
+    assert manifest["files"]["bar1.json"]["tutorial"] == "bar_1.ipynb"
+
+    with open(json_paths[1], "a") as changed_file:
+        changed_file.write("\n")
+
+    result = generate_tutorials(json_paths, str(output_dir), TEMPLATE_PATH)
+    assert result["written"] == ["bar2.json"]
+    assert sorted(result["skipped"]) == ["area1.json", "bar1.json"]
+
+    result = generate_tutorials(
+        json_paths, str(output_dir), TEMPLATE_PATH, incremental=False
+    )
+    assert len(result["written"]) == 3
+
+    # Tutorials of deleted JSON files are removed along with their entries
+    os.remove(json_paths[2])
+    result = generate_tutorials(json_paths[:2], str(output_dir), TEMPLATE_PATH)
+    assert result["removed"] == ["area1.json"]
+    assert sorted(result["skipped"]) == ["bar1.json", "bar2.json"]
+    assert not output_dir.joinpath("area_1.ipynb").exists()
+    assert output_dir.joinpath("bar_1.ipynb").exists()
+
+    manifest = json.loads(output_dir.joinpath(TUTORIAL_MANIFEST).read_text())
+    assert sorted(manifest["files"]) == ["bar1.json", "bar2.json"]
@@ -0,0 +1,73 @@
+"""
+Measures how `merge_dataframes_into_xyz_object` scales with the number of
+samples and annotation columns.  Run directly:
+
+    python -m tests.performance.benchmark_xyz_assembly
+"""
+
+from time import perf_counter
+
+import numpy
+from pandas import DataFrame
+
+from canvasxpress.data.matrix import CXDataframeData, merge_dataframes_into_xyz_object
+
+SAMPLE_COUNTS = [1000, 5000, 20000]
+ANNOTATION_COLUMN_COUNTS = [5, 20, 40]
+VARIABLE_COUNT = 10
+REPEATS = 3
+
+
+def build_inputs(samples: int, columns: int) -> tuple:
+    """
+    Builds chart data and a sample annotation in first-column layout.
+    :param samples: `int`
+        The number of samples.
+    :param columns: `int`
+        The number of annotation columns.
+    :returns: `tuple`
+        The data and sample annotation as `CXDataframeData` objects.
+    """
+    generator = numpy.random.default_rng(0)
+    sample_ids = [f"S{index}" for index in range(samples)]
+
+    data = DataFrame(
+        generator.random((VARIABLE_COUNT, samples)),
+        columns=sample_ids,
+        index=[f"V{index}" for index in range(VARIABLE_COUNT)],
+    )
+
+    annotation = {"id": sample_ids}
+    for column in range(columns):
+        if column % 2:
+            annotation[f"A{column}"] = generator.integers(0, 100, samples)
+        else:
+            annotation[f"A{column}"] = generator.choice(["a", "b", "c"], samples)
+
+    return CXDataframeData(data), CXDataframeData(DataFrame(annotation))
+
+
+def measure(samples: int, columns: int) -> float:
+    """
+    Provides the best of `REPEATS` timings for one input size.
+    :returns: `float`
+        Seconds.
+    """
+    data, sample_annotation = build_inputs(samples, columns)
+
+    timings = []
+    for _ in range(REPEATS):
+        start = perf_counter()
+        merge_dataframes_into_xyz_object(data, sample_annotation)
+        timings.append(perf_counter() - start)
+
+    return min(timings)
+
+
+if __name__ == "__main__":
+    print(f"{'samples':>8} {'columns':>8} {'seconds':>10} {'us/cell':>8}")
+    for samples in SAMPLE_COUNTS:
+        for columns in ANNOTATION_COLUMN_COUNTS:
+            seconds = measure(samples, columns)
+            per_cell = seconds / (samples * columns) * 1e6
+            print(f"{samples:>8} {columns:>8} {seconds:>10.4f} {per_cell:>8.3f}")
@@ -0,0 +1,142 @@
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+import pytest
+
+from canvasxpress.render import popup as popup_module
+from canvasxpress.render.popup import (
+    CXBrowserPopup,
+    CXPreviewServer,
+    get_preview_server,
+)
+
+PROJECT_PATH = Path(__file__).parents[2]
+
+EXITING_SCRIPT = """
+from canvasxpress.canvas import CanvasXpress
+from canvasxpress.render import popup
+
+popup.webbrowser.open = lambda url, new=0: print(url, flush=True) or True
+popup.CXBrowserPopup(
+    CanvasXpress(
+        render_to="exiting",
+        data={"y": {"vars": ["Gene1"], "smps": ["Smp1"], "data": [[10]]}},
+        config={"graphType": "Bar"},
+    )
+).render()
+"""
+
+
+def fetch(url: str) -> str:
+    with urllib.request.urlopen(url, timeout=10) as response:
+        return response.read().decode("utf-8")
+
+
+@pytest.fixture
+def opened(monkeypatch) -> list:
+    urls = []
+
+    def open_browser(url: str, new: int = 0) -> bool:
+        urls.append(url)
+        return True
+
+    monkeypatch.setattr(popup_module.webbrowser, "open", open_browser)
+    return urls
+
+
+def test_render_serves_page_without_blocking(opened, chart):
+    first, second = chart("popup"), chart("popup")
+
+    started = time.monotonic()
+    url = CXBrowserPopup([first, second]).render(columns=2)
+    assert time.monotonic() - started < 1
+
+    assert opened == [url]
+    assert url.startswith(get_preview_server().url)
+
+    html = fetch(url)
+    assert html.count("<canvas") == 2
+    assert 'id="popup"' in html
+    assert 'id="popup_' in html
+
+    # Charts are rendered in place and restored rather than copied
+    assert first.render_to == "popup" and second.render_to == "popup"
+
+
+def test_server_is_shared(opened, chart):
+    url1 = CXBrowserPopup(chart("first")).render()
+    url2 = CXBrowserPopup(chart("second")).render()
+
+    assert url1 != url2
+    assert url1.rsplit("/", 1)[0] == url2.rsplit("/", 1)[0]
+    assert 'id="first"' in fetch(url1)
+    assert 'id="second"' in fetch(url2)
+
+
+def test_preview_server_limits_and_shutdown():
+    server = CXPreviewServer(page_limit=2)
+    try:
+        urls = [server.publish(f"<p>{index}</p>") for index in range(3)]
+
+        with pytest.raises(urllib.error.HTTPError):
+            fetch(urls[0])
+        assert fetch(urls[2]) == "<p>2</p>"
+
+    finally:
+        server.shutdown()
+
+    assert not server.running
+    with pytest.raises(ValueError):
+        server.publish("<p></p>")
+
+    with pytest.raises(ValueError):
+        CXPreviewServer(page_limit=0)
+
+
+def test_preview_server_waits_until_served():
+    server = CXPreviewServer()
+    try:
+        url = server.publish("<p></p>")
+        assert not server.wait_until_served(0.1)
+
+        fetch(url)
+        assert server.wait_until_served(5)
+
+    finally:
+        server.shutdown()
+
+
+def test_render_without_browser(monkeypatch, chart):
+    monkeypatch.setattr(popup_module.webbrowser, "open", lambda url, new=0: False)
+
+    server = get_preview_server()
+    server.wait_until_served(5)
+
+    # A page that no browser will request does not delay exit
+    url = CXBrowserPopup(chart("headless")).render()
+    assert server.page(url.rsplit("/", 1)[-1]) is not None
+    assert server.wait_until_served(0)
+
+
+def test_popup_is_served_after_the_caller_exits():
+    process = subprocess.Popen(
+        [sys.executable, "-c", EXITING_SCRIPT],
+        cwd=PROJECT_PATH,
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    try:
+        url = process.stdout.readline().strip()
+
+        # The browser usually requests the page after the script has finished
+        time.sleep(0.5)
+        assert 'id="exiting"' in fetch(url)
+        assert process.wait(timeout=10) == 0
+
+    finally:
+        process.kill()
+        process.stdout.close()
@@ -0,0 +1,196 @@
+import json
+
+import numpy
+import pytest
+
+from canvasxpress.canvas import CanvasXpress
+from canvasxpress.config.collection import CXConfigs
+from canvasxpress.config.type import CXBool, CXGraphType, CXGraphTypeOptions
+from canvasxpress.data import cluster as cluster_module
+from canvasxpress.data.cluster import (
+    clear_cluster_cache,
+    cluster_data,
+    distance_matrix,
+    leaf_order,
+    linkage_merges,
+    newick_tree,
+)
+from canvasxpress.data.keypair import CXDictData
+
+
+def heatmap_data() -> dict:
+    return {
+        "y": {
+            "vars": ["V0", "V1", "V2", "V3"],
+            "smps": ["S0", "S1", "S2"],
+            "data": [[0, 0, 9], [10, 10, 0], [1, 1, 9], [11, 10, 1]],
+        },
+        "x": {"Group": ["a", "b", "c"]},
+        "z": {"Kind": ["k0", "k1", "k2", "k3"]},
+    }
+
+
+def heatmap_config(**kwargs) -> dict:
+    return {"graphType": "Heatmap", **kwargs}
+
+
+def naive_heights(distances: numpy.ndarray, linkage: str) -> list:
+    combine = {
+        "single": min,
+        "complete": max,
+        "average": lambda values: sum(values) / len(values),
+    }[linkage]
+    clusters = [[index] for index in range(len(distances))]
+    heights = []
+    while len(clusters) > 1:
+        height, i, j = min(
+            (
+                combine([distances[a, b] for a in clusters[i] for b in clusters[j]]),
+                i,
+                j,
+            )
+            for i in range(len(clusters))
+            for j in range(i + 1, len(clusters))
+        )
+        heights.append(height)
+        clusters[i] += clusters.pop(j)
+
+    return sorted(heights)
+
+
+@pytest.mark.parametrize("linkage", ["single", "complete", "average"])
+@pytest.mark.parametrize("distance", ["euclidian", "manhattan", "maximum"])
+def test_linkage_matches_naive_clustering(distance, linkage):
+    matrix = numpy.random.default_rng(7).normal(size=(30, 4))
+    distances = distance_matrix(matrix, distance)
+
+    merges = linkage_merges(distances.copy(), linkage)
+
+    assert numpy.allclose(
+        sorted(height for _, _, height in merges), naive_heights(distances, linkage)
+    )
+    assert sorted(leaf_order(merges, 30)) == list(range(30))
+
+
+def test_distance_matrix():
+    matrix = numpy.array([[0.0, 0.0], [3.0, 4.0]])
+
+    assert numpy.allclose(distance_matrix(matrix, "euclidian"), [[0, 5], [5, 0]])
+    assert numpy.allclose(distance_matrix(matrix, "manhattan"), [[0, 7], [7, 0]])
+    assert numpy.allclose(distance_matrix(matrix, "maximum"), [[0, 4], [4, 0]])
+
+    with pytest.raises(ValueError):
+        distance_matrix(matrix, "pearson")
+
+
+def test_newick_tree():
+    merges = [(0, 1, 1.0), (3, 2, 3.0)]
+
+    assert newick_tree(merges, ["A", "B", "C's"]) == "((A:1,B:1):2,'C''s':3);"
+    assert newick_tree([], ["Only"]) == "Only;"
+
+
+def test_cluster_data_reorders_and_aligns():
+    data = heatmap_data()
+    config = heatmap_config(variablesClustered=True, samplesClustered=True)
+
+    clustered, clustered_config = cluster_data(data, config)
+
+    vars = clustered["y"]["vars"]
+    assert vars == ["V0", "V2", "V1", "V3"]
+    assert clustered["z"]["Kind"] == ["k" + var[1:] for var in vars]
+    assert clustered["y"]["smps"][-1] == "S2"
+    assert clustered["x"]["Group"] == [
+        "abc"[int(smp[1:])] for smp in clustered["y"]["smps"]
+    ]
+    for var, row in zip(vars, clustered["y"]["data"]):
+        original = data["y"]["data"][int(var[1:])]
+        assert row == [original[int(smp[1:])] for smp in clustered["y"]["smps"]]
+
+    assert clustered["t"]["vars"].startswith("((V0:")
+    assert clustered["t"]["smps"].endswith(";")
+    assert clustered_config["variablesClustered"] is False
+    assert clustered_config["samplesClustered"] is False
+    assert clustered_config["showVarDendrogram"] is True
+    assert clustered_config["showSmpDendrogram"] is True
+
+    assert config["variablesClustered"] is True
+    assert data == heatmap_data()
+
+
+def test_cluster_data_unchanged_when_not_supported():
+    data = heatmap_data()
+
+    for config in [
+        {"graphType": "Bar", "variablesClustered": True},
+        heatmap_config(),
+        heatmap_config(variablesClustered=True, distance="pearson"),
+        heatmap_config(variablesClustered=True, linkage="ward"),
+    ]:
+        assert cluster_data(data, config) == (data, config)
+
+    text = {"y": {"vars": ["V0", "V1"], "smps": ["S0"], "data": [["a"], ["b"]]}}
+    config = heatmap_config(variablesClustered=True)
+    assert cluster_data(text, config) == (text, config)
+
+
+def test_cluster_data_imputes_missing_values():
+    data = heatmap_data()
+    data["y"]["data"][2][1] = None
+
+    clustered, _ = cluster_data(data, heatmap_config(variablesClustered=True))
+
+    assert clustered["y"]["vars"] == ["V0", "V2", "V1", "V3"]
+
+
+def test_cluster_data_is_cached(monkeypatch):
+    calls = []
+    original = cluster_module.linkage_merges
+
+    def counting(distances, linkage):
+        calls.append(linkage)
+        return original(distances, linkage)
+
+    monkeypatch.setattr(cluster_module, "linkage_merges", counting)
+    clear_cluster_cache()
+
+    config = heatmap_config(variablesClustered=True)
+    first = cluster_data(heatmap_data(), config)
+    second = cluster_data(heatmap_data(), config)
+    assert first == second
+    assert len(calls) == 1
+
+    cluster_data(heatmap_data(), {**config, "linkage": "complete"})
+    assert len(calls) == 2
+
+    clear_cluster_cache()
+    cluster_data(heatmap_data(), config)
+    assert len(calls) == 3
+
+
+def test_CanvasXpress_precluster():
+    chart = CanvasXpress(
+        render_to="clustered",
+        data=CXDictData(heatmap_data()),
+        config=CXConfigs(
+            CXGraphType(CXGraphTypeOptions.Heatmap),
+            CXBool("variablesClustered", True),
+        ),
+    )
+
+    assert chart.precluster is False
+    parts = chart.prepare_html_element_parts()
+    assert "t" not in parts["data"]
+    assert parts["config"]["variablesClustered"] is True
+
+    chart.precluster = True
+    parts = chart.prepare_html_element_parts()
+    assert parts["data"]["y"]["vars"] == ["V0", "V2", "V1", "V3"]
+    assert parts["config"]["variablesClustered"] is False
+
+    html = chart.render_to_html_parts()["cx_js"]
+    assert json.dumps(parts["data"]["t"]["vars"]) in html
+    assert '"variablesClustered": false' in html
+
+    assert chart.config.render_to_dict()["variablesClustered"] is True
+    assert chart.data.render_to_dict() == heatmap_data()
@@ -29,3 +29,14 @@ class SampleConfig(CXConfig):
 def test_CXConfig_value():
     testable_data: SampleConfig = SampleConfig("label", "value")
     assert testable_data.value == "value"
+
+
+def test_CXConfig_version():
+    testable_data: SampleConfig = SampleConfig("label", "value")
+    version = testable_data.version
+
+    testable_data.value = "changed"
+    assert testable_data.version == version + 1
+
+    testable_data.value = "changed again"
+    assert testable_data.version == version + 2
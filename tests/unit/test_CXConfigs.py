@@ -231,3 +231,113 @@ def test_CXConfigs_equality():
         assert configs != junk
         assert not configs < junk
         assert configs > junk
+
+
+def test_CXConfigs_add_replaces_label():
+    cfgs: CXConfigs = CXConfigs(
+        CXString("first", "a"), CXInt("second", 1), CXString("third", "c")
+    )
+
+    replacement = CXInt("second", 2)
+    cfgs.add(replacement)
+
+    assert len(cfgs.configs) == 3
+    assert cfgs.get_param("second") is replacement
+    assert [config.label for config in cfgs.configs] == ["first", "second", "third"]
+    assert list(cfgs.render_to_dict().items()) == [
+        ("first", "a"),
+        ("second", 2),
+        ("third", "c"),
+    ]
+
+
+def test_CXConfigs_remove():
+    config1: CXConfig = CXString("test", "value")
+    cfgs: CXConfigs = CXConfigs(config1, CXString("test1", "value2"))
+
+    assert cfgs.remove("missing") is None
+    assert cfgs.remove("test") is config1
+    assert cfgs.get_param("test") is None
+    assert [config.label for config in cfgs.configs] == ["test1"]
+
+
+def test_CXConfigs_render_cache():
+    cfgs: CXConfigs = CXConfigs(CXString("test", "value"), CXInt("count", 1))
+
+    version = cfgs.version
+    first = cfgs.render_to_dict()
+    assert cfgs.version == version
+    assert str(cfgs) == json.dumps(first)
+
+    # Changes to a provided dict do not alter the cached render
+    first["test"] = "changed"
+    assert cfgs.render_to_dict() == {"test": "value", "count": 1}
+
+    cfgs.set_param("count", 2)
+    assert cfgs.version != version
+    assert cfgs.render_to_dict() == {"test": "value", "count": 2}
+    assert str(cfgs) == json.dumps({"test": "value", "count": 2})
+
+    cfgs.get_param("test").value = "updated"
+    assert cfgs.render_to_list() == [["test", "updated"], ["count", 2]]
+
+    cfgs.add(CXBool("flag", True))
+    assert cfgs.render_to_dict() == {"test": "updated", "count": 2, "flag": True}
+
+    cfgs.remove("test")
+    assert cfgs.render_to_dict() == {"count": 2, "flag": True}
+    assert str(cfgs) == json.dumps({"count": 2, "flag": True})
+
+
+def test_CXConfigs_configs_writes_through():
+    first = CXString("first", "a")
+    cfgs: CXConfigs = CXConfigs(first, CXInt("second", 1))
+
+    configs = cfgs.configs
+    assert configs is cfgs.configs
+
+    configs.append(CXBool("third", True))
+    assert cfgs.get_param("third").value is True
+    assert cfgs.render_to_dict() == {"first": "a", "second": 1, "third": True}
+
+    configs.remove(first)
+    assert cfgs.get_param("first") is None
+    assert str(cfgs) == json.dumps({"second": 1, "third": True})
+
+    # Changes to the collection are reflected in the list
+    cfgs.add(CXInt("second", 2))
+    cfgs.add(CXString("fourth", "d"))
+    cfgs.remove("third")
+    assert [(config.label, config.value) for config in configs] == [
+        ("second", 2),
+        ("fourth", "d"),
+    ]
+
+    configs.clear()
+    assert len(cfgs.configs) == 0
+    assert cfgs.render_to_dict() == {}
+
+    with pytest.raises(TypeError):
+        configs.append("invalid")
+
+
+def test_CXConfigs_render_mutable_values():
+    cfgs: CXConfigs = CXConfigs(
+        CXString("test", "value"), CXList("colors", ["red"]), CXDict("map", {})
+    )
+
+    version = cfgs.version
+    rendered = str(cfgs)
+    assert rendered == json.dumps({"test": "value", "colors": ["red"], "map": {}})
+
+    # Unchanged list and dict values reuse the previous render
+    assert cfgs.version == version
+    assert str(cfgs) is rendered
+
+    cfgs.get_param("colors").value.append("blue")
+    cfgs.get_param("map").value["key"] = 1
+    assert cfgs.version != version
+    assert str(cfgs) == json.dumps(
+        {"test": "value", "colors": ["red", "blue"], "map": {"key": 1}}
+    )
+    assert cfgs.render_to_dict()["colors"] == ["red", "blue"]
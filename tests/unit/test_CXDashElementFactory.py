@@ -1,7 +1,11 @@
 import json
 
+import pytest
+
 from canvasxpress.canvas import CanvasXpress
 from canvasxpress.render.dash import CXElementFactory
+from canvasxpress.util import fingerprint
+from canvasxpress.util.fingerprint import clear_serialized_data_cache, serialize_data
 from cxdash import CXDashElement
 
 _g_cx = CanvasXpress(
@@ -54,3 +58,109 @@ def test_renderables():
     assert dash_element.height == str(converted_properties["height"])
     assert dash_element.config == json.dumps(converted_properties["config"])
     assert dash_element.events == converted_properties["events"]
+
+
+def test_update_only_changed_props():
+    from copy import deepcopy
+
+    previous = deepcopy(_g_cx)
+    current = deepcopy(_g_cx)
+
+    assert CXElementFactory.update(previous, current) == {}
+
+    current.config.set_param("colorScheme", "Economist")
+    changes = CXElementFactory.update(previous, current)
+    assert list(changes.keys()) == ["config"]
+    assert json.loads(changes["config"])["colorScheme"] == "Economist"
+
+    current.width = 500
+    assert sorted(CXElementFactory.update(previous, current).keys()) == [
+        "config",
+        "width",
+    ]
+
+    current = deepcopy(_g_cx)
+    current.data = {"y": {"data": [[1, 2]], "vars": ["A"], "smps": ["S1", "S2"]}}
+    changes = CXElementFactory.update(previous, current)
+    assert list(changes.keys()) == ["data"]
+    assert json.loads(changes["data"])["y"]["data"] == [[1, 2]]
+
+    clear_serialized_data_cache()
+
+
+def test_serialized_data_is_memoized(monkeypatch):
+    encoded = []
+    original = fingerprint.json.dumps
+
+    def counting(value, *args, **kwargs):
+        if isinstance(value, dict) and "y" in value:
+            encoded.append(value)
+        return original(value, *args, **kwargs)
+
+    clear_serialized_data_cache()
+    monkeypatch.setattr(fingerprint.json, "dumps", counting)
+
+    first = CXElementFactory.render(_g_cx)
+    second = CXElementFactory.render(_g_cx)
+    assert first.data == second.data
+    assert len(encoded) == 1
+
+    # Type exact: integers and equal floats serialize differently
+    assert serialize_data({"y": {"data": [[1]]}}) == '{"y": {"data": [[1]]}}'
+    assert serialize_data({"y": {"data": [[1.0]]}}) == '{"y": {"data": [[1.0]]}}'
+
+    clear_serialized_data_cache()
+
+
+def test_patch_and_update_outputs():
+    from copy import deepcopy
+
+    from dash import no_update
+
+    previous = deepcopy(_g_cx)
+    current = deepcopy(_g_cx)
+    current.config.set_param("showLegend", True)
+
+    operations = CXElementFactory.patch(previous, current).to_plotly_json()[
+        "operations"
+    ]
+    assert [operation["location"] for operation in operations] == [["props", "config"]]
+
+    config, data = CXElementFactory.update_outputs(previous, current, "config", "data")
+    assert json.loads(config)["showLegend"] is True
+    assert data is no_update
+
+    with pytest.raises(ValueError):
+        CXElementFactory.update_outputs(previous, current, "id")
+
+
+def test_update_renders_only_changed_sources(monkeypatch):
+    from copy import deepcopy
+
+    rendered = []
+    original = CanvasXpress.prepare_html_element_parts
+
+    def counting(cx):
+        rendered.append(cx)
+        return original(cx)
+
+    monkeypatch.setattr(CanvasXpress, "prepare_html_element_parts", counting)
+
+    previous = deepcopy(_g_cx)
+    current = deepcopy(_g_cx)
+    current.width = 500
+    assert CXElementFactory.update(previous, current) == {"width": "500"}
+    assert rendered == []
+
+    current.config.set_param("title", "First")
+    assert list(CXElementFactory.update(previous, current).keys()) == [
+        "config",
+        "width",
+    ]
+
+    # The previous state of the next callback is not rendered again
+    rendered.clear()
+    following = deepcopy(current)
+    following.config.set_param("title", "Second")
+    assert list(CXElementFactory.update(current, following).keys()) == ["config"]
+    assert rendered == [following]
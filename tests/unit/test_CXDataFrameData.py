@@ -2,6 +2,7 @@ import json
 from copy import copy, deepcopy
 from io import StringIO
 
+import numpy
 import pandas
 from pandas import DataFrame  # Required for eval
 
@@ -11,7 +12,11 @@ import pytest
 from hypothesis import given, settings, HealthCheck
 from hypothesis.extra.pandas import data_frames, column
 
-from canvasxpress.data.matrix import CXDataframeData, merge_dataframes_into_xyz_object
+from canvasxpress.data.matrix import (
+    CXDataframeData,
+    copy_on_write_active,
+    merge_dataframes_into_xyz_object,
+)
 from tests.util.hypothesis_support import everything_except
 
 csv_sample = """
@@ -322,3 +327,112 @@ def test_CXDataFrameData_xyz_assembly_empty_annotations():
     assert "x" not in xyz
 
     assert "z" not in xyz
+
+
+def test_CXDataFrameData_xyz_assembly_variable_meta_in_first_row():
+    data = pandas.read_csv(
+        StringIO('"C1","C2","C3"\n1,2,3\n4,5,6'),
+        index_col=False,
+    )
+    data.index = ["V1", "V2"]
+
+    variable_annotation = pandas.read_csv(
+        StringIO('"V1","V2"\n"a","b"\n"c","d"'),
+        index_col=False,
+        header=None,
+    )
+
+    xyz = merge_dataframes_into_xyz_object(
+        data=CXDataframeData(data),
+        variable_annotation=CXDataframeData(variable_annotation),
+    )
+
+    assert "x" not in xyz
+    assert xyz["z"] == {"V1": ["a", "c"], "V2": ["b", "d"]}
+
+
+def test_CXDataFrameData_xyz_assembly_native_types():
+    data = DataFrame([[1.0, 2.0, 3.0]], columns=["S1", "S2", "S3"], index=["V1"])
+
+    sample_annotation = DataFrame(
+        {
+            "id": ["S1", "S2", "S3"],
+            "age": [10, 20, 30],
+            "group": ["a", "b", "a"],
+        }
+    )
+
+    xyz = merge_dataframes_into_xyz_object(
+        data=CXDataframeData(data),
+        sample_annotation=CXDataframeData(sample_annotation),
+    )
+
+    assert xyz["x"] == {"S1": [10, "a"], "S2": [20, "b"], "S3": [30, "a"]}
+    for values in xyz["x"].values():
+        assert type(values[0]) is int
+    json.dumps(xyz)
+
+    xyz = merge_dataframes_into_xyz_object(
+        data=CXDataframeData(data),
+        sample_annotation=CXDataframeData(sample_annotation.set_index("id")),
+    )
+
+    assert xyz["x"] == {"S1": [10, "a"], "S2": [20, "b"], "S3": [30, "a"]}
+    json.dumps(xyz)
+
+
+def test_CXDataframeData_assignment_isolated_from_caller():
+    df = DataFrame({"A": [1, 2, 3], "B": [4, 5, 6]})
+    cxdata = CXDataframeData(df)
+    assert cxdata.copy
+
+    df.loc[0, "A"] = 100
+    assert cxdata.dataframe.loc[0, "A"] == 1
+
+    cxdata.dataframe.loc[1, "B"] = 200
+    assert df.loc[1, "B"] == 5
+
+
+def test_CXDataframeData_assignment_shared_with_caller():
+    df = DataFrame({"A": [1, 2, 3], "B": [4, 5, 6]})
+    cxdata = CXDataframeData(df, copy=False)
+    assert not cxdata.copy
+
+    if copy_on_write_active():
+        # A shallow copy shares memory but not changes
+        assert cxdata.dataframe is not df
+        assert numpy.shares_memory(cxdata.dataframe["A"].values, df["A"].values)
+
+        df.loc[0, "A"] = 100
+        assert cxdata.dataframe.loc[0, "A"] == 1
+
+    else:
+        assert cxdata.dataframe is df
+
+    cxdata_copy = copy(cxdata)
+    assert not cxdata_copy.copy
+
+    cxdata_deepcopy = deepcopy(cxdata)
+    assert cxdata_deepcopy.copy
+    assert cxdata_deepcopy.dataframe is not df
+
+
+def test_CanvasXpress_dataframe_assignment():
+    from canvasxpress.canvas import CanvasXpress
+
+    df = DataFrame({"A": [1, 2, 3], "B": [4, 5, 6]})
+    chart = CanvasXpress(data=df)
+
+    # Copy-on-Write isolates the chart without duplicating the DataFrame
+    assert chart.data.copy is not copy_on_write_active()
+
+    df.loc[0, "A"] = 100
+    assert chart.data.dataframe.loc[0, "A"] == 1
+
+
+def test_CXDataframeData_values():
+    cxdata = CXDataframeData(df_sample)
+    values = cxdata.values
+
+    assert values.shape == df_sample.shape
+    assert values.tolist() == [[1, 2, 3], [4, 5, 6]]
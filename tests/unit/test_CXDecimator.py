@@ -0,0 +1,271 @@
+import math
+
+import numpy
+import pandas
+import pytest
+
+from canvasxpress.canvas import CanvasXpress
+from canvasxpress.config.collection import CXConfigs
+from canvasxpress.config.type import CXGraphType, CXGraphTypeOptions, CXList
+from canvasxpress.data.decimate import (
+    CXDecimator,
+    CXGridDecimator,
+    CXLTTBDecimator,
+    CXSampleDecimator,
+    decimate_data,
+    decimate_dataframe,
+    get_decimator,
+    register_decimator,
+)
+from canvasxpress.data.keypair import CXDictData
+from canvasxpress.data.matrix import CXDataframeData
+
+
+def line_data(columns: int) -> dict:
+    positions = numpy.arange(columns)
+    return {
+        "y": {
+            "vars": ["Sine", "Cosine"],
+            "smps": [f"S{i}" for i in positions],
+            "data": [
+                numpy.sin(positions / 50).tolist(),
+                numpy.cos(positions / 50).tolist(),
+            ],
+        },
+        "x": {"Time": positions.tolist()},
+        "z": {"Kind": ["a", "b"]},
+    }
+
+
+def scatter_data(rows: int) -> dict:
+    generator = numpy.random.default_rng(1)
+    points = generator.normal(size=(rows, 2))
+    points[0] = [100, 100]
+    return {
+        "y": {
+            "vars": [f"P{i}" for i in range(rows)],
+            "smps": ["X", "Y"],
+            "data": points.tolist(),
+        },
+        "z": {"Index": list(range(rows))},
+    }
+
+
+def test_LTTB_keeps_endpoints_and_annotations():
+    data = line_data(10000)
+    decimated = decimate_data(data, {"graphType": "Line"}, 1000)
+
+    smps = decimated["y"]["smps"]
+    assert len(decimated["y"]["data"]) == 2
+    assert all(len(row) == len(smps) for row in decimated["y"]["data"])
+    assert len(smps) <= 1000
+    assert smps[0] == "S0" and smps[-1] == "S9999"
+    assert decimated["x"]["Time"] == [int(smp[1:]) for smp in smps]
+    assert decimated["z"] == data["z"]
+    assert len(data["y"]["smps"]) == 10000
+
+
+def test_LTTB_keeps_peaks():
+    values = [0.0] * 5000
+    values[1234] = 50.0
+    data = {"y": {"smps": list(range(5000)), "data": [values]}}
+
+    decimated = decimate_data(data, {"graphType": "Area"}, 100)
+
+    assert 1234 in decimated["y"]["smps"]
+    assert len(decimated["y"]["smps"]) <= 100
+
+
+def test_grid_reduces_points_and_keeps_outliers():
+    data = scatter_data(50000)
+    decimated = decimate_data(data, {"graphType": "Scatter2D"}, 400)
+
+    vars = decimated["y"]["vars"]
+    assert 0 < len(vars) <= 400
+    assert "P0" in vars
+    assert decimated["z"]["Index"] == [int(var[1:]) for var in vars]
+    assert decimated["y"]["smps"] == ["X", "Y"]
+
+
+def test_grid_uses_configured_axes():
+    config = {"graphType": "Scatter2D", "xAxis": ["B"], "yAxis": ["C"]}
+    matrix = numpy.zeros((1000, 3))
+    matrix[:, 1] = numpy.arange(1000)
+
+    rows, columns = CXGridDecimator().select(matrix, ["A", "B", "C"], config, 100)
+
+    assert columns is None
+    assert len(rows) == 10
+
+
+def test_sample_fallback():
+    data = {
+        "y": {
+            "vars": ["Gene1"],
+            "smps": [f"S{i}" for i in range(1000)],
+            "data": [list(range(1000))],
+        }
+    }
+
+    stratified = decimate_data(data, {"graphType": "Bar"}, 11)
+    assert stratified["y"]["data"] == [
+        [0, 100, 200, 300, 400, 500, 599, 699, 799, 899, 999]
+    ]
+
+    random = CXSampleDecimator(CXSampleDecimator.RANDOM, seed=3).decimate(data, {}, 10)
+    assert len(random["y"]["smps"]) == 10
+    assert random == CXSampleDecimator(CXSampleDecimator.RANDOM, seed=3).decimate(
+        data, {}, 10
+    )
+
+    with pytest.raises(ValueError):
+        CXSampleDecimator("bogus")
+
+
+def test_small_and_non_numeric_data_is_unchanged():
+    data = line_data(100)
+    assert decimate_data(data, {"graphType": "Line"}, 1000) is data
+
+    text = {"y": {"smps": ["A", "B"], "data": [["a", "b"]]}}
+    assert decimate_data(text, {"graphType": "Bar"}, 1) is text
+
+    assert decimate_data(None, {}, 1) is None
+
+
+def test_register_decimator():
+    class FirstSample(CXDecimator):
+        def select(self, matrix, samples, config, budget):
+            return None, [0]
+
+    assert isinstance(get_decimator("Line"), CXLTTBDecimator)
+    assert isinstance(get_decimator("Heatmap"), CXSampleDecimator)
+
+    try:
+        register_decimator("Heatmap", FirstSample())
+        decimated = decimate_data(line_data(10), {"graphType": "Heatmap"}, 5)
+        assert decimated["y"]["smps"] == ["S0"]
+
+    finally:
+        register_decimator("Heatmap", None)
+
+    assert isinstance(get_decimator("Heatmap"), CXSampleDecimator)
+
+    with pytest.raises(TypeError):
+        register_decimator("Heatmap", "LTTB")
+
+
+def test_decimate_dataframe():
+    frame = pandas.DataFrame(
+        numpy.random.default_rng(2).normal(size=(20000, 2)), columns=["X", "Y"]
+    )
+
+    decimated = decimate_dataframe(frame, {"graphType": "Scatter2D"}, 100)
+
+    assert 0 < len(decimated) <= 100
+    assert decimated.equals(frame.loc[decimated.index])
+    assert decimate_dataframe(frame, {"graphType": "Scatter2D"}, 50000) is frame
+
+
+def test_CanvasXpress_point_budget():
+    data = line_data(5000)
+    chart = CanvasXpress(
+        render_to="decimated",
+        data=CXDictData(data),
+        config=CXConfigs(CXGraphType(CXGraphTypeOptions.Line)),
+    )
+
+    assert chart.point_budget is None
+    assert chart.provide_data_object().render_to_dict() == data
+
+    chart.point_budget = 500
+    provided = chart.provide_data_object().render_to_dict()
+    assert len(provided["y"]["smps"]) * 2 <= 500
+    assert len(chart.data.render_to_dict()["y"]["smps"]) == 5000
+
+    parts = chart.prepare_html_element_parts()
+    assert parts["data"] == provided
+
+    chart.point_budget = None
+    assert chart.point_budget is None
+
+    for invalid, error in [("10", TypeError), (True, TypeError), (0, ValueError)]:
+        with pytest.raises(error):
+            chart.point_budget = invalid
+
+
+def test_CanvasXpress_point_budget_dataframe():
+    rows = 10000
+    frame = pandas.DataFrame(
+        numpy.random.default_rng(4).normal(size=(rows, 2)),
+        columns=["Width", "Height"],
+        index=[f"P{i}" for i in range(rows)],
+    )
+    annotation = pandas.DataFrame(
+        {"Group": [i % 3 for i in range(rows)]}, index=frame.index
+    )
+    chart = CanvasXpress(
+        render_to="decimated",
+        data=CXDataframeData(frame),
+        config=CXConfigs(
+            CXGraphType(CXGraphTypeOptions.Scatter2D),
+            CXList("xAxis", ["Width"]),
+            CXList("yAxis", ["Height"]),
+        ),
+    )
+    chart.variable_annotation = CXDataframeData(annotation)
+    chart.point_budget = 100
+
+    provided = chart.provide_data_object().render_to_dict()
+
+    vars = provided["y"]["vars"]
+    assert 0 < len(vars) <= 100
+    assert all(provided["z"][var] == [int(var[1:]) % 3] for var in vars)
+    assert all(
+        math.isclose(value, frame.loc[var, "Width"])
+        for var, (value, _) in zip(vars, provided["y"]["data"])
+    )
+
+
+def test_CanvasXpress_point_budget_dataframe_annotations():
+    columns = [f"S{i}" for i in range(1000)]
+    line = CanvasXpress(
+        render_to="line",
+        data=CXDataframeData(
+            pandas.DataFrame([numpy.sin(numpy.arange(1000) / 50)], columns=columns)
+        ),
+        config={"graphType": "Line"},
+    )
+    line.sample_annotation = pandas.DataFrame(
+        {"Sample": columns, "Group": ["a", "b"] * 500}
+    )
+    line.point_budget = 100
+
+    provided = line.provide_data_object().render_to_dict()
+    smps = provided["y"]["smps"]
+    assert 0 < len(smps) <= 100
+    assert list(provided["x"]) == smps
+    assert all(provided["x"][smp] == ["ab"[int(smp[1:]) % 2]] for smp in smps)
+
+    rows = 5000
+    index = [f"P{i}" for i in range(rows)]
+    scatter = CanvasXpress(
+        render_to="scatter",
+        data=CXDataframeData(
+            pandas.DataFrame(
+                numpy.random.default_rng(5).normal(size=(rows, 2)),
+                columns=["Width", "Height"],
+                index=index,
+            )
+        ),
+        config={"graphType": "Scatter2D", "xAxis": ["Width"], "yAxis": ["Height"]},
+    )
+    scatter.variable_annotation = pandas.DataFrame(
+        {"Variable": index, "Group": [i % 3 for i in range(rows)]}
+    )
+    scatter.point_budget = 100
+
+    provided = scatter.provide_data_object().render_to_dict()
+    vars = provided["y"]["vars"]
+    assert 0 < len(vars) <= 100
+    assert sorted(provided["z"]) == sorted(vars)
+    assert all(provided["z"][var] == [int(var[1:]) % 3] for var in vars)
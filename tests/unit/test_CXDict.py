@@ -132,3 +132,23 @@ def test_CXDict_equality():
     assert subject1 != subject2
     assert not subject1 < subject2
     assert subject1 > subject2
+
+
+def test_CXDict_hash():
+    subject: CXDict = CXDict(label="1", value={"a": [1, 2], "b": {"c": 3}})
+    assert hash(subject) == hash(CXDict(label="1", value={"b": {"c": 3}, "a": [1, 2]}))
+    assert hash(subject) == hash(deepcopy(subject))
+    assert len({subject, deepcopy(subject)}) == 1
+
+    subject.value = {"a": [2, 1]}
+    assert hash(subject) == hash(CXDict(label="1", value={"a": [2, 1]}))
+
+
+def test_CXDict_equality_and_diff():
+    subject: CXDict = CXDict(label="1", value={"a": {"b": 1}})
+    extended: CXDict = CXDict(label="1", value={"a": {"b": 1, "c": 2}})
+
+    assert subject == CXDict(label="1", value={"a": {"b": 1}})
+    assert subject != extended
+    assert subject < extended
+    assert subject.diff(extended)["dictionary_item_added"] == ["root['a']['c']"]
@@ -184,3 +184,60 @@ def test_CXDictData_equality():
     assert sample_c != sample_f
     assert sample_c < sample_f
     assert sample_f > sample_c
+
+
+def test_CXDictData_shared_data():
+    sample = {"y": {"vars": ["V1"], "smps": ["S1"], "data": [[1]]}}
+
+    cxdata = CXDictData(sample, copy=False)
+    assert not cxdata.copy
+    assert cxdata.get_raw_dict_form() is sample
+    assert cxdata.render_to_dict() is sample
+    assert cxdata.view["y"] is sample["y"]
+
+    with pytest.raises(TypeError):
+        cxdata.view["x"] = {}
+
+    shallow = copy(cxdata)
+    assert not shallow.copy
+    assert shallow.get_raw_dict_form() is sample
+
+    deep = deepcopy(cxdata)
+    assert deep.copy
+    assert deep.get_raw_dict_form() is not sample
+    assert deep == cxdata
+
+    # Mutable access copies the shared structure first
+    cxdata.data["y"]["data"][0][0] = 2
+    assert sample["y"]["data"][0][0] == 1
+    assert cxdata.view["y"]["data"][0][0] == 2
+    assert cxdata.get_raw_dict_form() is not sample
+
+
+def test_CXDictData_copied_data():
+    sample = {"y": {"vars": ["V1"], "smps": ["S1"], "data": [[1]]}}
+
+    cxdata = CXDictData(sample)
+    assert cxdata.copy
+    assert cxdata.get_raw_dict_form() is not sample
+
+    sample["y"]["data"][0][0] = 2
+    assert cxdata.view["y"]["data"][0][0] == 1
+
+
+def test_CXDictData_equality_extra_keys():
+    sample_a = CXDictData({"e": 0})
+    sample_b = CXDictData({"d": 1, "a": 2, "e": 0, "b": [0]})
+
+    assert sample_a != sample_b
+    assert sample_a < sample_b
+    assert sample_b > sample_a
+    assert sample_a == CXDictData({"e": 0})
+
+
+def test_CXDictData_diff():
+    sample_a = CXDictData({"a": {"b": 1}, "c": [1, 2]})
+    sample_b = CXDictData({"a": {"b": 1, "d": 2}, "c": [2, 1]})
+
+    assert not sample_a.diff(CXDictData({"c": [2, 1], "a": {"b": 1}}))
+    assert sample_a.diff(sample_b)["dictionary_item_added"] == ["root['a']['d']"]
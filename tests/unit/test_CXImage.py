@@ -1,9 +1,16 @@
+import asyncio
+import os
+
+import pytest
+
 from canvasxpress.canvas import CanvasXpress
 from canvasxpress.render.image import (
     CXImage,
     PNG_IMAGE,
     SVG_IMAGE,
     render_html_as_image,
+    render_json_as_image,
+    render_json_as_image_async,
 )
 
 cx_example = CanvasXpress(
@@ -130,3 +137,210 @@ def test_cx_converst_to_image_base64():
 #     )
 #     assert len(images_found) == 1
 #     assert images_found[0]["id"] == "area1"
+
+
+FAKE_CLI = """#!/usr/bin/env python3
+import json, sys, time
+from pathlib import Path
+
+image_format = sys.argv[1]
+source = Path(sys.argv[sys.argv.index("-i") + 1])
+target = Path(sys.argv[sys.argv.index("-o") + 1])
+render_to = json.loads(source.read_text())["renderTo"]
+time.sleep(0.2)
+(target / f"{render_to}.{image_format}").write_bytes(render_to.encode("utf-8"))
+"""
+
+
+def test_cx_image_parallel_jobs_are_isolated(fake_cli):
+    fake_cli(FAKE_CLI)
+
+    charts = [
+        CanvasXpress(
+            render_to=f"parallel{index}",
+            data={"y": {"vars": ["V1"], "smps": ["S1"], "data": [[index]]}},
+        )
+        for index in range(8)
+    ]
+
+    results = CXImage(charts).render(format=[PNG_IMAGE, SVG_IMAGE], max_workers=8)
+
+    assert [(result["id"], result["image"]["format"]) for result in results] == [
+        (chart.render_to, image_format)
+        for image_format in [PNG_IMAGE, SVG_IMAGE]
+        for chart in charts
+    ]
+    for result in results:
+        assert result["image"]["binary"] == result["id"].encode("utf-8")
+
+
+SLOW_CLI = """#!/usr/bin/env python3
+import os, sys, time
+from pathlib import Path
+
+Path(sys.argv[0]).with_suffix(".pid").write_text(str(os.getpid()))
+time.sleep(30)
+"""
+
+
+def test_cx_image_render_async(fake_cli):
+    fake_cli(FAKE_CLI)
+
+    charts = [
+        CanvasXpress(
+            render_to=f"async{index}",
+            data={"y": {"vars": ["V1"], "smps": ["S1"], "data": [[index]]}},
+        )
+        for index in range(4)
+    ]
+
+    async def render():
+        semaphore = asyncio.Semaphore(2)
+        ordered = await CXImage(charts).render_async(
+            format=[PNG_IMAGE, SVG_IMAGE], semaphore=semaphore
+        )
+        completed = [
+            image
+            async for image in CXImage(charts).render_as_completed(format=PNG_IMAGE)
+        ]
+
+        return ordered, completed
+
+    ordered, completed = asyncio.run(render())
+
+    assert [(result["id"], result["image"]["format"]) for result in ordered] == [
+        (chart.render_to, image_format)
+        for image_format in [PNG_IMAGE, SVG_IMAGE]
+        for chart in charts
+    ]
+    assert sorted(result["id"] for result in completed) == [
+        chart.render_to for chart in charts
+    ]
+    for result in ordered + completed:
+        assert result["image"]["binary"] == result["id"].encode("utf-8")
+
+
+def test_cx_image_render_async_cancellation_kills_cli(fake_cli):
+    pid_path = fake_cli(SLOW_CLI).with_suffix(".pid")
+
+    async def render_then_cancel():
+        task = asyncio.ensure_future(CXImage(cx_example).render_async())
+        while not pid_path.exists():
+            await asyncio.sleep(0.05)
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(asyncio.wait_for(render_then_cancel(), 20))
+
+    with pytest.raises(ProcessLookupError):
+        os.kill(int(pid_path.read_text()), 0)
+
+
+def test_cx_image_render_json_as_image_async_timeout(fake_cli, monkeypatch):
+    from canvasxpress.render import image as image_module
+
+    fake_cli(SLOW_CLI)
+
+    work_dirs = []
+    mkdtemp = image_module.mkdtemp
+
+    def recording(**kwargs):
+        work_dirs.append(mkdtemp(**kwargs))
+        return work_dirs[-1]
+
+    monkeypatch.setattr(image_module, "mkdtemp", recording)
+
+    with pytest.raises(TimeoutError):
+        asyncio.run(render_json_as_image_async('{"renderTo": "slow"}', timeout=0.5))
+
+    # The working directory is removed even though rendering failed
+    assert len(work_dirs) == 1 and not os.path.exists(work_dirs[0])
+
+
+FAILING_CLI = """#!/usr/bin/env python3
+import sys
+
+print("Chart declaration is invalid")
+sys.exit(1)
+"""
+
+
+def test_cx_image_render_json_as_image_failure(fake_cli):
+    fake_cli(FAILING_CLI)
+
+    assert render_json_as_image('{"renderTo": "failing"}') == []
+    with pytest.raises(RuntimeError, match="Chart declaration is invalid"):
+        render_json_as_image('{"renderTo": "failing"}', check=True)
+
+    assert asyncio.run(render_json_as_image_async('{"renderTo": "failing"}')) == []
+    with pytest.raises(RuntimeError, match="Chart declaration is invalid"):
+        asyncio.run(render_json_as_image_async('{"renderTo": "failing"}', check=True))
+
+
+FAKE_PAGE_CLI = """#!/usr/bin/env python3
+import re, sys
+from pathlib import Path
+from urllib.parse import urlparse
+from urllib.request import url2pathname
+
+image_format = sys.argv[1]
+source = Path(url2pathname(urlparse(sys.argv[sys.argv.index("-i") + 1]).path))
+target = Path(sys.argv[sys.argv.index("-o") + 1])
+with open(Path(sys.argv[0]).with_suffix(".log"), "a") as log:
+    log.write(image_format + "\\n")
+for render_to in re.findall(r'<canvas id="([^"]+)"', source.read_text()):
+    (target / f"{render_to}.{image_format}").write_bytes(render_to.encode("utf-8"))
+"""
+
+
+def test_cx_image_batch_render(fake_cli):
+    log_path = fake_cli(FAKE_PAGE_CLI).with_suffix(".log")
+
+    charts = [
+        CanvasXpress(
+            render_to=f"batch{index}",
+            data={"y": {"vars": ["V1"], "smps": ["S1"], "data": [[index]]}},
+        )
+        for index in range(5)
+    ]
+
+    results = CXImage(charts).render(format=[PNG_IMAGE, SVG_IMAGE], batch=True)
+
+    assert log_path.read_text().split() == [PNG_IMAGE, SVG_IMAGE]
+    assert [(result["id"], result["image"]["format"]) for result in results] == [
+        (chart.render_to, image_format)
+        for image_format in [PNG_IMAGE, SVG_IMAGE]
+        for chart in charts
+    ]
+    for result in results:
+        assert result["image"]["binary"] == result["id"].encode("utf-8")
+
+
+def test_cx_image_batch_render_validation():
+    chart = CanvasXpress(render_to="same")
+    with pytest.raises(ValueError):
+        CXImage(chart, CanvasXpress(render_to="same")).render(batch=True)
+
+
+def test_cx_image_batch_render_anonymous(fake_cli):
+    fake_cli(FAKE_PAGE_CLI)
+
+    charts = [
+        CanvasXpress(data={"y": {"vars": ["V1"], "smps": ["S1"], "data": [[index]]}})
+        for index in range(3)
+    ]
+
+    results = CXImage(charts).render(format=[PNG_IMAGE, SVG_IMAGE], batch=True)
+
+    assert len(results) == 6
+    assert [result["id"] for result in results[:3]] == [
+        result["id"] for result in results[3:]
+    ]
+    assert len({result["id"] for result in results}) == 3
+    for result in results:
+        assert result["image"]["binary"] == result["id"].encode("utf-8")
+
+    # The charts remain anonymous
+    assert all(chart.anonymous for chart in charts)
@@ -0,0 +1,153 @@
+import asyncio
+import json
+import threading
+
+import pytest
+
+from canvasxpress.canvas import CanvasXpress
+from canvasxpress.render.cache import (
+    CXImageCache,
+    IMAGE_CACHE_DIR_ENV,
+    get_default_image_cache,
+)
+import canvasxpress.render.image as image_module
+from canvasxpress.render.image import CXImage, PNG_IMAGE, SVG_IMAGE
+
+
+def chart(value: int = 1, **kwargs) -> CanvasXpress:
+    return CanvasXpress(
+        data={"y": {"vars": ["V1"], "smps": ["S1"], "data": [[value]]}},
+        **kwargs,
+    )
+
+
+def test_CXImageCache_key():
+    key = CXImageCache.key(chart(), PNG_IMAGE)
+
+    # Anonymous charts have a new ID per render but the same key
+    assert key == CXImageCache.key(chart(), PNG_IMAGE)
+    assert key != CXImageCache.key(chart(), SVG_IMAGE)
+    assert key != CXImageCache.key(chart(), PNG_IMAGE, width=100)
+    assert key != CXImageCache.key(chart(2), PNG_IMAGE)
+    assert key != CXImageCache.key(chart(render_to="named"), PNG_IMAGE)
+
+
+def test_CXImageCache_get_put(tmp_path):
+    cache = CXImageCache(tmp_path)
+    key = CXImageCache.key(chart(), PNG_IMAGE)
+
+    assert cache.get(key, PNG_IMAGE) is None
+    cache.put(key, PNG_IMAGE, b"image")
+    assert cache.get(key, PNG_IMAGE) == b"image"
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    cache.clear()
+    assert cache.get(key, PNG_IMAGE) is None
+
+
+def test_CXImageCache_evicts_least_recently_used(tmp_path):
+    import os
+
+    cache = CXImageCache(tmp_path, max_bytes=10)
+
+    cache.put("first", PNG_IMAGE, b"12345")
+    os.utime(tmp_path / "first.png", (1, 1))
+    cache.put("second", PNG_IMAGE, b"12345")
+    os.utime(tmp_path / "second.png", (2, 2))
+
+    assert cache.get("first", PNG_IMAGE) == b"12345"  # now most recent
+    cache.put("third", PNG_IMAGE, b"12345")
+
+    assert cache.get("second", PNG_IMAGE) is None
+    assert cache.get("first", PNG_IMAGE) == b"12345"
+    assert cache.get("third", PNG_IMAGE) == b"12345"
+
+
+def test_CXImageCache_invalid_size(tmp_path):
+    with pytest.raises(ValueError):
+        CXImageCache(tmp_path, max_bytes=0)
+
+
+def test_CXImageCache_default(tmp_path, monkeypatch):
+    monkeypatch.delenv(IMAGE_CACHE_DIR_ENV, raising=False)
+    assert get_default_image_cache() is None
+
+    monkeypatch.setenv(IMAGE_CACHE_DIR_ENV, str(tmp_path))
+    cache = get_default_image_cache()
+    assert cache.directory == tmp_path
+    assert get_default_image_cache() is cache
+
+
+def test_CXImage_render_with_cache(tmp_path, monkeypatch):
+    cache = CXImageCache(tmp_path)
+
+    rendered = []
+
+    def render_json_as_image(reproducible_json, format):
+        rendered.append(reproducible_json)
+        render_to = json.loads(reproducible_json)["renderTo"]
+        return [{"id": render_to, "image": {"binary": b"image", "format": format}}]
+
+    monkeypatch.setattr(image_module, "render_json_as_image", render_json_as_image)
+
+    first = CXImage(chart(render_to="cached")).render(format=PNG_IMAGE, cache=cache)
+    assert (cache.hits, cache.misses) == (0, 1)
+
+    second = CXImage(chart(render_to="cached")).render(format=PNG_IMAGE, cache=cache)
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert len(rendered) == 1
+    assert first == second
+
+    # Anonymous charts are cached and reported by the ID of the current render
+    anonymous = chart()
+    CXImage(anonymous).render(format=PNG_IMAGE, cache=cache)
+    [image] = CXImage(anonymous).render(format=PNG_IMAGE, cache=cache)
+    assert (cache.hits, cache.misses) == (2, 2)
+    assert len(rendered) == 2
+    assert image["id"] != "cached"
+    assert len(list(tmp_path.iterdir())) == 2
+
+
+def test_CXImageCache_put_scans_only_when_over_limit(tmp_path, monkeypatch):
+    cache = CXImageCache(tmp_path, max_bytes=12)
+    cache.put("first", PNG_IMAGE, b"12345")
+
+    scans = []
+    iterdir = type(tmp_path).iterdir
+    monkeypatch.setattr(
+        type(tmp_path),
+        "iterdir",
+        lambda self: scans.append(self) or iterdir(self),
+    )
+
+    cache.put("second", PNG_IMAGE, b"12345")
+    cache.put("second", PNG_IMAGE, b"123456")
+    assert scans == []
+
+    cache.put("third", PNG_IMAGE, b"12345")
+    assert len(scans) == 1
+    assert cache.get("first", PNG_IMAGE) is None
+
+
+def test_CXImage_render_async_with_cache(tmp_path, monkeypatch):
+    threads = []
+
+    class RecordingCache(CXImageCache):
+        def get(self, key, format):
+            threads.append(threading.current_thread())
+            return super().get(key, format)
+
+    async def render_json_as_image_async(reproducible_json, format, timeout):
+        render_to = json.loads(reproducible_json)["renderTo"]
+        return [{"id": render_to, "image": {"binary": b"image", "format": format}}]
+
+    monkeypatch.setattr(
+        image_module, "render_json_as_image_async", render_json_as_image_async
+    )
+
+    cache = RecordingCache(tmp_path)
+    for _ in range(2):
+        asyncio.run(CXImage(chart(render_to="cached")).render_async(cache=cache))
+
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert threading.main_thread() not in threads
@@ -0,0 +1,123 @@
+import asyncio
+import sys
+
+import pytest
+
+from canvasxpress.canvas import CanvasXpress
+from canvasxpress.render.image import CXImage, PNG_IMAGE, SVG_IMAGE
+from canvasxpress.render.json import CXJSON
+from canvasxpress.render.pool import CXImageWorkerPool
+from tests.unit.test_CXImage import FAKE_CLI
+
+STUB_WORKER = """
+import base64, json, os, sys, time
+
+arguments = dict(zip(sys.argv[1::2], sys.argv[2::2]))
+handled = 0
+for line in sys.stdin:
+    request = json.loads(line)
+    time.sleep(float(arguments.get("--delay", 0)))
+    print("not a response", flush=True)
+
+    if request["format"] != "png":
+        response = {"id": request["id"], "images": [], "unsupported": True}
+    else:
+        render_to = json.loads(request["json"])["renderTo"]
+        binary = f"{render_to}:{os.getpid()}".encode("utf-8")
+        response = {
+            "id": request["id"],
+            "images": [
+                {
+                    "id": render_to,
+                    "format": "png",
+                    "binary": base64.b64encode(binary).decode("ascii"),
+                }
+            ],
+            "error": None,
+        }
+    print(json.dumps(response), flush=True)
+
+    handled += 1
+    if handled == int(arguments.get("--max-requests", 0)):
+        break
+"""
+
+cx_examples = [
+    CanvasXpress(
+        render_to=f"chart{index}",
+        data={"y": {"vars": ["V1"], "smps": ["S1"], "data": [[index]]}},
+        config={"graphType": "Bar"},
+    )
+    for index in range(3)
+]
+
+
+@pytest.fixture
+def stub_worker(tmp_path):
+    worker_path = tmp_path / "worker.py"
+    worker_path.write_text(STUB_WORKER)
+
+    return lambda *options: [sys.executable, str(worker_path), *options]
+
+
+def worker_ids(images: list) -> set:
+    return {image["image"]["binary"].decode("utf-8").split(":")[1] for image in images}
+
+
+def test_CXImageWorkerPool_render(stub_worker, fake_cli):
+    fake_cli(FAKE_CLI)
+
+    with CXImageWorkerPool(size=2, command=stub_worker(), timeout=30) as pool:
+        assert pool.size == 2
+
+        results = CXImage(cx_examples).render(format=[PNG_IMAGE, SVG_IMAGE], pool=pool)
+        assert [(result["id"], result["image"]["format"]) for result in results] == [
+            (chart.render_to, image_format)
+            for image_format in [PNG_IMAGE, SVG_IMAGE]
+            for chart in cx_examples
+        ]
+
+        # PNG images come from the warm workers, SVG images from canvasxpress-cli
+        png_images = results[: len(cx_examples)]
+        assert png_images[0]["image"]["binary"].startswith(b"chart0:")
+        assert results[-1]["image"]["binary"] == b"chart2"
+
+        # The same two workers answer every later render
+        again = CXImage(cx_examples).render(format=PNG_IMAGE, pool=pool)
+        ordered = asyncio.run(CXImage(cx_examples).render_async(pool=pool))
+        assert [result["id"] for result in ordered] == ["chart0", "chart1", "chart2"]
+        assert len(worker_ids(png_images + again + ordered)) <= 2
+
+        with pytest.raises(ValueError):
+            pool.render(CXJSON.render_to_json(cx_examples[0]), format="gif")
+
+        with pytest.raises(ValueError):
+            CXImage(cx_examples).render(pool=pool, batch=True)
+
+    assert pool.size == 0
+
+
+def test_CXImageWorkerPool_restarts_crashed_worker(stub_worker):
+    command = stub_worker("--max-requests", "1")
+    with CXImageWorkerPool(size=1, command=command, timeout=30) as pool:
+        reproducible_json = CXJSON.render_to_json(cx_examples[0])
+        first = pool.render(reproducible_json)
+        second = pool.render(reproducible_json)
+
+        assert first[0]["id"] == second[0]["id"] == "chart0"
+        assert worker_ids(first) != worker_ids(second)
+
+
+def test_CXImageWorkerPool_timeout(stub_worker):
+    command = stub_worker("--delay", "5")
+    with CXImageWorkerPool(size=1, command=command, timeout=0.5) as pool:
+        with pytest.raises(TimeoutError):
+            pool.render(CXJSON.render_to_json(cx_examples[0]))
+
+
+def test_CXImageWorkerPool_invalid_configuration(stub_worker):
+    with pytest.raises(ValueError):
+        CXImageWorkerPool(size=0, command=stub_worker())
+
+    with pytest.raises(ValueError):
+        CXImageWorkerPool(size=1, command=stub_worker(), timeout=0)
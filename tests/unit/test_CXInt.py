@@ -105,3 +105,13 @@ def test_CXInt_equality():
     assert subject1 != subject2
     assert not subject1 < subject2
     assert subject1 > subject2
+
+
+def test_CXInt_hash():
+    subject: CXInt = CXInt(label="1", value=2)
+    assert not hasattr(subject, "__dict__")
+    assert hash(subject) == hash(CXInt(label="1", value=2))
+    assert hash(subject) == hash(copy(subject))
+
+    subject.value = 3
+    assert hash(subject) == hash(CXInt(label="1", value=3))
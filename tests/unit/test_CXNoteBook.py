@@ -168,3 +168,35 @@ def test_complex_chart_arrangements():
     nb.render(columns=3)
     nb.render(columns=4)
     nb.render(columns=5)
+
+
+def test_CXNoteBook_charts_are_self_contained():
+    def chart(render_to: str) -> CanvasXpress:
+        return CanvasXpress(
+            render_to=render_to,
+            data=CXDictData({"y": {"smps": ["Smp1"], "data": [[10]]}}),
+        )
+
+    def scripts(content: list) -> list:
+        return [element.data for element in content[2:]]
+
+    js_url = CanvasXpress.js_library_url()
+
+    first = scripts(
+        CXNoteBook([chart("first1"), chart("first2")]).get_chart_display_code(1)
+    )
+    second = scripts(CXNoteBook(chart("second")).get_chart_display_code(1))
+
+    # Every output carries the idempotent loader once, rather than relying on
+    # an earlier output of the page, and each chart only queues itself
+    assert len(first) == 3 and len(second) == 2
+    for loader in [first[0], second[0]]:
+        assert js_url in loader
+        assert "readyQueue.cxLoading" in loader
+
+    for script in first[1:] + second[1:]:
+        assert js_url not in script
+        assert "cxReadyQueue = window.cxReadyQueue || []).push" in script
+
+    assert "first1" in first[1] + first[2] and "first2" in first[1] + first[2]
+    assert "second" in second[1]
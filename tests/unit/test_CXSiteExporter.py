@@ -0,0 +1,108 @@
+import gzip
+import json
+
+import pytest
+
+from canvasxpress.canvas import CanvasXpress
+from canvasxpress.render.site import (
+    SITE_DATA_DIR,
+    SITE_INDEX,
+    SITE_MANIFEST,
+    SITE_SCRIPT,
+    CXSiteExporter,
+)
+
+
+def read_chart(output, render_to: str) -> dict:
+    path = output.joinpath(SITE_DATA_DIR, f"{render_to}.json.gz")
+    return json.loads(gzip.decompress(path.read_bytes()))
+
+
+def test_export_writes_site(tmp_path, chart):
+    charts = [
+        chart(
+            f"chart{index}",
+            index,
+            after_render=[["setDimensions", [613, 613, True]]],
+        )
+        for index in range(20)
+    ]
+
+    result = CXSiteExporter(charts).render(output_dir=tmp_path, columns=3)
+
+    assert result == {
+        "written": [f"chart{index}" for index in range(20)],
+        "skipped": [],
+        "removed": [],
+    }
+
+    index = tmp_path.joinpath(SITE_INDEX).read_text()
+    assert index.count(CanvasXpress.js_library_url()) == 1
+    assert index.count("<canvas") == 20
+    assert f'src="{SITE_SCRIPT}"' in index
+    assert f'data-cx-src="{SITE_DATA_DIR}/chart7.json.gz"' in index
+    assert "repeat(3, 1fr)" in index
+    assert "new CanvasXpress" not in index
+    assert tmp_path.joinpath(SITE_SCRIPT).is_file()
+
+    declaration = read_chart(tmp_path, "chart7")
+    assert declaration["chart"]["renderTo"] == "chart7"
+    assert declaration["chart"]["data"]["y"]["data"] == [[7]]
+    assert declaration["chart"]["config"]["graphType"] == "Bar"
+    assert declaration["afterRender"] == [["setDimensions", [613, 613, True]]]
+
+    manifest = json.loads(tmp_path.joinpath(SITE_MANIFEST).read_text())
+    assert sorted(manifest.keys()) == sorted(f"chart{index}" for index in range(20))
+
+
+def test_export_is_incremental(tmp_path, chart):
+    CXSiteExporter([chart("a"), chart("b"), chart("c")]).render(output_dir=tmp_path)
+    unchanged = tmp_path.joinpath(SITE_DATA_DIR, "a.json.gz").stat().st_mtime_ns
+
+    result = CXSiteExporter([chart("a"), chart("b", 20)]).render(
+        output_dir=tmp_path, max_workers=2
+    )
+
+    assert result == {"written": ["b"], "skipped": ["a"], "removed": ["c"]}
+    assert tmp_path.joinpath(SITE_DATA_DIR, "a.json.gz").stat().st_mtime_ns == (
+        unchanged
+    )
+    assert read_chart(tmp_path, "b")["chart"]["data"]["y"]["data"] == [[20]]
+    assert not tmp_path.joinpath(SITE_DATA_DIR, "c.json.gz").exists()
+
+    result = CXSiteExporter([chart("a")]).render(output_dir=tmp_path, incremental=False)
+    assert result["written"] == ["a"]
+
+
+def test_export_validation(tmp_path, chart):
+    with pytest.raises(ValueError):
+        CXSiteExporter(chart("a")).render()
+
+    with pytest.raises(ValueError):
+        CXSiteExporter([chart("a"), chart("a")]).render(output_dir=tmp_path)
+
+    with pytest.raises(ValueError):
+        CXSiteExporter(chart(None)).render(output_dir=tmp_path)
+
+    with pytest.raises(ValueError):
+        CXSiteExporter(chart("café")).render(output_dir=tmp_path)
+
+
+def test_export_escapes_and_ignores_unsafe_manifest_entries(tmp_path, chart):
+    outside = tmp_path.joinpath("outside.json.gz")
+    outside.write_bytes(b"")
+
+    output = tmp_path.joinpath("site")
+    output.mkdir()
+    output.joinpath(SITE_MANIFEST).write_text(json.dumps({"../../outside": "x"}))
+
+    licensed = chart("a")
+    licensed.license_url = "https://example.com/'\"><b>/CanvasXpressLicense.js"
+    result = CXSiteExporter(licensed).render(output_dir=output)
+
+    assert result["removed"] == []
+    assert outside.is_file()
+
+    index = output.joinpath(SITE_INDEX).read_text()
+    assert "<b>" not in index
+    assert "&#x27;&quot;&gt;&lt;b&gt;" in index
@@ -1,3 +1,5 @@
+from io import StringIO
+
 import pytest
 
 from canvasxpress.canvas import CanvasXpress, _DEFAULT_JS_URL, _DEFAULT_CSS_URL
@@ -1361,3 +1363,154 @@ def test_from_json():
     assert candidate.other_init_params == alt_candidate.other_init_params
 
     assert repr(candidate) == repr(alt_candidate)
+
+
+def test_CanvasXpress_iter_html_parts():
+    subject: CanvasXpress = CanvasXpress(
+        render_to="streamed",
+        data={
+            "y": {
+                "vars": ["Gene1", "Gene2"],
+                "smps": ["Smp1", "Smp2", "Smp3"],
+                "data": [[10, 35, 88], [1, 2, 3]],
+            },
+            "m": {"marker": "@cx_functions@ js_events"},
+        },
+        config=CXConfigs(CXString("graphType", "Bar")),
+        events=CXEvents(CXEvent("click", "alert(1);")),
+        after_render=[["setDimensions", [613, 613, True]]],
+    )
+    subject.license_url = "CanvasXpressLicense.js"
+
+    expected = subject.render_to_html_parts()
+    for chunk_size in [1, 16, 65536]:
+        streamed = dict()
+        for key, text in subject.iter_html_parts(chunk_size=chunk_size):
+            streamed[key] = streamed.get(key, "") + text
+
+        assert streamed == expected
+
+    assert [key for key, text in subject.iter_html_parts()][:2] == [
+        "cx_license",
+        "cx_canvas",
+    ]
+
+
+def test_CanvasXpress_write_html_parts():
+    subject: CanvasXpress = CanvasXpress(
+        render_to="streamed",
+        data={"y": {"vars": ["Gene1"], "smps": ["Smp1"], "data": [[10]]}},
+    )
+
+    output = StringIO()
+    subject.write_html_parts(output)
+
+    html_parts = subject.render_to_html_parts()
+    assert output.getvalue().startswith(html_parts["cx_canvas"])
+    assert html_parts["cx_js"] in output.getvalue()
+    assert output.getvalue().strip().endswith("</script>")
+
+
+def test_CanvasXpress_render_shared_dict_data():
+    sample = {"y": {"vars": ["V1"], "smps": ["S1"], "data": [[1]]}}
+
+    chart = CanvasXpress(data=CXDictData(sample, copy=False))
+    html_parts = chart.render_to_html_parts()
+
+    assert sample == {"y": {"vars": ["V1"], "smps": ["S1"], "data": [[1]]}}
+    assert '"x": null' in html_parts["cx_js"]
+
+
+def test_CanvasXpress_dict_data_is_not_copied(monkeypatch):
+    from canvasxpress.data import keypair
+
+    sample = {"y": {"vars": ["V1"], "smps": ["S1"], "data": [[1]]}}
+    copied = []
+
+    def counting(value):
+        copied.append(value)
+        return value
+
+    monkeypatch.setattr(keypair, "deepcopy", counting)
+
+    chart = CanvasXpress(data=sample)
+    chart.render_to_html_parts()
+    chart.render_to_html_parts()
+    assert not chart.data.copy
+    assert copied == []
+
+    # Changes made via the chart remain private to it
+    monkeypatch.undo()
+    chart.data.data["y"]["data"] = [[2]]
+    assert sample["y"]["data"] == [[1]]
+
+
+def unpack_html_matrix(cx_js: str) -> list:
+    import base64
+    import json
+    import zlib
+    from array import array
+
+    declaration = cx_js.split("window.cxUnpackData(", 1)[1].rsplit(").then(", 1)[0]
+    packed = json.loads(declaration)["data"]["y"]["data"]
+
+    payload = base64.b64decode(packed["data"])
+    if packed["encoding"] == "deflate":
+        payload = zlib.decompress(payload)
+
+    values = array("f" if packed["cxPacked"] == "float32" else "d", payload)
+    return [
+        list(values[row * packed["cols"] : (row + 1) * packed["cols"]])
+        for row in range(packed["rows"])
+    ]
+
+
+def test_CanvasXpress_data_transport():
+    from canvasxpress.data.transport import (
+        TRANSPORT_FLOAT32,
+        TRANSPORT_FLOAT64,
+        TRANSPORT_JSON,
+    )
+
+    matrix = [[1, 2.5, -3.25], [0.1, 1e10, 7]]
+    chart = CanvasXpress(
+        render_to="packed",
+        data={
+            "y": {"vars": ["V1", "V2"], "smps": ["S1", "S2", "S3"], "data": matrix}
+        },
+    )
+    json_js = chart.render_to_html_parts()["cx_js"]
+    assert "cxUnpackData" not in json_js
+
+    chart.data_transport = TRANSPORT_FLOAT64
+    packed_js = chart.render_to_html_parts()["cx_js"]
+    assert unpack_html_matrix(packed_js) == matrix
+    streamed = "".join(text for _, text in chart.iter_html_parts(chunk_size=16))
+    assert streamed.endswith(packed_js)
+
+    chart.data_transport = TRANSPORT_FLOAT32
+    chart.compress_data = True
+    rows = unpack_html_matrix(chart.render_to_html_parts()["cx_js"])
+    for row, expected in zip(rows, matrix):
+        assert row == pytest.approx(expected, rel=1e-6)
+
+    # Reproducible JSON is unaffected
+    assert chart.data.render_to_dict()["y"]["data"] == matrix
+
+    chart.data_transport = None
+    assert chart.data_transport == TRANSPORT_JSON
+
+    with pytest.raises(ValueError):
+        chart.data_transport = "float16"
+
+
+def test_CanvasXpress_data_transport_fallback():
+    from canvasxpress.data.transport import TRANSPORT_FLOAT64
+
+    chart = CanvasXpress(
+        render_to="unpacked",
+        data={"y": {"smps": ["S1", "S2"], "data": [[1, None], [2, 3]]}},
+    )
+    chart.data_transport = TRANSPORT_FLOAT64
+
+    assert "cxUnpackData" not in chart.render_to_html_parts()["cx_js"]
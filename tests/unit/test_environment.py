@@ -0,0 +1,76 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import canvasxpress.render.environment as environment
+from canvasxpress.render.environment import (
+    CANVASXPRESS_TARGET_CONTEXT,
+    CONTEXT_BROWSER,
+    CONTEXT_STREAMLIT,
+    CONTEXT_UNKNOWN,
+    detect_target_context,
+    get_target_context,
+)
+
+
+def test_explicit_context_skips_probing(monkeypatch):
+    def fail():
+        raise AssertionError("The runtime should not be probed.")
+
+    monkeypatch.setattr(environment, "detect_target_context", fail)
+
+    monkeypatch.setenv(CANVASXPRESS_TARGET_CONTEXT, CONTEXT_BROWSER)
+    assert get_target_context() == CONTEXT_BROWSER
+
+    monkeypatch.setenv(CANVASXPRESS_TARGET_CONTEXT, "unsupported")
+    assert get_target_context() == CONTEXT_UNKNOWN
+
+
+def test_detected_context_is_memoized(monkeypatch):
+    probes = []
+
+    def probe(result):
+        def is_available():
+            probes.append(result)
+            return result
+
+        return is_available
+
+    monkeypatch.delenv(CANVASXPRESS_TARGET_CONTEXT, raising=False)
+    for name in [
+        "is_ipython_available",
+        "is_dash_available",
+        "is_rstudio_active",
+        "is_shiny_available",
+    ]:
+        monkeypatch.setattr(environment, name, probe(False))
+    monkeypatch.setattr(environment, "is_streamlit_available", probe(True))
+
+    detect_target_context.cache_clear()
+    try:
+        assert get_target_context() == CONTEXT_STREAMLIT
+        assert get_target_context() == CONTEXT_STREAMLIT
+        assert len(probes) == 5
+
+    finally:
+        detect_target_context.cache_clear()
+
+
+def test_plot_import_has_no_side_effects():
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import json, sys, canvasxpress.plot; "
+            "print(json.dumps([m for m in ['IPython', 'dash', 'shiny', 'streamlit'] "
+            "if m in sys.modules]))",
+        ],
+        cwd=Path(__file__).parents[2],
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert json.loads(result.stdout) == []
@@ -0,0 +1,137 @@
+from typing import Callable
+
+import numpy
+import pandas
+import pytest
+
+from canvasxpress.canvas import CanvasXpress
+from canvasxpress.data.matrix import CXDataframeData
+from canvasxpress.js.function import CXEvent
+from canvasxpress.util.fingerprint import content_hash, fingerprint_values
+
+FINGERPRINTED = {
+    "render_to": "fingerprinted",
+    "data": {
+        "y": {
+            "vars": ["Gene1"],
+            "smps": ["Smp1", "Smp2"],
+            "data": [[10, 35]],
+        }
+    },
+    "config": {"graphType": "Bar", "title": "Title"},
+    "width": 500,
+    "height": 400,
+}
+
+
+@pytest.fixture
+def chart(chart) -> Callable[..., CanvasXpress]:
+    """
+    Creates the shared chart with the `FINGERPRINTED` arguments by default.
+    """
+
+    def create(**kwargs) -> CanvasXpress:
+        return chart(**{**FINGERPRINTED, **kwargs})
+
+    return create
+
+
+def test_fingerprint_values_is_canonical():
+    shared = "shared"
+    assert fingerprint_values({"a": 1, "b": [shared, shared]}) == fingerprint_values(
+        {"b": ["shared", "shar" + "ed"], "a": 1}
+    )
+
+    distinct = [
+        [1],
+        [1.0],
+        [True],
+        ["1"],
+        [None],
+        (1,),
+        {"1": 1},
+        {1: 1},
+        [[1]],
+        numpy.array([1]),
+        numpy.array([1.0]),
+    ]
+    fingerprints = {fingerprint_values(value) for value in distinct}
+    assert len(fingerprints) == len(distinct)
+
+    assert fingerprint_values(1, 2) != fingerprint_values(2, 1)
+    assert fingerprint_values({1, 2, 3}) == fingerprint_values({3, 2, 1})
+
+
+def test_fingerprint_values_hashes_buffers():
+    values = numpy.arange(12, dtype=float).reshape(3, 4)
+
+    assert fingerprint_values(values) == fingerprint_values(values.copy())
+    assert fingerprint_values(values.T) == fingerprint_values(values.T.copy())
+    assert fingerprint_values(values) != fingerprint_values(values.reshape(4, 3))
+
+    frame = pandas.DataFrame(values, columns=list("abcd"))
+    assert fingerprint_values(frame) == fingerprint_values(frame.copy())
+    assert fingerprint_values(frame) != fingerprint_values(
+        frame.rename(columns={"a": "z"})
+    )
+    assert fingerprint_values(frame) != fingerprint_values(frame.set_index("a"))
+
+    changed = frame.copy()
+    changed.iloc[2, 3] = -1
+    assert fingerprint_values(frame) != fingerprint_values(changed)
+
+    mixed = pandas.DataFrame({"name": ["x", "y"], "value": [1, 2]})
+    assert fingerprint_values(mixed) == fingerprint_values(mixed.copy())
+
+
+def test_content_hash_ignores_shared_objects():
+    text = "value"
+    assert content_hash([text, text]) == content_hash(["value", "valu" + "e"])
+
+
+def test_CanvasXpress_fingerprint(chart):
+    assert chart().fingerprint() == chart().fingerprint()
+    assert (
+        chart(config={"title": "Title", "graphType": "Bar"}).fingerprint()
+        == chart().fingerprint()
+    )
+
+    for change in [
+        {"render_to": "other"},
+        {"config": {"graphType": "Bar", "title": "Other"}},
+        {"width": 501},
+        {"height": 401},
+        {"after_render": [["setDimensions", [613, 613, True]]]},
+        {"events": [CXEvent("click", "t.showInfoSpan(e, 'x');")]},
+        {
+            "data": {
+                "y": {"vars": ["Gene1"], "smps": ["Smp1", "Smp2"], "data": [[10, 36]]}
+            }
+        },
+    ]:
+        assert chart(**change).fingerprint() != chart().fingerprint(), change
+
+    budgeted = chart()
+    budgeted.point_budget = 10
+    assert budgeted.fingerprint() != chart().fingerprint()
+
+    # Anonymous charts have a new ID per render but the same fingerprint
+    assert chart(render_to=None).fingerprint() == chart(render_to=None).fingerprint()
+
+
+def test_CanvasXpress_fingerprint_dataframe(chart):
+    frame = pandas.DataFrame(
+        [[1.0, 2.0], [3.0, 4.0]], index=["Gene1", "Gene2"], columns=["Smp1", "Smp2"]
+    )
+    first = chart(data=CXDataframeData(frame))
+    second = chart(data=CXDataframeData(frame.copy()))
+    assert first.fingerprint() == second.fingerprint()
+
+    second.sample_annotation = pandas.DataFrame(
+        {"Group": ["a", "b"]}, index=["Smp1", "Smp2"]
+    )
+    assert first.fingerprint() != second.fingerprint()
+
+    changed = frame.copy()
+    changed.iloc[0, 0] = 0.0
+    assert chart(data=CXDataframeData(changed)).fingerprint() != first.fingerprint()
@@ -0,0 +1,49 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+IMPORT_TIME_BUDGET_MICROSECONDS = 250_000
+"""
+The cumulative cold import time allowed for `canvasxpress.canvas`.  Importing
+`pandas` alone exceeds this on typical hardware.
+"""
+
+LAZY_MODULES = ["pandas", "numpy", "requests", "deepdiff", "deprecated"]
+
+PROJECT_PATH = Path(__file__).parents[2]
+
+
+def run_python(*args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *args],
+        cwd=PROJECT_PATH,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+
+
+def test_canvas_import_does_not_load_heavy_dependencies():
+    result = run_python(
+        "-c",
+        "import json, sys, canvasxpress.canvas; "
+        f"print(json.dumps([m for m in {LAZY_MODULES!r} if m in sys.modules]))",
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert json.loads(result.stdout) == []
+
+
+def test_canvas_import_time_budget():
+    result = run_python("-X", "importtime", "-c", "import canvasxpress.canvas")
+    assert result.returncode == 0, result.stderr
+
+    cumulative = None
+    for line in result.stderr.splitlines():
+        fields = [field.strip() for field in line.split("|")]
+        if len(fields) == 3 and fields[2] == "canvasxpress.canvas":
+            cumulative = int(fields[1])
+
+    assert cumulative is not None
+    assert cumulative < IMPORT_TIME_BUDGET_MICROSECONDS
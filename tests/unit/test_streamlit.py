@@ -37,3 +37,116 @@ def test_invalid_chart_argument():
 
 def test_none_chart_argument():
     assert plot(cx=None) is None
+
+
+def test_plot_live_sends_only_changes(monkeypatch, chart):
+    import json
+
+    import streamlit as st
+
+    from canvasxpress.render import streamlit as streamlit_module
+
+    calls = []
+    monkeypatch.setattr(
+        streamlit_module,
+        "_get_live_component",
+        lambda: lambda **kwargs: calls.append(kwargs),
+    )
+
+    prepared = []
+    get_live_chart_args = streamlit_module._get_live_chart_args
+
+    def counting(cx, *args):
+        prepared.append(cx)
+        return get_live_chart_args(cx, *args)
+
+    monkeypatch.setattr(streamlit_module, "_get_live_chart_args", counting)
+
+    def titled(title: str, value: int) -> CanvasXpress:
+        return chart("live", value, config={"graphType": "Bar", "title": title})
+
+    for key in ["live", "live__cx_sent"]:
+        if key in st.session_state:
+            del st.session_state[key]
+
+    streamlit_module.plot_live(titled("First", 10))
+    assert calls[-1]["key"] == "live"
+    assert json.loads(calls[-1]["data"])["y"]["data"] == [[10]]
+    assert json.loads(calls[-1]["chart"])["config"]["title"] == "First"
+
+    streamlit_module.plot_live(titled("First", 10))
+    assert calls[-1]["data"] is None and calls[-1]["chart"] is None
+    assert calls[-1]["fingerprint"] == calls[0]["fingerprint"]
+
+    # An unchanged chart is not rendered again
+    assert len(prepared) == 1
+
+    streamlit_module.plot_live(titled("Second", 10))
+    assert calls[-1]["data"] is None
+    assert json.loads(calls[-1]["chart"])["config"]["title"] == "Second"
+
+    streamlit_module.plot_live(titled("Second", 20))
+    assert json.loads(calls[-1]["data"])["y"]["data"] == [[20]]
+    assert calls[-1]["chart"] is None
+
+    # The component lost its state and asks for everything again, once
+    st.session_state["live"] = {"missing": True, "request": 1}
+    streamlit_module.plot_live(titled("Second", 20))
+    assert calls[-1]["data"] is not None and calls[-1]["chart"] is not None
+
+    streamlit_module.plot_live(titled("Second", 20))
+    assert calls[-1]["data"] is None and calls[-1]["chart"] is None
+
+    with pytest.raises(TypeError):
+        streamlit_module.plot_live("abc")
+
+    for key in ["live", "live__cx_sent"]:
+        del st.session_state[key]
+
+
+def test_plot_live_anonymous_chart(monkeypatch, chart):
+    import json
+
+    import streamlit as st
+
+    from canvasxpress.render import streamlit as streamlit_module
+
+    calls = []
+    monkeypatch.setattr(
+        streamlit_module,
+        "_get_live_component",
+        lambda: lambda **kwargs: calls.append(kwargs),
+    )
+
+    with pytest.raises(ValueError):
+        streamlit_module.plot_live(chart())
+
+    for key in ["anonymous", "anonymous__cx_sent"]:
+        if key in st.session_state:
+            del st.session_state[key]
+
+    streamlit_module.plot_live(chart(), key="anonymous")
+    render_to = json.loads(calls[-1]["chart"])["render_to"]
+    assert calls[-1]["key"] == "anonymous"
+
+    # The chart gets the same ID on every run, so it is not sent again
+    streamlit_module.plot_live(chart(), key="anonymous")
+    assert calls[-1]["data"] is None and calls[-1]["chart"] is None
+    assert calls[-1]["fingerprint"] == calls[0]["fingerprint"]
+
+    st.session_state["anonymous"] = {"missing": True, "request": 1}
+    streamlit_module.plot_live(chart(), key="anonymous")
+    assert json.loads(calls[-1]["chart"])["render_to"] == render_to
+
+    for key in ["anonymous", "anonymous__cx_sent"]:
+        del st.session_state[key]
+
+
+def test_live_component_is_declared():
+    from pathlib import Path
+
+    from canvasxpress.render.streamlit import _get_live_component
+
+    live_component = _get_live_component()
+    assert live_component is _get_live_component()
+    assert Path(live_component.path).joinpath("index.html").is_file()